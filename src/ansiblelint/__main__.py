@@ -29,6 +29,7 @@ import pathlib
 import shutil
 import site
 import sys
+import time
 import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -47,7 +48,7 @@ except Exception as _exc:  # pylint: disable=broad-exception-caught # noqa: BLE0
     logging.fatal(_exc)
     sys.exit(RC.INVALID_CONFIG)
 # pylint: disable=ungrouped-imports
-from ansiblelint import cli
+from ansiblelint import cli, daemon, rule_profile, timings
 from ansiblelint._mockings import _perform_mockings_cleanup
 from ansiblelint.app import get_app
 from ansiblelint.config import (
@@ -57,7 +58,10 @@ from ansiblelint.config import (
     log_entries,
     options,
 )
+from ansiblelint.file_utils import normpath
 from ansiblelint.loaders import IgnoreRule, IgnoreRuleQualifier, load_ignore_txt
+from ansiblelint.memory_cache import log_stats as log_cache_stats
+from ansiblelint.memory_cache import set_memory_budget
 from ansiblelint.output import (
     console,
     console_stderr,
@@ -192,6 +196,31 @@ def _do_list(rules: RulesCollection) -> int:
     return 1
 
 
+def _do_list_dependents(opts: Options) -> int:
+    """Print the files depending on the given ones, as recorded in the cache."""
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.dependency_graph import DependencyGraph
+
+    if not opts.cache_dir:  # pragma: no cover
+        _logger.error("Listing dependents requires a cache directory.")
+        return RC.INVALID_CONFIG
+    graph = DependencyGraph.load(opts.cache_dir)
+    for path in graph.dependents(*opts.dependents):
+        console.print(normpath(path))
+    return 0
+
+
+def _report_rule_profile(opts: Options) -> None:
+    """Print the time spent by the rules, also storing it next to the SARIF file."""
+    profile = rule_profile.active()
+    if not profile:
+        return
+    console_stderr.print(profile.render())
+    if opts.sarif_file:
+        sarif_file = Path(opts.sarif_file)
+        profile.write(sarif_file.with_name(f"{sarif_file.stem}.profile.json"))
+
+
 # noinspection PyShadowingNames
 def _do_transform(result: LintResult, opts: Options) -> None:
     """Create and run Transformer."""
@@ -298,23 +327,18 @@ def _rule_is_skipped(tag: str, rules: Iterable[IgnoreRule]) -> bool:
 
 
 # pylint: disable=too-many-locals,too-many-statements
-def main(argv: list[str] | None = None) -> int:
-    """Linter CLI entry point."""
+def _initialize(argv: list[str]) -> tuple[BaseFileLock | None, bool]:
+    """Initialize the options and logging, returning the lock and if we should exit."""
     must_exit = False
-    # alter PATH if needed (venv support)
-    path_inject(argv[0] if argv and argv[0] else "")
-
-    if argv is None:  # pragma: no cover
-        argv = sys.argv
-
-    warnings.simplefilter(
-        "ignore", ResourceWarning
-    )  # suppress "enable tracemalloc to get the object allocation traceback"
     with warnings.catch_warnings(record=True) as warns:
         # do not use "ignore" as we will miss to collect them
         warnings.simplefilter(action="default")
 
+        started = time.perf_counter()
         cache_dir_lock = initialize_options(argv[1:])
+        if options.timings:
+            timings.enable(started)
+            timings.add("initialize_options", started)
 
         reconfigure(colored=options.colored)
 
@@ -334,6 +358,8 @@ def main(argv: list[str] | None = None) -> int:
             support_banner()
 
         initialize_logger(options.verbosity)
+        if options.memory_cache_size is not None:
+            set_memory_budget(options.memory_cache_size * 1024 * 1024)
         for level, message in log_entries:
             _logger.log(level, message)
         _logger.debug("Options: %s", options)
@@ -342,9 +368,26 @@ def main(argv: list[str] | None = None) -> int:
     for warn in warns:  # pragma: no cover
         _logger.warning(str(warn.message))
     warnings.resetwarnings()
+    return cache_dir_lock, must_exit
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Linter CLI entry point."""
+    # alter PATH if needed (venv support)
+    path_inject(argv[0] if argv and argv[0] else "")
+
+    if argv is None:  # pragma: no cover
+        argv = sys.argv
+
+    warnings.simplefilter(
+        "ignore", ResourceWarning
+    )  # suppress "enable tracemalloc to get the object allocation traceback"
+    cache_dir_lock, must_exit = _initialize(argv)
 
     if must_exit:
         sys.exit(0)
+    if options.dependents:
+        return _do_list_dependents(options)
     # checks if we have `ANSIBLE_LINT_SKIP_SCHEMA_UPDATE` set to bypass schema
     # update. Also skip if in offline mode.
     # env var set to skip schema refresh
@@ -365,7 +408,8 @@ def main(argv: list[str] | None = None) -> int:
         # pylint: disable=import-outside-toplevel
         from ansiblelint.schemas.__main__ import refresh_schemas
 
-        refresh_schemas()
+        with timings.phase("refresh_schemas"):
+            refresh_schemas()
 
     # pylint: disable=import-outside-toplevel
     from ansiblelint.rules import RulesCollection
@@ -376,22 +420,29 @@ def main(argv: list[str] | None = None) -> int:
         profiles_as_md().display()
         return 0
 
+    daemon.discard_stale_state(options)
     app = get_app(
         offline=None,
         cached=True,
     )  # to be sure we use the offline value from settings
-    rules = RulesCollection(
-        app=app,
-        rulesdirs=options.rulesdirs,
-        profile_name=options.profile,
-        options=options,
-    )
+    with timings.phase("load_rules"):
+        rules = daemon.warm_rules(options) or RulesCollection(
+            app=app,
+            rulesdirs=options.rulesdirs,
+            profile_name=options.profile,
+            options=options,
+        )
+
+    if options.daemon:  # pragma: no cover
+        return daemon.serve(app, rules, argv, cache_dir_lock)
 
     if options.list_rules or options.list_tags:
         return _do_list(rules)
 
     if isinstance(options.tags, str):
         options.tags = options.tags.split(",")  # pragma: no cover
+    if options.profile_rules:
+        rule_profile.enable()
     result = get_matches(rules, options)
 
     mark_as_success = True
@@ -427,11 +478,19 @@ def main(argv: list[str] | None = None) -> int:
     if options.write_list:
         if app.yamllint_config.incompatible:  # pragma: no cover
             sys.exit(RC.INVALID_CONFIG)
-        fix(runtime_options=options, result=result, rules=rules)
-
-    app.render_matches(result.matches)
-
-    _perform_mockings_cleanup(app.options)
+        with timings.phase("transform") as phase:
+            fix(runtime_options=options, result=result, rules=rules)
+            phase.matches = len(result.matches)
+
+    with timings.phase("render") as phase:
+        app.render_matches(result.matches)
+        phase.matches = len(result.matches)
+    _report_rule_profile(options)
+    log_cache_stats()
+
+    # mockings are shared with the daemon and its other children
+    if not daemon.is_daemon_child():
+        _perform_mockings_cleanup(app.options)
     if cache_dir_lock:
         cache_dir_lock.release()
         pathlib.Path(cache_dir_lock.lock_file).unlink(missing_ok=True)
@@ -440,6 +499,8 @@ def main(argv: list[str] | None = None) -> int:
             "The following filters were mocked during the run: %s",
             ",".join(options.mock_filters),
         )
+    if options.timings:
+        timings.write(Path(options.timings))
 
     return app.report_outcome(result, mark_as_success=mark_as_success)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import inspect
 import logging
 from pathlib import Path
@@ -9,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 
 from packaging.version import InvalidVersion, Version
 
+from ansiblelint import rule_profile
 from ansiblelint.constants import RULE_DOC_URL
 
 if TYPE_CHECKING:
@@ -48,6 +50,9 @@ class BaseRule:
     link: str = ""
     has_dynamic_tags: bool = False
     needs_raw_task: bool = False
+    # Modules of the tasks given to matchtask, without the ansible.builtin
+    # prefix, all tasks are given when empty
+    task_modules: frozenset[str] = frozenset()
     # Used to mark rules that we will never unload (internal ones)
     unloadable: bool = False
     # We use _order to sort rules and to ensure that some run before others,
@@ -99,10 +104,16 @@ class BaseRule:
     def getmatches(self, file: Lintable) -> list[MatchError]:
         """Return all matches while ignoring exceptions."""
         matches = []
+        profile = rule_profile.active()
         if not file.path.is_dir():
             for method in [self.matchlines, self.matchtasks, self.matchyaml]:
                 try:
-                    matches.extend(method(file))
+                    with (
+                        profile.measure(self.id, method.__name__, file)
+                        if profile
+                        else contextlib.nullcontext()
+                    ):
+                        matches.extend(method(file))
                 except Exception as exc:  # pylint: disable=broad-except
                     _logger.warning(
                         "Ignored exception from %s.%s while processing %s: %s",
@@ -112,6 +123,9 @@ class BaseRule:
                         exc,
                     )
                     _logger.debug("Ignored exception details", exc_info=True)
+        elif profile:
+            with profile.measure(self.id, "matchdir", file):
+                matches.extend(self.matchdir(file))
         else:
             matches.extend(self.matchdir(file))
         return matches
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, Any
 
 from ansible_compat.runtime import Runtime
 
-from ansiblelint import formatters
+from ansiblelint import formatters, timings
 from ansiblelint._mockings import _perform_mockings
 from ansiblelint.config import PROFILES, Options, get_version_warning
 from ansiblelint.config import options as default_options
@@ -440,7 +440,8 @@ def get_app(*, offline: bool | None = None, cached: bool = False) -> App:
     else:
         options = default_options
 
-    app = App(options=options)
+    with timings.phase("create_app"):
+        app = App(options=options)
     if cached:
         _CACHED_APP = app
     # Make linter use the cache dir from compat
@@ -460,13 +461,14 @@ def get_app(*, offline: bool | None = None, cached: bool = False) -> App:
     _add_collections_path_if_needed(app.options, app.runtime.config.collections_paths)
     _add_module_path_if_needed(app.options, app.runtime.config.default_module_path)
 
-    app.runtime.prepare_environment(
-        install_local=(not offline),
-        offline=offline,
-        role_name_check=role_name_check,
-    )
+    with timings.phase("prepare_environment"):
+        app.runtime.prepare_environment(
+            install_local=(not offline),
+            offline=offline,
+            role_name_check=role_name_check,
+        )
 
-    # Enable plugin loader now that collections are installed
-    app.runtime.enable_plugin_loader()
+        # Enable plugin loader now that collections are installed
+        app.runtime.enable_plugin_loader()
 
     return app
@@ -486,6 +486,68 @@ def get_cli_parser() -> argparse.ArgumentParser:
         default=None,
         help="Specify yamllint config file to use. By default it will look for '.yamllint', '.yamllint.yaml', '.yamllint.yml', '~/.config/yamllint/config' or environment variables XDG_CONFIG_HOME and YAMLLINT_CONFIG_FILE.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=None,
+        help="Number of processes used for running the rules on the files. "
+        "By default it uses one process per available CPU.",
+    )
+    parser.add_argument(
+        "--daemon",
+        dest="daemon",
+        action="store_true",
+        default=False,
+        help="Load the rules and the runtime once, then serve the lint requests "
+        "made with ansible-lint-client from the current directory until interrupted.",
+    )
+    parser.add_argument(
+        "--changed-since",
+        dest="changed_since",
+        metavar="REF",
+        default=None,
+        help="Lint only the files changed since the common ancestor of the "
+        "given git reference and HEAD, including uncommitted ones, and the "
+        "playbooks, tasks files and roles including or importing them.",
+    )
+    parser.add_argument(
+        "--dependents",
+        dest="dependents",
+        action="extend",
+        nargs="+",
+        type=str,
+        default=[],
+        help="List the files including or importing the given files, even "
+        "indirectly, as recorded by previous runs, then exit.",
+    )
+    parser.add_argument(
+        "--memory-cache-size",
+        dest="memory_cache_size",
+        type=int,
+        default=None,
+        help="Memory budget, in MiB, shared by the in-memory caches of parsed "
+        "files. Defaults to 512.",
+    )
+    parser.add_argument(
+        "--profile-rules",
+        dest="profile_rules",
+        action="store_true",
+        default=False,
+        help="Report the time spent by each rule, per match method and kind of "
+        "file, and the slowest files. With --sarif-file, the report is also "
+        "written as JSON next to the SARIF file.",
+    )
+    parser.add_argument(
+        "--timings",
+        dest="timings",
+        metavar="FILE",
+        type=Path,
+        default=None,
+        help="Write the duration, peak memory usage and file and match counts "
+        "of each phase of the run to the given JSON file.",
+    )
     parser.add_argument(
         "--offline",
         dest="offline",
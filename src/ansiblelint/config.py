@@ -132,21 +132,28 @@ class Options:  # pylint: disable=too-many-instance-attributes
 
     # Public attributes
     cache_dir: Path | None = None
+    changed_since: str | None = None  # git reference to compare with
     colored: bool = True
     configured: bool = False
     cwd: Path = Path()
+    daemon: bool = False
+    dependents: list[str] = field(default_factory=list)  # files to list dependents of
     display_relative_path: bool = True
     exclude_paths: list[str] = field(default_factory=list)
     format: str = "brief"
+    jobs: int | None = None  # when not set, it uses one process per cpu
     lintables: list[str] = field(default_factory=list)
     list_rules: bool = False
     list_tags: bool = False
+    memory_cache_size: int | None = None  # in MiB, when not set it uses 512
+    profile_rules: bool = False
     write_list: list[str] = field(default_factory=list)
     write_exclude_list: list[str] = field(default_factory=list)
     quiet: bool = False
     rulesdirs: list[Path] = field(default_factory=list)
     skip_list: list[str] = field(default_factory=list)
     tags: list[str] = field(default_factory=list)
+    timings: Path | None = None  # file receiving the duration of each phase
     verbosity: int = 0
     warn_list: list[str] = field(default_factory=list)
     kinds = DEFAULT_KINDS
@@ -0,0 +1,516 @@
+"""Long-running lint daemon and its thin client.
+
+Most of the time spent by a short ansible-lint run goes into importing
+ansible-core, preparing the runtime environment, loading the rules and the
+schemas. ``ansible-lint --daemon`` does this only once and then listens on a
+Unix socket. For each request, it forks a child that runs the regular command
+line with the arguments received, reusing the already initialized state, and
+streams its output and return code back.
+
+The ``ansible-lint-client`` command submits its arguments to the daemon
+started from the same directory. It only imports the standard library and
+falls back to running ansible-lint itself when no usable daemon is found.
+
+The socket is kept in a directory only accessible by the current user, which
+both sides verify before using it. Requests run with the environment of the
+daemon: the client only sends the variables affecting the output, and a digest
+of the ``ANSIBLE_*`` ones, which must match those of the daemon.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import selectors
+import signal
+import socket
+import stat
+import sys
+import tempfile
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import io
+
+    from filelock import BaseFileLock
+
+    from ansiblelint.app import App
+    from ansiblelint.config import Options
+    from ansiblelint.rules import RulesCollection
+
+_logger = logging.getLogger(__name__)
+
+SOCKET_ENV = "ANSIBLE_LINT_DAEMON_SOCKET"
+
+# Variables of the client environment used by the requests, as they only
+# affect how the output is rendered.
+FORWARDED_ENV = frozenset(
+    (
+        "CLICOLOR",
+        "COLUMNS",
+        "FORCE_COLOR",
+        "NO_COLOR",
+        "PY_COLORS",
+        "TERM",
+    ),
+)
+
+# Files that affect the state kept by the daemon, relative to the project
+# directory. When any of them changes, the daemon restarts itself.
+WATCHED_FILES = (
+    ".ansible-lint",
+    ".ansible-lint.yml",
+    ".ansible-lint.yaml",
+    ".config/ansible-lint.yml",
+    ".config/ansible-lint.yaml",
+    ".ansible-lint-ignore",
+    ".config/ansible-lint-ignore.txt",
+    ".yamllint",
+    ".yamllint.yml",
+    ".yamllint.yaml",
+    "ansible.cfg",
+    "galaxy.yml",
+    "requirements.yml",
+    "collections/requirements.yml",
+    "roles/requirements.yml",
+)
+
+
+@dataclass
+class WarmState:
+    """State initialized by the daemon and reused by its children."""
+
+    app_key: tuple[Any, ...]
+    rules_key: tuple[Any, ...]
+    rules: RulesCollection
+
+
+_warm_state: WarmState | None = None
+_in_daemon_child = False
+
+
+def socket_path(cwd: Path | None = None) -> Path:
+    """Return the socket used by the daemon started from given directory."""
+    if SOCKET_ENV in os.environ:
+        return Path(os.environ[SOCKET_ENV])
+    cwd = (cwd or Path.cwd()).resolve()
+    digest = hashlib.sha256(str(cwd).encode()).hexdigest()[:16]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "ansible-lint" / f"{digest}.sock"
+    # unix socket paths are limited to about 100 characters
+    socket_dir = Path(tempfile.gettempdir()) / f"ansible-lint-{os.getuid()}"
+    return socket_dir / f"{digest}.sock"
+
+
+def check_private_dir(path: Path) -> None:
+    """Raise PermissionError unless the directory is only usable by current user."""
+    info = path.lstat()
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) != 0o700
+    ):
+        msg = f"{path} is not a directory owned by the current user with mode 0700"
+        raise PermissionError(msg)
+
+
+def _make_private_dir(path: Path) -> None:
+    """Create the directory of the socket if needed, then check its permissions."""
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    else:
+        # the mode given to mkdir is restricted by the umask
+        path.chmod(0o700)
+    check_private_dir(path)
+
+
+def _app_key(options: Options) -> tuple[Any, ...]:
+    """Return the options that were used for creating the application."""
+    return (
+        options.offline,
+        options.project_dir,
+        str(options.cache_dir),
+        tuple(options.mock_modules),
+        tuple(options.mock_roles),
+        tuple(str(x) for x in options.rulesdirs),
+    )
+
+
+def _rules_key(options: Options) -> tuple[Any, ...]:
+    """Return the options that were used for loading the rules."""
+    return (
+        tuple(str(x) for x in options.rulesdirs),
+        options.profile,
+        tuple(options.enable_list),
+        options.list_rules,
+        options.list_tags,
+    )
+
+
+def _watched_state(project_dir: Path, config_file: str | None) -> dict[str, Any]:
+    """Return the modification times of the files watched by the daemon."""
+    paths = [project_dir / name for name in WATCHED_FILES]
+    if config_file:
+        paths.append(Path(config_file))
+    state: dict[str, Any] = {}
+    for path in paths:
+        try:
+            info = path.stat()
+        except OSError:
+            state[str(path)] = None
+        else:
+            state[str(path)] = (info.st_mtime_ns, info.st_size)
+    return state
+
+
+def _relevant_env(env: dict[str, str]) -> dict[str, str]:
+    """Return the environment variables that can affect the daemon state."""
+    return {k: v for k, v in env.items() if k.startswith("ANSIBLE_")}
+
+
+def _env_digest(env: dict[str, str]) -> str:
+    """Return a digest of the environment variables affecting the daemon state."""
+    data = json.dumps(_relevant_env(env), sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _forwarded_env(env: dict[str, str]) -> dict[str, str]:
+    """Return the variables of the client environment used by its requests."""
+    return {k: v for k, v in env.items() if k in FORWARDED_ENV}
+
+
+# ansible-lint sets some ANSIBLE_* variables while preparing its runtime, so the
+# ones of the daemon are recorded before.
+_startup_env_digest = _env_digest(dict(os.environ))
+
+
+def is_daemon_child() -> bool:
+    """Return true when running a request received by the daemon."""
+    return _in_daemon_child
+
+
+def discard_stale_state(options: Options) -> None:
+    """Forget the preloaded application if it does not match the options."""
+    global _warm_state  # pylint: disable=global-statement
+    if _warm_state and _warm_state.app_key != _app_key(options):
+        # pylint: disable=import-outside-toplevel
+        import ansiblelint.app
+
+        ansiblelint.app._CACHED_APP = None  # noqa: SLF001
+        _warm_state = None
+
+
+def warm_rules(options: Options) -> RulesCollection | None:
+    """Return the preloaded rules collection, if it matches the options."""
+    if _warm_state and _warm_state.rules_key == _rules_key(options):
+        return _warm_state.rules
+    return None
+
+
+def serve(
+    app: App,
+    rules: RulesCollection,
+    argv: list[str],
+    cache_dir_lock: BaseFileLock | None,
+) -> int:  # pragma: no cover
+    """Keep the initialized state and serve lint requests until interrupted."""
+    global _warm_state  # pylint: disable=global-statement
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.constants import RC
+    from ansiblelint.schemas.__main__ import JSON_SCHEMAS, _validator_cache
+
+    options = app.options
+    for kind in JSON_SCHEMAS:
+        _ = _validator_cache[kind]
+    _warm_state = WarmState(
+        app_key=_app_key(options),
+        rules_key=_rules_key(options),
+        rules=rules,
+    )
+    # children take the lock on their own
+    if cache_dir_lock:
+        cache_dir_lock.release()
+        Path(cache_dir_lock.lock_file).unlink(missing_ok=True)
+
+    path = socket_path()
+    try:
+        _make_private_dir(path.parent)
+    except OSError as exc:
+        _logger.error("Unable to use %s for the daemon socket: %s", path.parent, exc)  # noqa: TRY400
+        return RC.INVALID_CONFIG
+    path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen()
+    # children are reaped automatically
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    _logger.warning("Daemon listening on %s", path)
+    served = _ServedState(
+        cwd=str(Path.cwd()),
+        project_dir=Path(options.project_dir),
+        config_file=options.config_file,
+        env_digest=_startup_env_digest,
+    )
+    try:
+        while _accept(server, served):
+            pass
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+    _logger.warning("Restarting daemon as its configuration changed")
+    os.execv(sys.executable, [sys.executable, "-m", "ansiblelint", *argv[1:]])  # noqa: S606
+    return 0
+
+
+@dataclass
+class _ServedState:
+    """What the requests must share with the daemon to be served by it."""
+
+    cwd: str
+    project_dir: Path
+    config_file: str | None
+    env_digest: str
+    watched: dict[str, Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Record the current state of the watched files."""
+        self.watched = _watched_state(self.project_dir, self.config_file)
+
+    def fallback_reason(self, request: dict[str, Any]) -> str:
+        """Return why the request cannot be served, or an empty string."""
+        if _watched_state(self.project_dir, self.config_file) != self.watched:
+            return "configuration or requirements changed"
+        if request.get("cwd") != self.cwd:
+            return f"daemon serves {self.cwd}"
+        if request.get("env_digest") != self.env_digest:
+            return "environment changed"
+        return ""
+
+
+def _accept(server: socket.socket, served: _ServedState) -> bool:
+    """Serve the next request, returning false when the daemon should restart."""
+    conn, _ = server.accept()
+    # a misbehaving client must not stop the daemon
+    with contextlib.suppress(OSError), conn, conn.makefile("rwb") as stream:
+        try:
+            request = _read_request(stream)
+        except (TypeError, ValueError) as exc:
+            _logger.warning("Ignoring invalid request: %s", exc)
+            _send(stream, {"fallback": f"invalid request: {exc}"})
+            return True
+        fallback = served.fallback_reason(request)
+        if fallback:
+            _send(stream, {"fallback": fallback})
+            return fallback != "configuration or requirements changed"
+        if os.fork() == 0:
+            server.close()
+            _handle(stream, request)
+    return True
+
+
+def _read_request(stream: io.BufferedIOBase) -> dict[str, Any]:
+    """Return the request sent by the client, raising an error if invalid."""
+    request = json.loads(stream.readline() or b"{}")
+    if (
+        not isinstance(request, dict)
+        or not isinstance(request.get("argv"), list)
+        or not isinstance(request.get("env", {}), dict)
+    ):
+        msg = "expected an object with argv list and env mapping"
+        raise TypeError(msg)
+    return request
+
+
+def _send(stream: io.BufferedIOBase, message: dict[str, Any]) -> None:
+    """Send a single message to the client."""
+    stream.write(json.dumps(message).encode() + b"\n")
+    stream.flush()
+
+
+def _handle(
+    stream: io.BufferedIOBase, request: dict[str, Any]
+) -> None:  # pragma: no cover
+    """Run the request inside a grandchild and relay its output, never returning."""
+    returncode = 1
+    try:
+        pid, fds = _spawn(request)
+        _relay(stream, fds)
+        _, status = os.waitpid(pid, 0)
+        _send(stream, {"returncode": os.waitstatus_to_exitcode(status)})
+        returncode = 0
+    except BaseException:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+        traceback.print_exc()
+    finally:
+        os._exit(returncode)  # pylint: disable=protected-access
+
+
+def _spawn(request: dict[str, Any]) -> tuple[int, dict[int, str]]:  # pragma: no cover
+    """Fork the grandchild running the request and return its output pipes."""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    stdout_r, stdout_w = os.pipe()
+    stderr_r, stderr_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(stdout_r)
+        os.close(stderr_r)
+        _run_request(request, stdout_w, stderr_w)
+    os.close(stdout_w)
+    os.close(stderr_w)
+    return pid, {stdout_r: "stdout", stderr_r: "stderr"}
+
+
+def _relay(stream: io.BufferedIOBase, fds: dict[int, str]) -> None:
+    """Send what is read from the file descriptors until they are all closed."""
+    selector = selectors.DefaultSelector()
+    for fd, name in fds.items():
+        selector.register(fd, selectors.EVENT_READ, name)
+    while selector.get_map():
+        for key, _ in selector.select():
+            data = os.read(key.fd, 65536)
+            if not data:
+                selector.unregister(key.fd)
+                os.close(key.fd)
+                continue
+            _send(stream, {key.data: data.decode("utf-8", errors="replace")})
+
+
+def _prepare_request(request: dict[str, Any], stdout_fd: int, stderr_fd: int) -> None:
+    """Set up the standard streams and the environment of the grandchild."""
+    global _in_daemon_child  # pylint: disable=global-statement
+    with Path(os.devnull).open(encoding="utf-8") as devnull:
+        os.dup2(devnull.fileno(), 0)
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+    # only the presentation of the output comes from the client environment
+    for name in FORWARDED_ENV:
+        os.environ.pop(name, None)
+    os.environ.update(_forwarded_env(request.get("env", {})))
+    _in_daemon_child = True
+    # the command line adds its own log handler
+    logging.getLogger().handlers.clear()
+
+
+def _run_request(
+    request: dict[str, Any],
+    stdout_fd: int,
+    stderr_fd: int,
+) -> None:  # pragma: no cover
+    """Run the ansible-lint command line inside the grandchild, never returning."""
+    returncode = 1
+    try:
+        _prepare_request(request, stdout_fd, stderr_fd)
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint.__main__ import main
+
+        sys.argv = request["argv"]
+        returncode = main(sys.argv)
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            returncode = exc.code or 0
+        else:
+            sys.stderr.write(f"{exc.code}\n")
+    except BaseException:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+        traceback.print_exc()
+    finally:
+        with contextlib.suppress(BaseException):
+            sys.stdout.flush()
+            sys.stderr.flush()
+        os._exit(returncode)  # pylint: disable=protected-access
+
+
+def _connect() -> socket.socket | None:
+    """Return a connection to the daemon, if one can be safely used."""
+    path = socket_path()
+    try:
+        check_private_dir(path.parent)
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        _logger.warning("Ignoring daemon socket: %s", exc)
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(path))
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+def _receive(stream: io.BufferedIOBase) -> tuple[int | None, bool]:
+    """Relay the output of the daemon, returning its return code if any.
+
+    The second value tells whether the daemon started to process the request.
+    """
+    started = False
+    for line in stream:
+        message = json.loads(line)
+        if "fallback" in message:
+            _logger.info("Daemon cannot serve request: %s", message["fallback"])
+            return None, started
+        if "returncode" in message:
+            return int(message["returncode"]), started
+        started = True
+        if "stdout" in message:
+            sys.stdout.write(message["stdout"])
+            sys.stdout.flush()
+        if "stderr" in message:
+            sys.stderr.write(message["stderr"])
+            sys.stderr.flush()
+    return None, started
+
+
+def request(argv: list[str]) -> int | None:
+    """Submit the command line to the daemon and return its return code.
+
+    None is returned when no daemon can serve the request, so the caller
+    should run it by itself.
+    """
+    env = _forwarded_env(dict(os.environ))
+    # the output of the daemon is never a terminal
+    if sys.stdout.isatty() and "NO_COLOR" not in env:
+        env.setdefault("PY_COLORS", "1")
+    client = _connect()
+    if client is None:
+        return None
+    message = {
+        "argv": argv,
+        "cwd": str(Path.cwd()),
+        "env": env,
+        "env_digest": _env_digest(dict(os.environ)),
+    }
+    returncode, started = None, False
+    with client, client.makefile("rwb") as stream:
+        try:
+            _send(stream, message)
+            returncode, started = _receive(stream)
+        except OSError:
+            pass
+    if returncode is not None or not started:
+        return returncode
+    sys.stderr.write("ansible-lint daemon stopped while processing the request.\n")
+    return 1
+
+
+def client_main() -> None:
+    """Run ansible-lint through the daemon, or by itself if none is running."""
+    argv = ["ansible-lint", *sys.argv[1:]]
+    returncode = request(argv)
+    if returncode is None:
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint.__main__ import _run_cli_entrypoint
+
+        sys.argv = argv
+        _run_cli_entrypoint()
+    sys.exit(returncode)
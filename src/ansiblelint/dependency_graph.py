@@ -0,0 +1,195 @@
+"""Include and import graph of the linted files, persisted between runs.
+
+Each time the runner discovers the children of a playbook, tasks file or
+role, the edges found are recorded, together with the modification time, size
+and content hash of the parent. The graph is stored inside the cache
+directory and reused by the following runs: a parent whose content changed
+since it was recorded loses its edges until it is visited again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ansiblelint.file_utils import Lintable
+
+_logger = logging.getLogger(__name__)
+
+# Bump when the format of the stored graph changes.
+GRAPH_FORMAT = 1
+
+GRAPH_FILE = "dependencies.json"
+
+# Kinds of lintables that can include or import other files.
+PARENT_KINDS = ("playbook", "tasks", "role")
+
+
+@dataclass
+class FileNode:
+    """A parent file, as it was when its children were recorded."""
+
+    mtime_ns: int
+    size: int
+    sha256: str  # empty for directories, like roles
+    kind: str
+    children: list[str] = field(default_factory=list)
+
+
+def node_key(path: str | Path) -> str:
+    """Return the key under which a file is stored in the graph."""
+    return os.path.realpath(Path(path).expanduser())
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat_node(path: str, kind: str) -> FileNode | None:
+    """Return the current state of a file, or None if it cannot be read."""
+    try:
+        stat = Path(path).stat()
+        sha = "" if Path(path).is_dir() else _sha256(path)
+    except OSError:
+        return None
+    return FileNode(mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=sha, kind=kind)
+
+
+class DependencyGraph:
+    """Graph of the files including or importing other files."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize an empty graph, stored at given path when saved."""
+        self.path = path
+        self.nodes: dict[str, FileNode] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, cache_dir: Path) -> DependencyGraph:
+        """Load the graph stored in the cache directory, dropping stale nodes."""
+        graph = cls(cache_dir / GRAPH_FILE)
+        try:
+            with graph.path.open(encoding="utf-8") as f:  # type: ignore[union-attr]
+                data = json.load(f)
+            if data["format"] != GRAPH_FORMAT:
+                return graph
+            graph.nodes = {k: FileNode(**v) for k, v in data["nodes"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return graph
+        graph.refresh()
+        return graph
+
+    def refresh(self) -> None:
+        """Drop the nodes of the files modified since their children were recorded.
+
+        Files that were only touched keep their children, as their content
+        hash did not change.
+        """
+        for key, node in list(self.nodes.items()):
+            try:
+                stat = Path(key).stat()
+            except OSError:
+                del self.nodes[key]
+                self._dirty = True
+                continue
+            if (stat.st_mtime_ns, stat.st_size) == (node.mtime_ns, node.size):
+                continue
+            self._dirty = True
+            current = _stat_node(key, node.kind)
+            if current is None or current.sha256 != node.sha256 or not node.sha256:
+                _logger.debug("Dropping dependencies of modified file %s", key)
+                del self.nodes[key]
+                continue
+            node.mtime_ns = current.mtime_ns
+            node.size = current.size
+
+    def record(self, lintable: Lintable, children: Iterable[Lintable]) -> None:
+        """Record the children found inside a lintable."""
+        key = node_key(lintable.abspath)
+        kind = str(lintable.kind)
+        names = sorted({node_key(child.abspath) for child in children})
+        current = self.nodes.get(key)
+        if current and current.kind == kind and current.children == names:
+            # unchanged since recorded, as far as its stat tells, no need to hash
+            try:
+                stat = Path(key).stat()
+            except OSError:
+                return
+            if (stat.st_mtime_ns, stat.st_size) == (current.mtime_ns, current.size):
+                return
+        node = _stat_node(key, kind)
+        if node is None:
+            return
+        node.children = names
+        if current != node:
+            self.nodes[key] = node
+            self._dirty = True
+
+    def dependencies(self, path: str | Path) -> list[str]:
+        """Return the files directly included or imported by given file."""
+        node = self.nodes.get(node_key(path))
+        return list(node.children) if node else []
+
+    def dependents(self, *paths: str | Path) -> list[str]:
+        """Return the files including or importing given ones, even indirectly.
+
+        Passing a directory, like a role, returns the dependents of the files
+        found inside it.
+        """
+        reverse: dict[str, set[str]] = {}
+        for key, node in self.nodes.items():
+            for child in node.children:
+                reverse.setdefault(child, set()).add(key)
+        todo: list[str] = []
+        for path in paths:
+            key = node_key(path)
+            prefix = key.rstrip(os.sep) + os.sep
+            todo.extend(
+                child for child in reverse if child == key or child.startswith(prefix)
+            )
+        targets = set(todo)
+        found: set[str] = set()
+        while todo:
+            for parent in reverse.get(todo.pop(), ()):
+                if parent not in found:
+                    found.add(parent)
+                    todo.append(parent)
+        return sorted(found - targets)
+
+    def save(self) -> None:
+        """Store the graph, if it changed since it was loaded."""
+        if not self.path or not self._dirty:
+            return
+        data = {
+            "format": GRAPH_FORMAT,
+            "nodes": {k: asdict(v) for k, v in sorted(self.nodes.items())},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # written to a temporary file first, so we never read a partial graph
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        except OSError as exc:
+            _logger.debug("Unable to store dependencies in %s: %s", self.path, exc)
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            Path(tmp_name).replace(self.path)
+        except OSError as exc:
+            _logger.debug("Unable to store dependencies in %s: %s", self.path, exc)
+            Path(tmp_name).unlink(missing_ok=True)
+            return
+        self._dirty = False
@@ -0,0 +1,61 @@
+"""Parsed representations of the content of a lintable."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ansiblelint.file_utils import Lintable
+
+
+class ParsedDocument:
+    """Lazily parsed views of the YAML content of a lintable.
+
+    Each view is produced at most once from the content of the lintable and
+    then shared by every consumer, like rules, skip comment processing, schema
+    validation or children discovery. The document is discarded by the
+    lintable when its content changes.
+    """
+
+    def __init__(self, lintable: Lintable) -> None:
+        """Create a document for the current content of the lintable."""
+        self.lintable = lintable
+        self.content = lintable.content
+
+    @functools.cached_property
+    def lines(self) -> list[str]:
+        """Return the lines of the document, used to map line numbers to text."""
+        return self.content.splitlines()
+
+    @functools.cached_property
+    def tagged(self) -> Any:
+        """Return the Ansible tagged view, annotated with line numbers."""
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint.utils import parse_yaml_linenumbers
+
+        return parse_yaml_linenumbers(self.lintable)
+
+    @functools.cached_property
+    def comments(self) -> Any:
+        """Return the round-trip view, which keeps the comments of the document."""
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint.skip_utils import load_data
+
+        return load_data(self.content)
+
+    @functools.cached_property
+    def json(self) -> Any:
+        """Return the plain view, which only contains JSON compatible types."""
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint.loaders import json_compatible, yaml_load_safe
+
+        return json_compatible(yaml_load_safe(self.content))
+
+    @functools.cached_property
+    def decrypted(self) -> Any:
+        """Return the view loaded by Ansible, with vaulted values decrypted."""
+        # pylint: disable=import-outside-toplevel
+        from ansiblelint.utils import parse_yaml_from_file
+
+        return parse_yaml_from_file(str(self.lintable.path))
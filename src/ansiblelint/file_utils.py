@@ -5,15 +5,18 @@ from __future__ import annotations
 import copy
 import logging
 import os
+import re
+import subprocess
 import sys
 from collections import defaultdict
 from contextlib import contextmanager
+from functools import cache, lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING, Any, cast
 
 import pathspec
-import wcmatch.pathlib
+import wcmatch.glob
 from yaml.error import YAMLError
 
 from ansiblelint.config import ANSIBLE_OWNED_KINDS, BASE_KINDS, Options, options
@@ -22,7 +25,9 @@ from ansiblelint.constants import CONFIG_FILENAMES, FileType, States
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
 
+    from ansiblelint.document import ParsedDocument
     from ansiblelint.errors import MatchError
+    from ansiblelint.utils import Task
 
 
 _logger = logging.getLogger(__package__)
@@ -149,44 +154,146 @@ def expand_paths_vars(paths: list[str]) -> list[str]:
     return paths
 
 
-def kind_from_path(path: Path, *, base: bool = False) -> FileType:
-    """Determine the file kind based on its name.
+_KIND_GLOB_FLAGS = (
+    wcmatch.glob.GLOBSTAR
+    | wcmatch.glob.BRACE
+    | wcmatch.glob.DOTGLOB
+    | wcmatch.glob.FORCEUNIX
+)
 
-    When called with base=True, it will return the base file type instead
-    of the explicit one. That is expected to return 'yaml' for any yaml files.
+
+class KindMatcher:
+    """Ordered kind globs compiled into a single regular expression.
+
+    The first glob matching a path wins, like when trying them in order.
+    """
+
+    def __init__(self, kinds: Sequence[tuple[str, str]]) -> None:
+        """Compile the (kind, glob) pairs."""
+        self.kinds = [kind for kind, _ in kinds]
+        patterns = [
+            "|".join(wcmatch.glob.translate(glob, flags=_KIND_GLOB_FLAGS)[0]) or "(?!)"
+            for _, glob in kinds
+        ]
+        self._patterns = [re.compile(pattern) for pattern in patterns]
+        # alternatives are tried in order, so the first one matching wins
+        self._regex = re.compile(
+            "|".join(f"(?P<k{i}>{pattern})" for i, pattern in enumerate(patterns)),
+        )
+
+    def first(self, path: str, start: int = 0) -> int | None:
+        """Return the index of the first glob matching path, from start."""
+        if start == 0:
+            match = self._regex.match(path)
+            if not match:
+                return None
+            for name, value in match.groupdict().items():
+                if value is not None:
+                    return int(name[1:])
+        for i in range(start, len(self._patterns)):
+            if self._patterns[i].match(path):
+                return i
+        return None
+
+
+@cache
+def _kind_matcher(kinds: tuple[tuple[str, str], ...]) -> KindMatcher:
+    """Return the compiled matcher of given kinds."""
+    return KindMatcher(kinds)
+
+
+def _has_project_marker(directory: Path) -> bool:
+    """Return true if directory contains .git, .hg or a config file."""
+    return (
+        (directory / ".git").exists()
+        or (directory / ".hg").is_dir()
+        or any((directory / cfg_file).is_file() for cfg_file in CONFIG_FILENAMES)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _project_root_of_dir(directory: Path) -> Path:
+    """Return the closest ancestor of a resolved directory with a project marker.
+
+    This gives the same result as find_project_root for a single directory,
+    but parent directories are only examined once.
     """
+    if _has_project_marker(directory) or directory.parent == directory:
+        return directory
+    return _project_root_of_dir(directory.parent)
+
+
+def _kind_match_path(path: Path) -> str:
+    """Return the path used for matching the kind globs."""
     # We attempt to use a relative path to the project root for glob matching.
     # This prevents parent directory names (like 'tasks') from triggering
     # false positives in kind discovery. See #4763.
     try:
-        project_root, _ = find_project_root([str(path)])
         # .resolve() ensures we handle symlinks and double-dots correctly
-        rel_path = path.resolve().relative_to(project_root.resolve())
-        pathex = wcmatch.pathlib.PurePath(str(rel_path))
+        resolved = path.resolve()
+        directory = resolved if resolved.is_dir() else resolved.parent
+        return str(resolved.relative_to(_project_root_of_dir(directory)))
     except (ValueError, RuntimeError):
         # Fallback to absolute if the file is outside the project root or can't be found
-        pathex = wcmatch.pathlib.PurePath(str(path.absolute().resolve()))
+        return str(path.absolute().resolve())
+
+
+def kind_from_path(path: Path, *, base: bool = False) -> FileType:
+    """Determine the file kind based on its name.
+
+    When called with base=True, it will return the base file type instead
+    of the explicit one. That is expected to return 'yaml' for any yaml files.
+    """
+    return _kind_from_match_path(path, _kind_match_path(path), base=base)
+
+
+def kinds_from_paths(paths: Sequence[Path]) -> list[tuple[FileType, str]]:
+    """Determine the kind and base kind of several paths in a single pass.
+
+    The result is the same as calling kind_from_path on each path, but the
+    folders of regular files are resolved, and their project root looked up,
+    only once for all the files they contain.
+    """
+    folders: dict[Path, tuple[Path, Path]] = {}
+    result: list[tuple[FileType, str]] = []
+    for path in paths:
+        if path.is_symlink() or not path.is_file():
+            pathex = _kind_match_path(path)
+        else:
+            if path.parent not in folders:
+                resolved = path.parent.resolve()
+                folders[path.parent] = (resolved, _project_root_of_dir(resolved))
+            folder, root = folders[path.parent]
+            resolved = folder / path.name
+            pathex = (
+                str(resolved.relative_to(root))
+                if resolved.is_relative_to(root)
+                else str(resolved)
+            )
+        result.append(
+            (
+                _kind_from_match_path(path, pathex),
+                _kind_from_match_path(path, pathex, base=True),
+            ),
+        )
+    return result
+
+
+def _kind_from_match_path(path: Path, pathex: str, *, base: bool = False) -> FileType:
+    """Determine the file kind from the path used for matching the kind globs."""
     kinds = options.kinds if not base else BASE_KINDS
-    for entry in kinds:
-        for k, v in entry.items():
-            if pathex.globmatch(
-                v,
-                flags=(
-                    wcmatch.pathlib.GLOBSTAR
-                    | wcmatch.pathlib.BRACE
-                    | wcmatch.pathlib.DOTGLOB
-                ),
-            ):
-                matched_kind = str(k)
-                # Namespace folders under roles/ can match **/roles/*/ without
-                # being role roots themselves. See #5079.
-                if (
-                    matched_kind == "role"
-                    and path.is_dir()
-                    and not _has_role_subdirs(path)
-                ):
-                    continue
-                return matched_kind  # type: ignore[return-value]
+    matcher = _kind_matcher(
+        tuple((str(k), v) for entry in kinds for k, v in entry.items()),
+    )
+    index = matcher.first(pathex)
+    while index is not None:
+        matched_kind = matcher.kinds[index]
+        # Namespace folders under roles/ can match **/roles/*/ without
+        # being role roots themselves. See #5079.
+        if matched_kind == "role" and path.is_dir() and not _has_role_subdirs(path):
+            index = matcher.first(pathex, index + 1)
+            continue
+        return matched_kind  # type: ignore[return-value]
 
     if base:
         # Unknown base file type is default
@@ -213,6 +320,19 @@ def kind_from_path(path: Path, *, base: bool = False) -> FileType:
     return ""
 
 
+def _normalize_name(name: Path) -> Path:
+    """Return the name of a lintable, like normpath_path but resolving it once."""
+    resolved = name.resolve()
+    cwd = Path.cwd()
+    if resolved.is_relative_to(cwd):
+        return resolved.relative_to(cwd)
+    # Compress any absolute path within current user home directory
+    home = Path.home()
+    if resolved.is_relative_to(home):
+        return Path("~") / resolved.relative_to(home)
+    return resolved
+
+
 # pylint: disable=too-many-instance-attributes
 class Lintable:
     """Defines a file/folder that can be linted.
@@ -221,8 +341,39 @@ class Lintable:
     instances that do not need files to be present on disk.
 
     When symlinks are given, they will always be resolved to their target.
+
+    Attributes derived from the path, like ``kind``, ``base_kind``, ``role``,
+    ``dir``, ``abspath`` and ``parent``, are only computed on first use.
     """
 
+    __slots__ = (
+        "__dict__",  # allows extra attributes, only allocated when used
+        "_abspath",
+        "_base_kind",
+        "_content",
+        "_dir",
+        "_document",
+        "_kind",
+        "_kind_checked",
+        "_original_content",
+        "_parent",
+        "_parent_checked",
+        "_path",
+        "_role",
+        "_tasks",
+        "exc",
+        "explicit",
+        "file",
+        "filename",
+        "line_offset",
+        "line_skips",
+        "matches",
+        "name",
+        "state",
+        "stop_processing",
+        "updated",
+    )
+
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
@@ -233,42 +384,40 @@ class Lintable:
         parent: Lintable | None = None,
     ):
         """Create a Lintable instance."""
-        self.dir: str = ""
-        self.kind: FileType | None = None
         self.stop_processing = False  # Set to stop other rules from running
         self.state: Any = States.NOT_LOADED
         self.line_skips: dict[int, set[str]] = defaultdict(set)
         self.exc: Exception | None = None  # Stores data loading exceptions
-        self.parent = parent
         self.explicit = False  # Indicates if the file was explicitly provided or was indirectly included.
         self.line_offset = (
             0  # Amount to offset line numbers by to get accurate position
         )
         self.matches: list[MatchError] = []
+        self._tasks: list[Task] | None = None
+        self._document: ParsedDocument | None = None
+        # lazily computed attributes, None until first used
+        self._kind: FileType | None = kind or None
+        self._kind_checked = False
+        self._base_kind: str | None = base_kind or None
+        self._role: str | None = None
+        self._dir: str | None = None
+        self._abspath: Path | None = None
+        self._parent = parent
+        self._parent_checked = False
 
         if isinstance(name, str):
             name = Path(name)
-        is_relative = is_relative_to(name, str(name.cwd()))
-        name = name.resolve()
-        if is_relative:
-            name = name.relative_to(name.cwd())
-        name = normpath_path(name)
+        name = _normalize_name(name)
         # we need to be sure that we expanduser() because otherwise a simple
         # test like .path.exists() will return unexpected results.
-        self.path = name.expanduser()
+        self._path = name.expanduser()
         # Filename is effective file on disk, for stdin is a namedtempfile
         self.name = self.filename = str(name)
 
         self._content = self._original_content = content
         self.updated = False
 
-        # if the lintable is part of a role, we save role folder name
-        self.role = ""
-        role_path = find_role_dir(self.path)
-        if role_path is not None:
-            self.role = role_path.name
-
-        if str(self.path) in ["/dev/stdin", "-"]:
+        if str(self._path) in ["/dev/stdin", "-"]:
             # pylint: disable=consider-using-with
             self.file = NamedTemporaryFile(  # noqa: SIM115
                 mode="w+",
@@ -279,28 +428,108 @@ class Lintable:
             self._content = sys.stdin.read()
             self.file.write(self._content)
             self.file.flush()
-            self.path = Path(self.file.name)
+            self._path = Path(self.file.name)
             self.name = "stdin"
+            self._role = ""
             self.kind = "playbook"
-            self.dir = "/"
-        else:
-            self.kind = kind or kind_from_path(self.path)
-        # We store absolute directory in dir
-        if not self.dir:
+            self._dir = "/"
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the file on disk."""
+        return self._path
+
+    @path.setter
+    def path(self, value: Path) -> None:
+        """Change the path, keeping the attributes derived from the previous one."""
+        _ = self.role, self.kind, self.dir, self.base_kind, self.abspath, self.parent
+        self._path = value
+
+    @property
+    def kind(self) -> FileType | None:
+        """Return the kind of the file, determined from its path or content."""
+        if not self._kind_checked:
+            self._kind_checked = True
+            if self._kind is None:
+                self._kind = kind_from_path(self._path)
+            if self._kind == "yaml":
+                # loading the data may reveal a more specific kind
+                _ = self.data
+        return self._kind
+
+    @kind.setter
+    def kind(self, value: FileType | None) -> None:
+        """Force the kind of the file."""
+        self._kind = value
+        self._kind_checked = True
+
+    @property
+    def base_kind(self) -> str:
+        """Return the base file type, like 'text/yaml'."""
+        if self._base_kind is None:
+            self._base_kind = kind_from_path(self._path, base=True)
+        return self._base_kind
+
+    @base_kind.setter
+    def base_kind(self, value: str) -> None:
+        """Force the base file type."""
+        self._base_kind = value
+
+    @property
+    def role(self) -> str:
+        """Return the name of the role containing the file, if any."""
+        if self._role is None:
+            role_path = find_role_dir(self._path)
+            self._role = role_path.name if role_path is not None else ""
+        return self._role
+
+    @role.setter
+    def role(self, value: str) -> None:
+        """Force the name of the role containing the file."""
+        self._role = value
+
+    @property
+    def dir(self) -> str:
+        """Return the absolute directory of the file, or of the role itself."""
+        if self._dir is None:
             if self.kind == "role":
-                self.dir = str(self.path.resolve())
+                self._dir = str(self._path.resolve())
             else:
-                self.dir = str(self.path.parent.resolve())
+                self._dir = str(self._path.parent.resolve())
+        return self._dir
 
-        # determine base file kind (yaml, xml, ini, ...)
-        self.base_kind = base_kind or kind_from_path(self.path, base=True)
-        self.abspath = self.path.expanduser().absolute()
+    # dir was a plain attribute before, its name is kept for compatibility
+    @dir.setter  # noqa: A003
+    def dir(self, value: str) -> None:
+        """Force the directory of the file."""
+        self._dir = value
 
-        if self.kind == "tasks":
-            self.parent = _guess_parent(self)
+    @property
+    def abspath(self) -> Path:
+        """Return the absolute path of the file."""
+        if self._abspath is None:
+            self._abspath = self._path.expanduser().absolute()
+        return self._abspath
 
-        if self.kind == "yaml":
-            _ = self.data
+    @abspath.setter
+    def abspath(self, value: Path) -> None:
+        """Force the absolute path of the file."""
+        self._abspath = value
+
+    @property
+    def parent(self) -> Lintable | None:
+        """Return the lintable including this one, guessed for tasks files."""
+        if not self._parent_checked:
+            self._parent_checked = True
+            if self.kind == "tasks":
+                self._parent = _guess_parent(self)
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Lintable | None) -> None:
+        """Change the lintable including this one."""
+        self._parent = value
+        self._parent_checked = True
 
     def __del__(self) -> None:
         """Clean up temporary files when the instance is cleaned up."""
@@ -379,11 +608,48 @@ class Lintable:
                 self._original_content = ""
         self.updated = self._original_content != value
         self._content = value
+        self._document = None
 
     @content.deleter
     def content(self) -> None:
         """Reset the internal content cache."""
         self._content = None
+        self._document = None
+
+    @property
+    def document(self) -> ParsedDocument:
+        """Return the parsed views of the file content.
+
+        The content is parsed only when a view is first requested and the
+        results are shared by all consumers until the content changes.
+        """
+        if self._document is None:
+            # pylint: disable=import-outside-toplevel
+            from ansiblelint.document import ParsedDocument
+
+            self._document = ParsedDocument(self)
+        return self._document
+
+    @property
+    def tasks(self) -> list[Task]:
+        """Return the tasks found inside the file.
+
+        Tasks are extracted and normalized only once and shared by all the
+        rules looking at them, until the cache is released using ``del``.
+        """
+        if self._tasks is None:
+            # pylint: disable=import-outside-toplevel
+            from ansiblelint.utils import task_in_list
+
+            self._tasks = list(
+                task_in_list(data=self.data, file=self, kind=str(self.kind)),
+            )
+        return self._tasks
+
+    @tasks.deleter
+    def tasks(self) -> None:
+        """Release the cached tasks."""
+        self._tasks = None
 
     def write(self, *, force: bool = False) -> None:
         """Write the value of ``Lintable.content`` to disk.
@@ -444,11 +710,7 @@ class Lintable:
 
     def _load_yaml_state(self) -> None:
         """Load and process YAML content, guessing kind and appending skip rules."""
-        from ansiblelint.utils import (  # pylint: disable=import-outside-toplevel
-            parse_yaml_linenumbers,
-        )
-
-        self.state = parse_yaml_linenumbers(self)
+        self.state = self.document.tagged
         if self.kind == "yaml":
             self._guess_kind()
         if "append_skipped_rules" not in globals():
@@ -489,6 +751,45 @@ class Lintable:
         return self.state
 
 
+class LintableRegistry:
+    """Run-scoped store keeping a single Lintable instance per path and kind.
+
+    Lintables obtained from the registry are shared, so their state, like the
+    matches found, line skips or stop_processing, is seen by every user.
+
+    Instances are keyed on the kind requested by the caller, not on the one
+    guessed from the path or content: get() with a kind only returns an
+    instance registered under that kind. add() registers a lintable under the
+    kind given to it, None by default, whatever its own kind is, so a lintable
+    created by the caller with an explicit kind is returned by get() calls
+    made without a kind.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        # absolute path -> requested kind -> lintable
+        self._lintables: dict[str, dict[FileType | None, Lintable]] = {}
+
+    def get(self, name: str | Path, kind: FileType | None = None) -> Lintable:
+        """Return the lintable of given path and kind, creating it if needed."""
+        kinds = self._lintables.setdefault(
+            os.path.abspath(os.path.expanduser(name)), {}
+        )
+        lintable = kinds.get(kind)
+        if lintable is None:
+            lintable = kinds[kind] = Lintable(name, kind=kind)
+        return lintable
+
+    def add(self, lintable: Lintable, kind: FileType | None = None) -> Lintable:
+        """Register a lintable, returning the already known instance, if any."""
+        kinds = self._lintables.setdefault(str(lintable.abspath), {})
+        return kinds.setdefault(kind, lintable)
+
+    def find(self, lintable: Lintable) -> list[Lintable]:
+        """Return the registered lintables of the same path, whatever their kind."""
+        return list(self._lintables.get(str(lintable.abspath), {}).values())
+
+
 # pylint: disable=redefined-outer-name
 def discover_lintables(options: Options) -> list[str]:
     """Find all files that we know how to lint.
@@ -601,58 +902,222 @@ def _guess_parent(lintable: Lintable) -> Lintable | None:
     return None
 
 
+# Paths never linted, in addition to the user provided exclude_paths.
+DEFAULT_EXCLUDE_PATHS = (
+    ".ansible",
+    ".git",
+    ".tox",
+    ".mypy_cache",
+    "__pycache__",
+    ".DS_Store",
+    ".coverage",
+    ".pytest_cache",
+    ".ruff_cache",
+)
+
+
+@cache
+def _exclude_spec(exclude_paths: tuple[str, ...]) -> pathspec.GitIgnoreSpec:
+    """Return the compiled spec of the default and user provided exclusions."""
+    return pathspec.GitIgnoreSpec.from_lines([*DEFAULT_EXCLUDE_PATHS, *exclude_paths])
+
+
+def _load_gitignore(directory: str) -> pathspec.GitIgnoreSpec | None:
+    """Return the compiled .gitignore of a directory, if it has one."""
+    gitignore = os.path.join(directory, ".gitignore")
+    try:
+        with open(gitignore, encoding="UTF-8") as f:
+            lines = f.read().splitlines()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    _logger.info("Loading ignores from %s", gitignore)
+    return pathspec.GitIgnoreSpec.from_lines(lines)
+
+
+def _git_ls_files(directory: Path) -> list[str] | None:
+    """Return the files known to git below directory.
+
+    Ignore files are not applied, so the result does not depend on the git
+    configuration. Untracked directories are listed once, with a trailing
+    slash, instead of their content. Returned paths are relative to
+    directory, None is returned when the directory is not inside a git work
+    tree.
+    """
+    try:
+        result = subprocess.run(
+            [  # noqa: S607
+                "git",
+                "ls-files",
+                "-z",
+                "--cached",
+                "--others",
+                "--directory",
+                "--",
+                ".",
+            ],
+            cwd=directory,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [os.fsdecode(name) for name in result.stdout.split(b"\0") if name]
+
+
+def get_changed_files(ref: str, directory: Path | None = None) -> list[str] | None:
+    """Return the files changed since the common ancestor of ref and HEAD.
+
+    Uncommitted, untracked and removed files are included. Returned paths are
+    relative to directory, None is returned when git cannot compare with ref.
+    """
+    if ref.startswith("-"):
+        return None
+    directory = directory or Path.cwd()
+    names: list[str] = []
+    try:
+        base = subprocess.run(  # noqa: S603
+            ["git", "merge-base", ref, "HEAD"],  # noqa: S607
+            cwd=directory,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+        diff = ["git", "diff", "-z", "--name-only", "--no-renames", "--relative"]
+        for cmd in (
+            [*diff, base, "--"],
+            ["git", "ls-files", "-z", "--others", "--exclude-standard", "--", "."],
+        ):
+            result = subprocess.run(  # noqa: S603
+                cmd,
+                cwd=directory,
+                capture_output=True,
+                check=True,
+            )
+            names.extend(os.fsdecode(x) for x in result.stdout.split(b"\0") if x)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return list(dict.fromkeys(names))
+
+
+# Ignore files that apply to a path, with the offset of their directory in it
+_Ignores = list[tuple[int, pathspec.GitIgnoreSpec]]
+
+
+def _is_excluded(
+    path: str,
+    ignores: _Ignores,
+    exclude_spec: pathspec.GitIgnoreSpec,
+) -> bool:
+    """Return true if the path, ending with a slash for folders, is excluded."""
+    return exclude_spec.match_file(path) or any(
+        spec.match_file(path[start:]) for start, spec in ignores
+    )
+
+
+def _walk_files(
+    root: str,
+    prefix: str,
+    exclude_spec: pathspec.GitIgnoreSpec,
+    ignores: _Ignores | None = None,
+) -> list[str]:
+    """Return the files below root, honouring nested .gitignore files."""
+    files: list[str] = []
+
+    def walk(directory: str, prefix: str, ignores: _Ignores) -> None:
+        # each .gitignore applies to paths relative to its own directory
+        gitignore = _load_gitignore(directory)
+        if gitignore is not None:
+            ignores = [*ignores, (len(prefix), gitignore)]
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            path = prefix + entry.name
+            is_dir = entry.is_dir()
+            if _is_excluded(path + "/" if is_dir else path, ignores, exclude_spec):
+                _logger.debug("Excluded: %s", path)
+                continue
+            if is_dir:
+                walk(entry.path, path + "/", ignores)
+            elif entry.is_file():
+                files.append(path)
+
+    walk(root, prefix, ignores or [])
+    return files
+
+
+def _filter_git_files(
+    names: list[str],
+    prefix: str,
+    exclude_spec: pathspec.GitIgnoreSpec,
+) -> list[str]:
+    """Return the files listed by git that the walker would have returned.
+
+    The exclusions and .gitignore files are applied the same way, each folder
+    being checked once. Folders listed by git, like untracked ones, symlinks
+    to folders or submodules, are walked.
+    """
+    # folder -> ignore files applying to its entries, None when excluded
+    folders: dict[str, _Ignores | None] = {}
+
+    def folder_ignores(folder: str) -> _Ignores | None:
+        if folder in folders:
+            return folders[folder]
+        ignores: _Ignores | None = []
+        if folder != prefix:
+            parent = folder[: folder.rstrip("/").rfind("/") + 1]
+            ignores = folder_ignores(parent)
+            if ignores is not None and _is_excluded(folder, ignores, exclude_spec):
+                _logger.debug("Excluded: %s", folder.rstrip("/"))
+                ignores = None
+        if ignores is not None:
+            gitignore = _load_gitignore(folder or ".")
+            if gitignore is not None:
+                ignores = [*ignores, (len(folder), gitignore)]
+        folders[folder] = ignores
+        return ignores
+
+    files: list[str] = []
+    for name in sorted(names, key=lambda name: name.split("/")):
+        path = prefix + name.rstrip("/")
+        ignores = folder_ignores(path[: path.rfind("/") + 1])
+        if ignores is None:
+            continue
+        if os.path.isdir(path):
+            if not _is_excluded(path + "/", ignores, exclude_spec):
+                files.extend(_walk_files(path, path + "/", exclude_spec, ignores))
+        elif not _is_excluded(path, ignores, exclude_spec):
+            if os.path.isfile(path):
+                files.append(path)
+        else:
+            _logger.debug("Excluded: %s", path)
+    return files
+
+
 def get_all_files(
     *paths: Path,
     exclude_paths: list[str] | None = None,
+    use_git: bool = True,
 ) -> list[Path]:
-    """Recursively retrieve all files from given folders."""
-    all_files: list[Path] = []
-    exclude_paths = [] if exclude_paths is None else exclude_paths
+    """Recursively retrieve all files from given folders.
 
-    def is_excluded(path_to_check: Path) -> bool:
-        """Check if a file is exclude by current specs."""
-        return any(
-            spec.match_file(pathspec.util.append_dir_sep(path_to_check))
-            for spec in pathspecs
-        )
+    When use_git is true and a folder is inside a git work tree, the files are
+    listed by git instead of walking the folder, the same exclusions being
+    applied, so the result does not depend on git being available.
+    """
+    all_files: list[Path] = []
+    exclude_spec = _exclude_spec(tuple(exclude_paths or ()))
 
     for path in paths:
-        pathspecs = [
-            pathspec.GitIgnoreSpec.from_lines(
-                [
-                    ".ansible",
-                    ".git",
-                    ".tox",
-                    ".mypy_cache",
-                    "__pycache__",
-                    ".DS_Store",
-                    ".coverage",
-                    ".pytest_cache",
-                    ".ruff_cache",
-                    *exclude_paths,
-                ],
-            ),
-        ]
-        gitignore = path / ".gitignore"
-        if gitignore.exists():
-            with gitignore.open(encoding="UTF-8") as f:
-                _logger.info("Loading ignores from %s", gitignore)
-                pathspecs.append(
-                    pathspec.GitIgnoreSpec.from_lines(f.read().splitlines()),
-                )
-
-        # Iterate over all items in the directory
         if path.is_file():
             all_files.append(path)
+            continue
+        root = str(path)
+        prefix = "" if root == "." else root.rstrip("/") + "/"
+        names = _git_ls_files(path) if use_git else None
+        if names:
+            files = _filter_git_files(names, prefix, exclude_spec)
         else:
-            for item in sorted(path.iterdir()):
-                if is_excluded(item):
-                    _logger.debug("Excluded: %s", item)
-                    continue
-                if item.is_file():
-                    all_files.append(item)
-                # If it's a directory, recursively call the function
-                elif item.is_dir():
-                    all_files.extend(get_all_files(item, exclude_paths=exclude_paths))
+            files = _walk_files(root, prefix, exclude_spec)
+        all_files.extend(Path(name) for name in files)
 
     return all_files
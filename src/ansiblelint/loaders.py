@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import enum
+import json
 import logging
 import os
 from collections import defaultdict
@@ -55,6 +56,47 @@ def yaml_from_file(filepath: str | Path) -> Any:
         return yaml_load(content)
 
 
+def _json_key(key: Any) -> str:
+    """Convert a mapping key the same way json.dumps does."""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        # like json, ignoring the representation of int subclasses
+        return repr(int(key))
+    if isinstance(key, float):
+        return json.dumps(key)
+    msg = f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    raise TypeError(msg)
+
+
+def json_compatible(data: Any) -> Any:
+    """Return loaded YAML data converted to the types produced by JSON.
+
+    This gives the same result as ``json.loads(json.dumps(data))``, without
+    serializing the data to a string.
+    """
+    if isinstance(data, str):
+        return str(data)
+    if data is None or isinstance(data, bool):
+        return data
+    if isinstance(data, int):
+        return int(data)
+    if isinstance(data, float):
+        return float(data)
+    if isinstance(data, dict):
+        return {_json_key(k): json_compatible(v) for k, v in data.items()}
+    if isinstance(data, list | tuple):
+        return [json_compatible(v) for v in data]
+    msg = f"Object of type {type(data).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
 def get_ignore_rule(rule: str, qualifiers: str) -> IgnoreRule:
     """Validate qualifiers and return an IgnoreRule."""
     s = set()
@@ -106,6 +148,7 @@ __all__ = [
     "IgnoreRule",
     "IgnoreRuleQualifier",
     "YAMLError",
+    "json_compatible",
     "load_ignore_txt",
     "yaml_from_file",
     "yaml_load",
@@ -0,0 +1,187 @@
+"""Size bounded in-memory caches for functions keyed by file content.
+
+Cheap functions called with small arguments, like the string predicates, use
+``functools.lru_cache`` through ``counted_lru_cache`` instead. Their number of
+entries is bounded but they are not part of the memory budget, their
+statistics being logged with the ones of the bounded caches.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, ParamSpec, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Default memory budget shared by all bounded caches, in bytes.
+DEFAULT_MEMORY_BUDGET = 512 * 1024 * 1024
+
+_caches: list[BoundedCache[Any, Any]] = []
+_lru_caches: list[_LruCache] = []
+_memory_budget = DEFAULT_MEMORY_BUDGET
+
+
+def _weigh_args(*args: Any) -> int:
+    """Estimate the memory used by an entry from the size of its arguments."""
+    return sum(sys.getsizeof(arg) for arg in args)
+
+
+class BoundedCache(Generic[P, R]):
+    """Least recently used cache, bounded by the estimated size of its entries.
+
+    The size of each entry is estimated by the ``weigh`` function, which
+    receives the same arguments as the cached function. The cache receives
+    ``share`` of the global memory budget and evicts the least recently used
+    entries when it goes over it.
+    """
+
+    def __init__(
+        self,
+        func: Callable[P, R],
+        share: float,
+        weigh: Callable[..., int] = _weigh_args,
+    ) -> None:
+        """Wrap the function with a cache."""
+        self.func = func
+        self.name = f"{func.__module__}.{func.__qualname__}"
+        self.share = share
+        self.weigh = weigh
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: OrderedDict[Any, tuple[R, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        functools.update_wrapper(self, func)
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum estimated size of the cache, in bytes."""
+        return int(_memory_budget * self.share)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Return the cached result, calling the function on a miss."""
+        key = (args, tuple(kwargs.items())) if kwargs else args
+        try:
+            with self._lock:
+                result, _ = self._entries[key]
+                self._entries.move_to_end(key)
+                self.hits += 1
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable arguments cannot be cached
+            return self.func(*args, **kwargs)
+        else:
+            return result
+
+        result = self.func(*args, **kwargs)
+        weight = self.weigh(*args, **kwargs)
+        with self._lock:
+            self.misses += 1
+            if key not in self._entries and weight <= self.maxsize:
+                self._entries[key] = (result, weight)
+                self.size += weight
+                self._evict(self.maxsize)
+        return result
+
+    def _evict(self, maxsize: int) -> None:
+        """Remove least recently used entries until the cache fits in maxsize."""
+        while self.size > maxsize and self._entries:
+            _, (_, weight) = self._entries.popitem(last=False)
+            self.size -= weight
+            self.evictions += 1
+
+    def cache_clear(self) -> None:
+        """Remove all the entries of the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+
+def bounded_cache(
+    share: float,
+    weigh: Callable[..., int] = _weigh_args,
+) -> Callable[[Callable[P, R]], BoundedCache[P, R]]:
+    """Decorate a function with a bounded cache using a share of the memory budget."""
+
+    def decorator(func: Callable[P, R]) -> BoundedCache[P, R]:
+        cache: BoundedCache[P, R] = BoundedCache(func, share=share, weigh=weigh)
+        _caches.append(cache)
+        return cache
+
+    return decorator
+
+
+class _LruCache(Protocol):
+    """Function wrapped by functools.lru_cache."""
+
+    __module__: str
+    __qualname__: str
+
+    def cache_info(self) -> functools._CacheInfo:  # pragma: no cover
+        """Return the statistics of the cache."""
+
+
+def counted_lru_cache(maxsize: int) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function with functools.lru_cache, logging its statistics."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+        _lru_caches.append(cached)
+        return cached  # type: ignore[return-value]
+
+    return decorator
+
+
+def set_memory_budget(budget: int) -> None:
+    """Change the memory budget shared by all caches, evicting entries if needed."""
+    global _memory_budget  # pylint: disable=global-statement
+    _memory_budget = max(budget, 0)
+    for cache in _caches:
+        with cache._lock:  # noqa: SLF001
+            cache._evict(cache.maxsize)  # noqa: SLF001
+
+
+def log_stats() -> None:
+    """Log the statistics of the caches that were used."""
+    for cache in _caches:
+        if cache.hits or cache.misses:
+            _logger.debug(
+                "Cache %s: %s hits, %s misses, %s evictions, %s entries using ~%s of %s bytes",
+                cache.name,
+                cache.hits,
+                cache.misses,
+                cache.evictions,
+                len(cache),
+                cache.size,
+                cache.maxsize,
+            )
+    for lru_cache in _lru_caches:
+        info = lru_cache.cache_info()
+        if info.hits or info.misses:
+            _logger.debug(
+                "Cache %s.%s: %s hits, %s misses, %s evictions, %s of %s entries",
+                lru_cache.__module__,
+                lru_cache.__qualname__,
+                info.hits,
+                info.misses,
+                # entries are only removed when evicted
+                info.misses - info.currsize,
+                info.currsize,
+                info.maxsize,
+            )
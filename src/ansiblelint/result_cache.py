@@ -0,0 +1,298 @@
+"""On-disk cache of the rule results of each lintable."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pathspec
+from ansible.plugins.loader import get_all_plugin_loaders
+
+import ansiblelint
+import ansiblelint.utils
+from ansiblelint.version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ansiblelint.config import Options
+    from ansiblelint.file_utils import Lintable
+    from ansiblelint.rules import RulesCollection
+
+_logger = logging.getLogger(__name__)
+
+# Bump when the format of the cached results changes.
+CACHE_FORMAT = 1
+
+# Options that only affect how results are displayed, not what is reported.
+_OUTPUT_OPTIONS = frozenset(
+    (
+        "cache_dir",
+        "changed_since",
+        "colored",
+        "configured",
+        "daemon",
+        "dependents",
+        "format",
+        "generate_ignore",
+        "jobs",
+        "lintables",
+        "list_profiles",
+        "list_rules",
+        "list_tags",
+        "memory_cache_size",
+        "profile_rules",
+        "quiet",
+        "sarif_file",
+        "timings",
+        "verbosity",
+        "version",
+    ),
+)
+
+
+@dataclass
+class CachedResult:
+    """Rule results of a single lintable, as stored in the cache."""
+
+    matches: list[dict[str, Any]] = field(default_factory=list)
+    line_skips: dict[int, list[str]] = field(default_factory=dict)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize objects found in the configuration in a stable way."""
+    if isinstance(obj, pathspec.PathSpec):
+        return [x.regex.pattern if x.regex is not None else "" for x in obj.patterns]
+    if isinstance(obj, set | frozenset):
+        return sorted(obj, key=str)
+    return str(obj)
+
+
+@cache
+def _code_fingerprint(paths: tuple[Path, ...]) -> str:
+    """Return a fingerprint of the python files implementing the linter and rules.
+
+    Including the modification times allows us to invalidate the cache when
+    custom rules, or ansible-lint itself, change without a version bump.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        for file in sorted(path.rglob("*.py")) if path.is_dir() else [path]:
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            digest.update(f"{file}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def plugin_state() -> tuple[Any, ...]:
+    """Return the plugin and collection paths that can change the rule results."""
+    basedir = ansiblelint.utils.get_collections_basedir()
+    if basedir and not Path(basedir, "collections").is_dir():
+        # only adjacent collections are looked up from there
+        basedir = None
+    return (
+        basedir,
+        tuple(
+            tuple(getattr(loader, "_extra_dirs", ()))
+            for _, loader in get_all_plugin_loaders()
+        ),
+    )
+
+
+def _update_with_stats(digest: Any, files: Iterable[Path]) -> None:
+    """Add the modification times and sizes of the files to the digest."""
+    for file in files:
+        try:
+            stat = file.stat()
+        except OSError:
+            continue
+        digest.update(f"{file}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+
+
+def plugins_fingerprint(
+    state: tuple[Any, ...],
+    collections_paths: Iterable[str],
+) -> str:
+    """Return a fingerprint of the installed collections and of the plugin dirs.
+
+    Installing or upgrading a collection rewrites its manifest, while the
+    plugins of the adjacent collections and the plugin dirs registered for
+    the project are expected to be edited in place.
+    """
+    basedir, extra_dirs = state
+    digest = hashlib.sha256(repr(state).encode())
+    for path in collections_paths:
+        for collection in sorted(Path(path).glob("ansible_collections/*/*")):
+            _update_with_stats(
+                digest,
+                (collection, collection / "MANIFEST.json", collection / "galaxy.yml"),
+            )
+    if basedir:
+        for collection in sorted(
+            Path(basedir, "collections").glob("ansible_collections/*/*"),
+        ):
+            _update_with_stats(digest, sorted(collection.rglob("*")))
+    for path in sorted({x for dirs in extra_dirs for x in dirs}):
+        _update_with_stats(digest, sorted(Path(path).rglob("*")))
+    return digest.hexdigest()
+
+
+def fingerprint(
+    rules: RulesCollection,
+    tags: Iterable[str],
+    skip_list: Iterable[str],
+) -> str:
+    """Return a fingerprint of everything, besides the file, affecting its results."""
+    # pylint: disable=import-outside-toplevel
+    import inspect
+
+    from ansible.release import __version__ as ansible_version
+
+    options: Options = rules.options
+    effective_options = {
+        k: v for k, v in asdict(options).items() if k not in _OUTPUT_OPTIONS
+    }
+    effective_options["kinds"] = options.kinds
+    rule_files = {Path(inspect.getfile(type(rule))) for rule in rules.rules}
+    data = {
+        "format": CACHE_FORMAT,
+        "ansible-lint": __version__,
+        "ansible-core": ansible_version,
+        "code": _code_fingerprint(
+            tuple(sorted({Path(ansiblelint.__file__).parent, *rule_files})),
+        ),
+        "options": effective_options,
+        "rules": sorted(
+            f"{type(rule).__module__}.{type(rule).__qualname__}:{rule.id}:{rule.version_changed}"
+            for rule in rules.rules
+        ),
+        "tags": sorted(tags),
+        "skip_list": sorted(skip_list),
+        "yamllint": rules.app.yamllint_config.rules,
+        "collections_paths": rules.app.runtime.config.collections_paths,
+        "roles_path": rules.app.runtime.config.default_roles_path,
+        "env": {
+            k: v
+            for k, v in rules.app.runtime.environ.items()
+            if k.startswith("ANSIBLE_")
+        },
+    }
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=_json_default).encode(),
+    ).hexdigest()
+
+
+class ResultCache:
+    """Content addressed cache of the rule results of each lintable.
+
+    Results are stored under a key that combines the fingerprint of the
+    current configuration and plugins with the name, kind and content of the
+    lintable, so modified files or configurations always miss the cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        fingerprint: str,
+        collections_paths: Iterable[str] = (),
+    ) -> None:
+        """Initialize the cache for the given fingerprint."""
+        self.path = cache_dir / "results"
+        self.fingerprint = fingerprint
+        self.collections_paths = tuple(collections_paths)
+        self.hits = 0
+        self.misses = 0
+        # plugin state -> fingerprint of the plugins, updated when children
+        # discovery registers more plugin dirs
+        self._plugins: tuple[tuple[Any, ...], str] | None = None
+
+    def _plugins_fingerprint(self) -> str:
+        """Return the fingerprint of the plugins currently registered."""
+        state = plugin_state()
+        if self._plugins is None or self._plugins[0] != state:
+            self._plugins = (state, plugins_fingerprint(state, self.collections_paths))
+        return self._plugins[1]
+
+    def key(self, lintable: Lintable) -> str | None:
+        """Return the cache key of the lintable, or None if it cannot be cached."""
+        # Results for folders, like roles, and galaxy files also depend on
+        # other files found near them.
+        if lintable.kind == "galaxy" or lintable.path.is_dir():
+            return None
+        try:
+            content = lintable.content
+        except (OSError, UnicodeDecodeError):
+            return None
+        digest = hashlib.sha256(self.fingerprint.encode())
+        digest.update(self._plugins_fingerprint().encode())
+        for value in (lintable.name, lintable.kind, lintable.base_kind, content):
+            digest.update(b"\0")
+            digest.update(str(value).encode())
+        return digest.hexdigest()
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    def contains(self, lintable: Lintable) -> bool:
+        """Return true if results of the lintable are cached, without loading them."""
+        key = self.key(lintable)
+        return key is not None and self._file(key).exists()
+
+    def get(self, lintable: Lintable) -> CachedResult | None:
+        """Return the cached results of the lintable, if any."""
+        key = self.key(lintable)
+        if key is None:
+            return None
+        try:
+            with self._file(key).open(encoding="utf-8") as f:
+                data = json.load(f)
+            result = CachedResult(
+                matches=data["matches"],
+                line_skips={int(k): v for k, v in data["line_skips"].items()},
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, lintable: Lintable, result: CachedResult) -> None:
+        """Store the results of the lintable."""
+        key = self.key(lintable)
+        if key is None:
+            return
+        file = self._file(key)
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            # written to a temporary file first, so we never read partial results
+            fd, tmp_name = tempfile.mkstemp(dir=file.parent, suffix=".tmp")
+        except OSError as exc:
+            _logger.debug("Unable to store results in %s: %s", file, exc)
+            return
+        tmp_file = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(asdict(result), f)
+            tmp_file.replace(file)
+        except OSError as exc:
+            _logger.debug("Unable to store results in %s: %s", file, exc)
+            tmp_file.unlink(missing_ok=True)
+
+    def report(self) -> None:
+        """Log the cache statistics."""
+        if self.hits or self.misses:
+            _logger.info(
+                "Result cache: %s hits, %s misses (%s)",
+                self.hits,
+                self.misses,
+                self.path,
+            )
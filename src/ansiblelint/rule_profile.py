@@ -0,0 +1,128 @@
+"""Time spent by the rules, measured when ``--profile-rules`` is used.
+
+Each call made by ``BaseRule.getmatches`` to one of the match methods of a
+rule is timed, and aggregated by rule, method and kind of the file. The time
+spent by all the rules on each file is also recorded, to find the slowest
+files.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from ansiblelint.file_utils import Lintable
+
+# Number of files listed in the report as the slowest ones.
+SLOWEST_FILES = 10
+
+
+@dataclass
+class RuleTiming:
+    """Time spent by a match method of a rule on a kind of files."""
+
+    calls: int = 0
+    wall: float = 0.0  # seconds
+    cpu: float = 0.0  # seconds, of the thread running the rule
+
+
+@dataclass
+class RuleProfile:
+    """Timings of the rules and of the files they ran on."""
+
+    # (rule id, method, file kind) -> timing
+    timings: dict[tuple[str, str, str], RuleTiming] = field(default_factory=dict)
+    # file name -> wall time spent by all the rules on it
+    files: dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def measure(
+        self,
+        rule_id: str,
+        method: str,
+        file: Lintable,
+    ) -> Generator[None, None, None]:
+        """Time the code run inside the context."""
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            timing = self.timings.setdefault(
+                (rule_id, method, str(file.kind)),
+                RuleTiming(),
+            )
+            timing.calls += 1
+            timing.cpu += time.thread_time() - cpu
+            wall = time.perf_counter() - wall
+            timing.wall += wall
+            self.files[file.name] = self.files.get(file.name, 0.0) + wall
+
+    def merge(self, other: RuleProfile) -> None:
+        """Add the timings recorded by another profile, like a worker one."""
+        for key, timing in other.timings.items():
+            total = self.timings.setdefault(key, RuleTiming())
+            total.calls += timing.calls
+            total.wall += timing.wall
+            total.cpu += timing.cpu
+        for name, wall in other.files.items():
+            self.files[name] = self.files.get(name, 0.0) + wall
+
+    def slowest_files(self, count: int = SLOWEST_FILES) -> list[tuple[str, float]]:
+        """Return the files on which the rules spent the most time."""
+        return sorted(self.files.items(), key=lambda x: (-x[1], x[0]))[:count]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile as data that can be serialized to JSON."""
+        return {
+            "rules": [
+                {"rule": rule, "method": method, "kind": kind, **asdict(timing)}
+                for (rule, method, kind), timing in sorted(
+                    self.timings.items(),
+                    key=lambda x: -x[1].wall,
+                )
+            ],
+            "slowest_files": [
+                {"file": name, "wall": wall} for name, wall in self.slowest_files()
+            ],
+        }
+
+    def render(self) -> str:
+        """Return the profile as a text table, the most expensive rules first."""
+        text = "# Rule Profile\n\n"
+        text += f"{'wall(s)':>9} {'cpu(s)':>9} {'calls':>7}  rule method kind\n"
+        for entry in self.as_dict()["rules"]:
+            text += (
+                f"{entry['wall']:9.3f} {entry['cpu']:9.3f} {entry['calls']:7}  "
+                f"{entry['rule']} {entry['method']} {entry['kind']}\n"
+            )
+        text += "\n# Slowest Files\n\n"
+        for name, wall in self.slowest_files():
+            text += f"{wall:9.3f}  {name}\n"
+        return text
+
+    def write(self, path: Path) -> None:
+        """Store the profile as JSON."""
+        path.write_text(json.dumps(self.as_dict(), indent=2) + "\n", encoding="utf-8")
+
+
+_profile: RuleProfile | None = None
+
+
+def enable() -> RuleProfile:
+    """Start recording the timings of the rules in a new profile."""
+    global _profile  # pylint: disable=global-statement
+    _profile = RuleProfile()
+    return _profile
+
+
+def active() -> RuleProfile | None:
+    """Return the profile being recorded, if profiling is enabled."""
+    return _profile
@@ -9,6 +9,7 @@ import re
 import sys
 from collections import defaultdict
 from collections.abc import Iterable, Iterator, MutableMapping, MutableSequence
+from dataclasses import dataclass, field
 from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -168,11 +169,7 @@ class AnsibleLintRule(BaseRule):
         ):
             return matches
 
-        for task in ansiblelint.utils.task_in_list(
-            data=file.data,
-            kind=file.kind,
-            file=file,
-        ):
+        for task in file.tasks:
             if task.error is not None:
                 # normalize_task converts AnsibleParserError to MatchError
                 return [task.error]
@@ -184,10 +181,22 @@ class AnsibleLintRule(BaseRule):
             ):
                 continue
 
+            if (
+                self.task_modules
+                and task.normalized_task["action"]["__ansible_module__"]
+                not in self.task_modules
+            ):
+                continue
+
+            # tasks are shared between rules, so we expose the raw task only
+            # to the rules that requested it
             if self.needs_raw_task:
                 task.normalized_task["__raw_task__"] = task.raw_task
-
-            result = self.matchtask(task, file=file)
+            try:
+                result = self.matchtask(task, file=file)
+            finally:
+                if self.needs_raw_task:
+                    task.normalized_task.pop("__raw_task__", None)
             if not result:
                 continue
 
@@ -387,6 +396,65 @@ def load_plugins(
             yield rule
 
 
+def _keeps_rule_matches(rule: BaseRule, tags: frozenset[str]) -> bool:
+    """Return true if all matches of a rule are selected by given tags."""
+    if rule.id in tags:
+        return True
+    targeted = any(t.startswith(f"{rule.id}[") for t in tags)
+    return not targeted and not tags.isdisjoint(rule.tags)
+
+
+@dataclass
+class RulesPlan:
+    """Rules selected for given tags and skip list, compiled once per run."""
+
+    rules: list[BaseRule]
+    tags: frozenset[str]
+    skip_list: frozenset[str]
+    # rule id -> whether all its matches are selected by the tags
+    included: dict[str, bool] = field(default_factory=dict)
+
+    @classmethod
+    def compile(
+        cls,
+        rules: Iterable[BaseRule],
+        tags: Iterable[str],
+        skip_list: Iterable[str],
+    ) -> RulesPlan:
+        """Select the rules to run, in order, and how to filter their matches."""
+        plan = cls(rules=[], tags=frozenset(tags), skip_list=frozenset(skip_list))
+        for rule in rules:
+            plan.included[rule.id] = _keeps_rule_matches(rule, plan.tags)
+            if rule.id == "syntax-check":
+                continue
+            names = {rule.id, *rule.tags}
+            targeted = any(t.startswith(f"{rule.id}[") for t in plan.tags)
+            if plan.tags and not targeted:
+                # specific tag targeting override
+                if plan.tags.isdisjoint(rule.ids().keys()) and plan.tags.isdisjoint(
+                    rule.tags
+                ):
+                    continue
+                if not rule.has_dynamic_tags and plan.tags.isdisjoint(names):
+                    continue
+            # rule-level skip check
+            if plan.skip_list.isdisjoint(names):
+                plan.rules.append(rule)
+        return plan
+
+    def keeps(self, match: MatchError) -> bool:
+        """Return true if the match is selected by the tags and skip list."""
+        if not self.tags:
+            # no tags requested, so keep everything that wasn't skipped
+            return match.tag not in self.skip_list
+        if match.tag in self.tags:
+            return True
+        included = self.included.get(match.rule.id)
+        if included is None:
+            included = _keeps_rule_matches(match.rule, self.tags)
+        return included
+
+
 class RulesCollection:
     """Container for a collection of rules."""
 
@@ -415,6 +483,10 @@ class RulesCollection:
         rulesdirs_str = [] if rulesdirs is None else [str(r) for r in rulesdirs]
         self.rulesdirs = expand_paths_vars(rulesdirs_str)
         self.rules: list[BaseRule] = []
+        # caches derived from the rules, dropped when the list is modified
+        self._cached_rules: tuple[list[BaseRule], int] | None = None
+        self._rules_by_id: dict[str, BaseRule] = {}
+        self._plans: dict[tuple[frozenset[str], tuple[str, ...]], RulesPlan] = {}
         # internal rules included in order to expose them for docs as they are
         # not directly loaded by our rule loader.
         self.rules.extend(
@@ -454,6 +526,35 @@ class RulesCollection:
             ],
         ):
             self.rules.append(obj)
+            self._cached_rules = None
+
+    def _check_caches(self) -> None:
+        """Drop the caches derived from the rules if they were modified."""
+        cached = self._cached_rules
+        if (
+            cached is None
+            or cached[0] is not self.rules
+            or cached[1] != len(self.rules)
+        ):
+            self._rules_by_id.clear()
+            for rule in self.rules:
+                self._rules_by_id.setdefault(rule.id, rule)
+            self._plans.clear()
+            self._cached_rules = (self.rules, len(self.rules))
+
+    def plan(
+        self,
+        tags: Iterable[str] = (),
+        skip_list: Iterable[str] = (),
+    ) -> RulesPlan:
+        """Return the rules plan for given tags and skip list."""
+        self._check_caches()
+        key = (frozenset(tags), tuple(skip_list))
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = RulesPlan.compile(self.rules, *key)
+            self._plans[key] = plan
+        return plan
 
     def __iter__(self) -> Iterator[BaseRule]:
         """Return the iterator over the rules in the RulesCollection."""
@@ -472,9 +573,9 @@ class RulesCollection:
         if not isinstance(item, str):
             msg = f"Expected str but got {type(item)} when trying to access rule by it's id"
             raise TypeError(msg)
-        for rule in self.rules:
-            if rule.id == item:
-                return rule
+        self._check_caches()
+        if item in self._rules_by_id:
+            return self._rules_by_id[item]
         msg = f"Rule {item} is not present inside this collection."
         raise ValueError(msg)
 
@@ -505,51 +606,14 @@ class RulesCollection:
                     ),
                 ]
 
-        for rule in self.rules:
-            if rule.id == "syntax-check":
-                continue
-
-            is_targeted = any(t.startswith(f"{rule.id}[") for t in tags)
-
-            # rule selection logic
-            if (
-                not tags
-                or rule.has_dynamic_tags
-                or not set(rule.tags).union([rule.id]).isdisjoint(tags)
-                or is_targeted
-            ):
-                # specific tag targeting override
-                if (
-                    tags
-                    and not is_targeted
-                    and set(rule.tags).union(list(rule.ids().keys())).isdisjoint(tags)
-                ):
-                    continue
-
-                # rule-level skip check
-                rule_definition = set(rule.tags) | {rule.id}
-                if rule_definition.isdisjoint(skip_list):
-                    matches.extend(rule.getmatches(file))
+        plan = self.plan(tags, skip_list)
+        for rule in plan.rules:
+            matches.extend(rule.getmatches(file))
+        # tasks are shared only between the rules running on the same file
+        del file.tasks
 
         if tags or skip_list:
-            filtered_matches = []
-            for m in matches:
-                # inclusion logic (if tags are provided)
-                if tags:
-                    if (
-                        m.tag in tags
-                        or m.rule.id in tags
-                        or (
-                            not set(m.rule.tags).isdisjoint(tags)
-                            and not any(t.startswith(f"{m.rule.id}[") for t in tags)
-                        )
-                    ):
-                        filtered_matches.append(m)
-                else:
-                    # no tags requested, so keep everything that wasn't skipped
-                    if m.tag not in skip_list:
-                        filtered_matches.append(m)
-            matches = filtered_matches
+            matches = [m for m in matches if plan.keeps(m)]
 
         return matches
 
@@ -4,14 +4,19 @@ from __future__ import annotations
 
 import atexit
 import contextlib
+import hashlib
 import importlib.util
+import inspect
 import io
 import json
 import logging
+import os
 import re
 import shutil
 import sys
 import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 # pylint: disable=preferred-module
@@ -21,7 +26,11 @@ from unittest.mock import patch
 # pylint: disable=reimported
 import ansible.module_utils.basic as mock_ansible_module
 from ansible.module_utils import basic
+from ansible.module_utils.common.arg_spec import ModuleArgumentSpecValidator
+from ansible.module_utils.errors import UnsupportedError
+from ansible.release import __version__ as ansible_version
 
+from ansiblelint.config import options as default_options
 from ansiblelint.rules import AnsibleLintRule, RulesCollection
 from ansiblelint.text import has_jinja
 from ansiblelint.utils import load_plugin
@@ -97,6 +106,201 @@ class CustomAnsibleModule(basic.AnsibleModule):
         raise ValidationPassedError
 
 
+class ArgumentSpecCapturedError(Exception):
+    """Exception raised once the arguments given to AnsibleModule are captured."""
+
+    def __init__(self, kwargs: dict[str, Any]) -> None:
+        """Keep the captured keyword arguments."""
+        super().__init__()
+        self.kwargs = kwargs
+
+
+class SpecCapturingAnsibleModule:
+    """Mock AnsibleModule class that records the argument spec of a module."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Capture the arguments instead of creating the module."""
+        bound = _ANSIBLE_MODULE_SIGNATURE.bind(
+            self,
+            *args,
+            **kwargs,
+        )
+        bound.apply_defaults()
+        params = bound.arguments
+        argument_spec = dict(params["argument_spec"])
+        if params["add_file_common_args"]:
+            for key, value in getattr(basic, "FILE_COMMON_ARGUMENTS", {}).items():
+                argument_spec.setdefault(key, value)
+        captured = {key: params[key] for key in _VALIDATOR_ARGS}
+        captured["argument_spec"] = argument_spec
+        raise ArgumentSpecCapturedError(captured)
+
+
+@dataclass
+class ModuleSpec:
+    """Arguments used by a module to create its AnsibleModule."""
+
+    has_main: bool = True
+    # None when they could not be captured without the real module arguments
+    kwargs: dict[str, Any] | None = None
+
+
+# Keyword arguments of AnsibleModule that are passed to ModuleArgumentSpecValidator
+_VALIDATOR_ARGS = (
+    "argument_spec",
+    "mutually_exclusive",
+    "required_together",
+    "required_one_of",
+    "required_if",
+    "required_by",
+)
+# Taken before AnsibleModule gets patched by the mock classes
+_ANSIBLE_MODULE_SIGNATURE = inspect.signature(basic.AnsibleModule.__init__)
+# Name used by AnsibleModule inside its validation messages
+_ANSIBLE_MODULE_NAME = Path(basic.__file__).name
+# Bump when the format of the cached argument specs changes
+_SPEC_CACHE_FORMAT = 1
+_module_specs: dict[str, ModuleSpec | None] = {}
+
+
+def _exec_module(loaded_module: PluginLoadContext) -> Any:
+    """Import the module from its source file, or return None if not possible."""
+    if not loaded_module.plugin_resolved_name:
+        return None
+    spec = importlib.util.spec_from_file_location(
+        name=loaded_module.plugin_resolved_name,
+        location=loaded_module.plugin_resolved_path,
+    )
+    if not spec:
+        return None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    previous_module = sys.modules.get(spec.name)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        if previous_module is None:
+            sys.modules.pop(spec.name, None)
+        else:
+            sys.modules[spec.name] = previous_module
+    return module
+
+
+def _run_module_main(module: Any, module_args: dict[str, Any]) -> str:
+    """Run the main function of a module and return its output if it failed."""
+    buffer = io.BytesIO(
+        json.dumps({"ANSIBLE_MODULE_ARGS": clean_json(module_args)}).encode()
+    )
+    failed_msg = ""
+    with (
+        patch.object(sys, "stdin", io.TextIOWrapper(buffer, encoding="utf-8")),
+        patch.object(sys, "argv", [""]),
+    ):
+        fio = io.StringIO()
+        # Warning: avoid running anything while stdout is redirected
+        # as what happens may be very hard to debug.
+        with contextlib.redirect_stdout(fio):
+            # pylint: disable=protected-access
+            basic._ANSIBLE_ARGS = None  # noqa: SLF001
+            try:
+                module.main()
+            except SystemExit:
+                failed_msg = fio.getvalue()
+    return failed_msg
+
+
+def _extract_module_spec(loaded_module: PluginLoadContext) -> ModuleSpec | None:
+    """Run the module once, capturing the arguments of its AnsibleModule."""
+    with mock.patch.object(
+        mock_ansible_module,
+        "AnsibleModule",
+        SpecCapturingAnsibleModule,
+    ):
+        module = _exec_module(loaded_module)
+        if module is None:
+            return None
+        if not hasattr(module, "main"):
+            return ModuleSpec(has_main=False)
+        try:
+            _run_module_main(module, {})
+        except ArgumentSpecCapturedError as exc:
+            return ModuleSpec(kwargs=exc.kwargs)
+        except Exception as exc:  # pylint: disable=broad-exception-caught # noqa: BLE001
+            _logger.debug(
+                "Unable to capture argument spec of %s: %s",
+                loaded_module.resolved_fqcn,
+                exc,
+            )
+    return ModuleSpec()
+
+
+def _validate_module_args(
+    spec_kwargs: dict[str, Any],
+    module_args: dict[str, Any],
+) -> str | None:
+    """Validate module arguments the same way AnsibleModule does."""
+    validator = ModuleArgumentSpecValidator(  # type: ignore[no-untyped-call]
+        *(spec_kwargs[key] for key in _VALIDATOR_ARGS),
+    )
+    # AnsibleModule receives its parameters serialized as JSON
+    result = validator.validate(  # type: ignore[no-untyped-call]
+        json.loads(json.dumps(clean_json(module_args))),
+    )
+    if not result.error_messages:
+        return None
+    message: str = result.errors.msg
+    if isinstance(result.errors[0], UnsupportedError):
+        message = (
+            f"Unsupported parameters for ({_ANSIBLE_MODULE_NAME}) module: {message}"
+        )
+    return message
+
+
+def _spec_cache_file(cache_dir: Path | None, module_path: str) -> Path | None:
+    """Return the file storing the argument spec of a module, if possible."""
+    if not cache_dir:
+        return None
+    try:
+        stat = Path(module_path).stat()
+    except OSError:
+        return None
+    key = hashlib.sha256(
+        f"{_SPEC_CACHE_FORMAT}:{ansible_version}:{module_path}:{stat.st_mtime_ns}:{stat.st_size}".encode(),
+    ).hexdigest()
+    return cache_dir / "args" / f"{key}.json"
+
+
+def _load_cached_spec(cache_file: Path | None) -> ModuleSpec | None:
+    """Load a previously stored argument spec."""
+    if cache_file is None:
+        return None
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        return ModuleSpec(has_main=data["has_main"], kwargs=data["kwargs"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_cached_spec(cache_file: Path | None, module_spec: ModuleSpec) -> None:
+    """Store the argument spec, unless it cannot be represented as JSON."""
+    if cache_file is None or (module_spec.has_main and module_spec.kwargs is None):
+        return
+    try:
+        text = json.dumps(asdict(module_spec))
+    except (TypeError, ValueError):
+        # types or defaults implemented as python objects are kept in memory only
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        Path(tmp_name).replace(cache_file)
+    except OSError as exc:
+        _logger.debug("Unable to store argument spec in %s: %s", cache_file, exc)
+
+
 class ArgsRule(AnsibleLintRule):
     """Validating module arguments."""
 
@@ -120,7 +324,6 @@ class ArgsRule(AnsibleLintRule):
         # pylint: disable=too-many-return-statements
         results: list[MatchError] = []
         module_name = task["action"]["__ansible_module_original__"]
-        failed_msg = None
 
         if module_name in self.module_aliases:
             return []
@@ -170,77 +373,94 @@ class ArgsRule(AnsibleLintRule):
             for key in workarounds_drop_map[loaded_module.resolved_fqcn]:
                 module_args.pop(key, None)
 
+        if not loaded_module.plugin_resolved_name:
+            _logger.warning(
+                "Unable to load module %s at %s:%s for options validation",
+                module_name,
+                file.filename if file else None,
+                task.line,
+            )
+            return []
+        module_spec = self._get_module_spec(loaded_module)
+        if module_spec is None:
+            _logger.warning(
+                "Unable to load module %s at %s:%s for options validation",
+                module_name,
+                file.filename if file else None,
+                task.line,
+            )
+            return []
+        if not module_spec.has_main:
+            # skip validation for module options that are implemented as action plugin
+            # as the option values can be changed in action plugin and are not passed
+            # through `ArgumentSpecValidator` class as in case of modules.
+            return []
+        if module_spec.kwargs is None:
+            # the module does not create its AnsibleModule in a way we can
+            # capture, so we validate its options by running it
+            return self._validate_by_execution(
+                loaded_module,
+                module_args,
+                task,
+                module_name,
+                file,
+            )
+
+        error_message = _validate_module_args(module_spec.kwargs, module_args)
+        if error_message:
+            results.extend(
+                self._parse_error_message(error_message, task, module_name, file),
+            )
+        return self._sanitize_results(results, module_name)
+
+    def _get_module_spec(
+        self,
+        loaded_module: PluginLoadContext,
+    ) -> ModuleSpec | None:
+        """Return the argument spec of the module, extracting it only once."""
+        path = loaded_module.plugin_resolved_path
+        if path is None:
+            return None
+        if path in _module_specs:
+            return _module_specs[path]
+        cache_dir = (
+            self._collection.options.cache_dir
+            if self._collection
+            else default_options.cache_dir
+        )
+        cache_file = _spec_cache_file(cache_dir, path)
+        module_spec = _load_cached_spec(cache_file)
+        if module_spec is None:
+            module_spec = _extract_module_spec(loaded_module)
+            if module_spec is not None:
+                _store_cached_spec(cache_file, module_spec)
+        _module_specs[path] = module_spec
+        return module_spec
+
+    def _validate_by_execution(
+        self,
+        loaded_module: PluginLoadContext,
+        module_args: dict[str, Any],
+        task: Task,
+        module_name: str,
+        file: Lintable | None = None,
+    ) -> list[MatchError]:
+        """Validate module options by running the main function of the module."""
+        results: list[MatchError] = []
         with mock.patch.object(
             mock_ansible_module,
             "AnsibleModule",
             CustomAnsibleModule,
         ):
-            if not loaded_module.plugin_resolved_name:
-                _logger.warning(
-                    "Unable to load module %s at %s:%s for options validation",
-                    module_name,
-                    file.filename if file else None,
-                    task.line,
-                )
-                return []
-            spec = importlib.util.spec_from_file_location(
-                name=loaded_module.plugin_resolved_name,
-                location=loaded_module.plugin_resolved_path,
-            )
-            if not spec:
-                assert file is not None
-                _logger.warning(
-                    "Unable to load module %s at %s:%s for options validation",
-                    module_name,
-                    file.filename,
-                    task.line,
-                )
+            module = _exec_module(loaded_module)
+            if module is None:
                 return []
-            assert spec.loader is not None
-            module = importlib.util.module_from_spec(spec)
-            previous_module = sys.modules.get(spec.name)
-            sys.modules[spec.name] = module
             try:
-                spec.loader.exec_module(module)
-            finally:
-                if previous_module is None:
-                    sys.modules.pop(spec.name, None)
-                else:
-                    sys.modules[spec.name] = previous_module
-
-            try:  # noqa: PLW0717
-                if not hasattr(module, "main"):
-                    # skip validation for module options that are implemented as action plugin
-                    # as the option values can be changed in action plugin and are not passed
-                    # through `ArgumentSpecValidator` class as in case of modules.
-                    return []
-
-                buffer = io.BytesIO(
-                    json.dumps({
-                        "ANSIBLE_MODULE_ARGS": clean_json(module_args)
-                    }).encode()
-                )
-                with (
-                    patch.object(
-                        sys, "stdin", io.TextIOWrapper(buffer, encoding="utf-8")
-                    ),
-                    patch.object(sys, "argv", [""]),
-                ):
-                    fio = io.StringIO()
-                    failed_msg = ""
-                    # Warning: avoid running anything while stdout is redirected
-                    # as what happens may be very hard to debug.
-                    with contextlib.redirect_stdout(fio):
-                        # pylint: disable=protected-access
-                        basic._ANSIBLE_ARGS = None  # noqa: SLF001
-                        try:
-                            module.main()
-                        except SystemExit:
-                            failed_msg = fio.getvalue()
-                    if failed_msg:
-                        results.extend(
-                            self._parse_failed_msg(failed_msg, task, module_name, file),
-                        )
+                failed_msg = _run_module_main(module, module_args)
+                if failed_msg:
+                    results.extend(
+                        self._parse_failed_msg(failed_msg, task, module_name, file),
+                    )
 
                 sanitized_results = self._sanitize_results(results, module_name)
             except ValidationPassedError:
@@ -271,13 +491,22 @@ class ArgsRule(AnsibleLintRule):
         file: Lintable | None = None,
     ) -> list[MatchError]:
         """Parse failed message and return list of MatchError."""
-        results: list[MatchError] = []
         try:
             failed_obj = json.loads(failed_msg)
             error_message = failed_obj["msg"]
         except json.decoder.JSONDecodeError:  # pragma: no cover
             error_message = failed_msg
+        return self._parse_error_message(error_message, task, module_name, file)
 
+    def _parse_error_message(
+        self,
+        error_message: str,
+        task: Task,
+        module_name: str,
+        file: Lintable | None = None,
+    ) -> list[MatchError]:
+        """Return list of MatchError for a validation error message."""
+        results: list[MatchError] = []
         option_type_check_error = self.RE_PATTERN.search(
             error_message,
         )
@@ -401,3 +630,26 @@ if "pytest" in sys.modules:
 
         assert len(results) == 1
         assert "value of default must be one of" in results[0].message
+
+    def test_args_module_spec_cache(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that argument specs are extracted once and stored in cache_dir."""
+        monkeypatch.setattr("ansiblelint.rules.args._module_specs", {})
+        monkeypatch.setattr(default_options, "cache_dir", tmp_path)
+        loaded_module = load_plugin("ansible.builtin.ping")
+
+        # pylint: disable=protected-access
+        module_spec = ArgsRule()._get_module_spec(loaded_module)  # noqa: SLF001
+        assert module_spec is not None
+        assert module_spec.kwargs is not None
+        assert "data" in module_spec.kwargs["argument_spec"]
+        cache_files = list((tmp_path / "args").glob("*.json"))
+        assert len(cache_files) == 1
+        assert _load_cached_spec(cache_files[0]) == module_spec
+
+        assert _validate_module_args(module_spec.kwargs, {"data": "foo"}) is None
+        message = _validate_module_args(module_spec.kwargs, {"data": "foo", "x": 1})
+        assert message is not None
+        assert message.startswith("Unsupported parameters for")
@@ -25,6 +25,7 @@ class AvoidImplicitRule(AnsibleLintRule):
     severity = "MEDIUM"
     tags = ["unpredictability"]
     version_changed = "6.8.0"
+    task_modules = frozenset(["copy"])
 
     def matchtask(
         self,
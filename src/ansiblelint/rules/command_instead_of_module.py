@@ -45,6 +45,7 @@ class CommandsInsteadOfModulesRule(AnsibleLintRule):
     version_changed = "24.10.0"
 
     _commands = ["command", "shell"]
+    task_modules = frozenset(_commands)
     _modules = {
         "apt-get": "apt-get",
         "chkconfig": "service",
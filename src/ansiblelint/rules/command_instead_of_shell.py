@@ -47,6 +47,7 @@ class UseCommandInsteadOfShellRule(AnsibleLintRule, TransformMixin):
     severity = "HIGH"
     tags = ["command-shell", "idiom"]
     version_changed = "6.18.0"
+    task_modules = frozenset(["shell"])
 
     def matchtask(
         self,
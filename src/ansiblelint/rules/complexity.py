@@ -86,17 +86,7 @@ class ComplexityRule(AnsibleLintRule):
         # Only check total task count for task files and handler files
         # Playbooks use the complexity[play] check instead
         if file.kind in ["handlers", "tasks"]:
-            # pylint: disable=import-outside-toplevel
-            from ansiblelint.utils import task_in_list
-
-            task_count = sum(
-                1
-                for _ in task_in_list(
-                    data=file.data,
-                    file=file,
-                    kind=file.kind,
-                )
-            )
+            task_count = len(file.tasks)
 
             # Check if total task count exceeds limit
             if task_count > self._collection.options.max_tasks:
@@ -69,6 +69,7 @@ class DeprecatedModuleRule(AnsibleLintRule):
         "win_msi",
         "include",
     ]
+    task_modules = frozenset(_modules)
 
     def matchtask(
         self,
@@ -39,6 +39,7 @@ class EnvVarsInCommandRule(AnsibleLintRule):
     severity = "VERY_HIGH"
     tags = ["command-shell", "idiom"]
     version_changed = "5.0.11"
+    task_modules = frozenset(["command"])
 
     expected_args = [
         "argv",
@@ -27,7 +27,6 @@ from ansiblelint.text import has_jinja
 from ansiblelint.types import AnsibleTemplateSyntaxError
 from ansiblelint.utils import (  # type: ignore[attr-defined]
     Templar,
-    parse_yaml_from_file,
     template,
 )
 from ansiblelint.yaml_utils import deannotate, nested_items_path
@@ -274,7 +273,7 @@ class JinjaRule(AnsibleLintRule, TransformMixin):
         results: list[MatchError] = []
 
         if str(file.kind) == "vars":
-            data = parse_yaml_from_file(str(file.path))
+            data = file.document.decrypted
             if not isinstance(data, Mapping):
                 return results
             for key, v, _path in nested_items_path(data):
@@ -299,7 +298,7 @@ class JinjaRule(AnsibleLintRule, TransformMixin):
                             ),
                         )
             if raw_results:
-                lines = file.content.splitlines()
+                lines = file.document.lines
                 for match in raw_results:
                     # lineno starts with 1, not zero
                     skip_list = get_rule_skips_from_line(
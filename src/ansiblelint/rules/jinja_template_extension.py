@@ -29,6 +29,7 @@ class JinjaTemplateExtensionRule(AnsibleLintRule):
         "ansible.legacy.template",
         "template",
     )
+    task_modules = frozenset(_template_modules)
 
     def matchtask(
         self,
@@ -23,6 +23,7 @@ class LatestRule(AnsibleLintRule):
     severity = "MEDIUM"
     tags = ["idempotency"]
     version_changed = "6.5.2"
+    task_modules = frozenset(["git", "hg"])
     _ids = {
         "latest[git]": "Use a commit hash or tag instead of 'latest' for git",
         "latest[hg]": "Use a commit hash or tag instead of 'latest' for hg",
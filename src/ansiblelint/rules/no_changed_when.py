@@ -52,6 +52,7 @@ class CommandHasChangesCheckRule(AnsibleLintRule):
         "shell",
         "raw",
     ]
+    task_modules = frozenset(_commands)
 
     def matchtask(
         self,
@@ -26,6 +26,7 @@ class NoPromptingRule(AnsibleLintRule):
     tags = ["opt-in"]
     severity = "VERY_LOW"
     version_changed = "6.0.3"
+    task_modules = frozenset(["pause"])
 
     def matchplay(self, file: Lintable, data: dict[str, Any]) -> list[MatchError]:
         """Return matches found for a specific playbook."""
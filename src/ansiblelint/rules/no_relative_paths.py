@@ -30,6 +30,7 @@ class RoleRelativePath(AnsibleLintRule):
         "template": "templates",
         "win_template": "win_templates",
     }
+    task_modules = frozenset(_module_to_path_folder)
 
     def matchtask(
         self,
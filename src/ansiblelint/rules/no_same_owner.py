@@ -27,6 +27,7 @@ should not be preserved when transferring files between them.
     severity = "LOW"
     tags = ["opt-in"]
     version_changed = "6.4.0"
+    task_modules = frozenset(["synchronize", "ansible.posix.synchronize", "unarchive"])
     RE_ARCHIVES = re.compile(r"^.*\.tar(\.(gz|bz2|xz))?$")
 
     def matchtask(
@@ -70,6 +70,7 @@ class PackageIsNotLatestRule(AnsibleLintRule):
         "yum",
         "zypper",
     ]
+    task_modules = frozenset(_package_managers)
 
     def matchtask(
         self,
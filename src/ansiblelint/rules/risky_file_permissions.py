@@ -86,6 +86,7 @@ class MissingFilePermissionsRule(AnsibleLintRule):
 
     _modules = _MODULES
     _modules_with_create = _MODULES_WITH_CREATE
+    task_modules = frozenset(_MODULES | _MODULES_WITH_CREATE.keys())
 
     # pylint: disable=too-many-return-statements
     def matchtask(
@@ -56,6 +56,7 @@ class OctalPermissionsRule(AnsibleLintRule):
         "template",
         "unarchive",
     ]
+    task_modules = frozenset(_modules)
 
     @staticmethod
     def is_invalid_permission(mode: int) -> bool:
@@ -29,6 +29,7 @@ class ShellWithoutPipefail(AnsibleLintRule):
     severity = "MEDIUM"
     tags = ["command-shell"]
     version_changed = "4.1.0"
+    task_modules = frozenset(["shell"])
 
     _pipefail_re = re.compile(r"^\s*set.*[+-][A-Za-z]*o\s*pipefail", re.MULTILINE)
     _pipe_re = re.compile(r"(?<!\|)\|(?!\|)")
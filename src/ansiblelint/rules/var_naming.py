@@ -20,7 +20,6 @@ from ansiblelint.rules import AnsibleLintRule, RulesCollection
 from ansiblelint.runner import Runner
 from ansiblelint.skip_utils import get_rule_skips_from_line
 from ansiblelint.text import has_jinja, is_fqcn, is_fqcn_or_name
-from ansiblelint.utils import parse_yaml_from_file
 
 if TYPE_CHECKING:
     from ansiblelint.app import App
@@ -311,7 +310,7 @@ class VariableNamingRule(AnsibleLintRule):
         raw_results: list[MatchError] = []
 
         if str(file.kind) == "vars" and file.data:
-            meta_data = parse_yaml_from_file(str(file.path))
+            meta_data = file.document.decrypted
             if not isinstance(meta_data, dict):
                 msg = f"Content if vars file {file} is not a dictionary."
                 raise TypeError(msg)
@@ -326,7 +325,7 @@ class VariableNamingRule(AnsibleLintRule):
                     match_error.message += f" (vars: {key})"
                     raw_results.append(match_error)
             if raw_results:
-                lines = file.content.splitlines()
+                lines = file.document.lines
                 for match in raw_results:
                     # lineno starts with 1, not zero
                     skip_list = get_rule_skips_from_line(
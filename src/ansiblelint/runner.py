@@ -10,14 +10,16 @@ import math
 import multiprocessing
 import multiprocessing.pool
 import os
+import pickle  # noqa: S403
 import re
-import subprocess
+import sys
 import tempfile
 import warnings
-from dataclasses import dataclass
-from fnmatch import fnmatch
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, fields
+from fnmatch import translate as fnmatch_translate
 from functools import cache
-from pathlib import Path
+from pathlib import Path, PurePath
 from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING, Any
 
@@ -30,16 +32,24 @@ from yaml.parser import ParserError
 from yaml.scanner import ScannerError
 
 import ansiblelint.utils
-from ansiblelint.constants import States
+from ansiblelint import rule_profile, timings
+from ansiblelint.config import options as default_options
+from ansiblelint.constants import RC, States
+from ansiblelint.dependency_graph import PARENT_KINDS, DependencyGraph, node_key
 from ansiblelint.errors import LintWarning, MatchError, WarnSource
 from ansiblelint.file_utils import (
     Lintable,
+    LintableRegistry,
     expand_dirs_in_lintables,
     expand_paths_vars,
+    get_changed_files,
     normpath,
 )
 from ansiblelint.logger import timed_info
+from ansiblelint.result_cache import CachedResult, ResultCache, plugin_state
+from ansiblelint.result_cache import fingerprint as result_cache_fingerprint
 from ansiblelint.rules.syntax_check import OUTPUT_PATTERNS
+from ansiblelint.syntax_check_server import syntax_check_servers
 from ansiblelint.text import strip_ansi_escape
 from ansiblelint.types import (  # pyright: ignore[reportAttributeAccessIssue]
     AnsibleJSON,
@@ -54,16 +64,25 @@ from ansiblelint.utils import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Iterator
+    from multiprocessing.pool import AsyncResult
 
     from ansiblelint._internal.rules import BaseRule
     from ansiblelint.app import App
     from ansiblelint.config import Options
     from ansiblelint.constants import FileType
+    from ansiblelint.errors import RuleMatchTransformMeta
     from ansiblelint.rules import RulesCollection
+    from ansiblelint.utils import Task
 
 _logger = logging.getLogger(__name__)
 
+# Rules, lintables and their matches cannot be pickled, so the rule workers
+# inherit them from the parent process when forked.
+_rules_worker_state: (
+    tuple[RulesCollection, list[Lintable], set[str], list[str]] | None
+) = None
+
 
 @dataclass
 class LintResult:
@@ -73,6 +92,183 @@ class LintResult:
     files: set[Lintable]
 
 
+# fields of _MatchRecord that are never stored inside the result cache
+_UNCACHED_MATCH_FIELDS = frozenset(("rule_class", "transform_meta", "task"))
+
+
+@dataclass
+class _MatchRecord:  # pylint: disable=too-many-instance-attributes
+    """Picklable representation of a match found by a rules worker."""
+
+    rule_id: str
+    # only needed when the rule is not part of the collection
+    rule_class: type[BaseRule] | None
+    filename: str
+    lintable_name: str
+    lintable_kind: FileType | None
+    message: str
+    tag: str
+    lineno: int
+    column: int | None
+    details: str
+    ignored: bool
+    fixed: bool
+    transform_meta: RuleMatchTransformMeta | None
+    match_type: str | None
+    yaml_path: list[int | str]
+    task: Task | None
+
+
+@dataclass
+class _WarningRecord:
+    """Picklable representation of a warning raised inside a rules worker."""
+
+    message: str
+    category: type[Warning]
+    filename: str
+    lineno: int
+    source: Any = None
+    # (filename, lineno, tag, message) of a WarnSource
+    warn_source: tuple[str, int, str, str | None] | None = None
+
+
+@dataclass
+class _RulesWorkerResult:
+    """Outcome of running the rules on a single lintable inside a worker."""
+
+    matches: list[_MatchRecord] = field(default_factory=list)
+    line_skips: dict[int, set[str]] = field(default_factory=dict)
+    warnings: list[_WarningRecord] = field(default_factory=list)
+    mock_filters: list[str] = field(default_factory=list)
+    profile: rule_profile.RuleProfile | None = None
+
+
+class _ExcludeMatcher:
+    """Exclusion patterns compiled once, with the decisions memoized per path.
+
+    A path is excluded when it starts with one of the patterns, when
+    ``PurePath.match`` or ``fnmatch`` accept it, like when the patterns are
+    tried one by one.
+    """
+
+    # separates the parts of a path, as it cannot be part of a file name
+    _SEP = "\x00"
+
+    def __init__(self, patterns: list[str]) -> None:
+        """Compile the exclusion patterns."""
+        self._prefixes = tuple(patterns)
+        self._fnmatch = (
+            re.compile("|".join(fnmatch_translate(p) for p in patterns))
+            if patterns
+            else None
+        )
+        # PurePath.match compares the last parts of the path with the parts of
+        # relative patterns, and all the parts for absolute patterns.
+        relative: dict[int, list[str]] = defaultdict(list)
+        absolute: dict[int, list[str]] = defaultdict(list)
+        for pattern in patterns:
+            parts = PurePath(pattern).parts
+            if not parts:
+                continue
+            if parts[0] == "/":
+                absolute[len(parts)].append(self._translate_parts(parts[1:]))
+            else:
+                relative[len(parts)].append(self._translate_parts(parts))
+        self._relative = {n: re.compile("|".join(x)) for n, x in relative.items()}
+        self._absolute = {n: re.compile("|".join(x)) for n, x in absolute.items()}
+        self._decisions: dict[tuple[str, str, str], bool] = {}
+
+    @classmethod
+    def _translate_parts(cls, parts: tuple[str, ...]) -> str:
+        """Return the regex matching the joined parts, each being a glob."""
+        # fnmatch patterns end with \Z, which is only kept for the last part
+        return (
+            cls._SEP.join(fnmatch_translate(p).removesuffix(r"\Z") for p in parts)
+            + r"\Z"
+        )
+
+    def _match_parts(self, path: PurePath) -> bool:
+        """Return true if PurePath.match accepts one of the patterns."""
+        parts = path.parts
+        for n, regex in self._relative.items():
+            if n <= len(parts) and regex.match(self._SEP.join(parts[-n:])):
+                return True
+        if parts and parts[0] == "/":
+            absolute = self._absolute.get(len(parts))
+            if absolute and absolute.match(self._SEP.join(parts[1:])):
+                return True
+        return False
+
+    def match_abspath(self, abs_path: str) -> bool:
+        """Return true if an absolute path is matched as prefix or by fnmatch."""
+        return abs_path.startswith(self._prefixes) or bool(
+            self._fnmatch and self._fnmatch.match(abs_path),
+        )
+
+    def match(self, abs_path: str, path: PurePath, name: str) -> bool:
+        """Return true if any pattern excludes the file."""
+        key = (abs_path, str(path), name)
+        decision = self._decisions.get(key)
+        if decision is None:
+            decision = (
+                self.match_abspath(abs_path)
+                or self._match_parts(path)
+                or bool(self._fnmatch and self._fnmatch.match(name))
+            )
+            self._decisions[key] = decision
+        return decision
+
+
+class _RulesPipeline:
+    """Rule workers running while the syntax checks are still in progress.
+
+    The workers are forked before the syntax check threads start, so they
+    inherit the rules and lintables like the ones of ``_run_rules_in_workers``.
+    Results are only used for the files still selected for linting once the
+    syntax checks and the discovery of children completed, so the files found
+    as failed in the meantime are never reported. They are all dropped if the
+    discovery of children registered plugins the workers could not see.
+    """
+
+    def __init__(self, runner: Runner, files: list[Lintable], jobs: int) -> None:
+        """Fork the workers, able to run the rules on any of the given files."""
+        global _rules_worker_state  # pylint: disable=global-statement
+        self._index = {file: index for index, file in enumerate(files)}
+        self._results: dict[Lintable, AsyncResult[_RulesWorkerResult]] = {}
+        self._closed = False
+        self.plugin_state = plugin_state()
+        # kept while the pool lives, in case it has to replace a worker
+        _rules_worker_state = (runner.rules, files, set(runner.tags), runner.skip_list)
+        try:
+            self._pool = multiprocessing.get_context("fork").Pool(processes=jobs)
+        except BaseException:
+            _rules_worker_state = None
+            raise
+
+    def submit(self, file: Lintable) -> None:
+        """Start running the rules on a file."""
+        if file in self._index and file not in self._results:
+            self._results[file] = self._pool.apply_async(
+                _rules_worker,
+                (self._index[file],),
+            )
+
+    def result(self, file: Lintable) -> _RulesWorkerResult | None:
+        """Wait for the results of a file, or return None if it was not submitted."""
+        result = self._results.get(file)
+        return result.get() if result else None
+
+    def close(self) -> None:
+        """Stop the workers, abandoning the results that were not collected."""
+        global _rules_worker_state  # pylint: disable=global-statement
+        if not self._closed:
+            self._closed = True
+            self._pool.terminate()
+            self._pool.join()
+            self._results.clear()
+            _rules_worker_state = None
+
+
 class Runner:
     """Runner class performs the linting process."""
 
@@ -87,11 +283,17 @@ class Runner:
         verbosity: int = 0,
         checked_files: set[Lintable] | None = None,
         project_dir: str | None = None,
+        jobs: int = 1,
         _skip_ansible_syntax_check: bool = False,
     ) -> None:
         """Initialize a Runner instance."""
         self.rules = rules
+        self.jobs = jobs
         self.lintables: set[Lintable] = set()
+        # all lintables of the run, so each file is represented by one instance
+        self.registry = LintableRegistry()
+        # warnings of the rules that were captured to decide their caching
+        self._rule_warnings: list[warnings.WarningMessage] = []
         self.project_dir = os.path.abspath(project_dir) if project_dir else None
         self.skip_ansible_syntax_check = _skip_ansible_syntax_check
 
@@ -108,8 +310,10 @@ class Runner:
         # Assure consistent type and configure given lintables as explicit (so
         # excludes paths would not apply on them).
         for item in lintables:
-            if not isinstance(item, Lintable):
-                item = Lintable(item)
+            if isinstance(item, Lintable):
+                item = self.registry.add(item)
+            else:
+                item = self.registry.get(item)
             item.explicit = True
             self.lintables.add(item)
 
@@ -119,6 +323,7 @@ class Runner:
             expanded = list(self.lintables)
             extend_with_roles(expanded)
             self.lintables.update(expanded)
+        self.lintables = {self.registry.add(item) for item in self.lintables}
 
         self.tags = tags
         self.skip_list = skip_list
@@ -129,6 +334,9 @@ class Runner:
         self.checked_files = checked_files
 
         self.app = self.rules.app
+        # plugin folders already registered, by directory
+        self._plugin_dirs: dict[Path, str] = {}
+        self._handlers: HandleChildren | None = None
 
     def _update_exclude_paths(self, exclude_paths: list[str]) -> None:
         if exclude_paths:
@@ -140,13 +348,10 @@ class Runner:
             self.exclude_paths = paths + [os.path.abspath(p) for p in paths]
         else:
             self.exclude_paths = []
+        self._exclude_matcher = _ExcludeMatcher(self.exclude_paths)
 
     def is_excluded(self, lintable: Lintable) -> bool:
         """Verify if a file path should be excluded."""
-        # Any will short-circuit as soon as something returns True, but will
-        # be poor performance for the case where the path under question is
-        # not excluded.
-
         # Exclusions should be evaluated only using absolute paths in order
         # to work correctly.
 
@@ -162,13 +367,7 @@ class Runner:
             )
             return True
 
-        return any(
-            abs_path.startswith(path)
-            or lintable.path.match(path)
-            or fnmatch(str(abs_path), path)
-            or fnmatch(str(lintable), path)
-            for path in self.exclude_paths
-        )
+        return self._exclude_matcher.match(abs_path, lintable.path, str(lintable))
 
     def run(self) -> list[MatchError]:
         """Execute the linting process."""
@@ -176,6 +375,8 @@ class Runner:
         with warnings.catch_warnings(record=True) as captured_warnings:
             warnings.simplefilter("always")
             matches = self._run()
+            captured_warnings.extend(self._rule_warnings)
+            self._rule_warnings.clear()
             for warn in captured_warnings:
                 # Silence Ansible runtime warnings that are unactionable
                 # https://github.com/ansible/ansible-lint/issues/3216
@@ -195,7 +396,9 @@ class Runner:
                         match = MatchError(
                             message=warn.source.message or warn.category.__name__,
                             rule=self.rules["warning"],
-                            lintable=Lintable(warn.source.filename.filename),
+                            lintable=self.registry.get(
+                                warn.source.filename.filename,
+                            ),
                             tag=warn.source.tag,
                             lineno=warn.source.lineno,
                         )
@@ -218,7 +421,7 @@ class Runner:
                 )
         return sorted(matches)
 
-    def _run(self) -> list[MatchError]:  # noqa: C901
+    def _run(self) -> list[MatchError]:
         """Run the linting (inner loop)."""
         files: list[Lintable] = []
         matches: list[MatchError] = []
@@ -236,11 +439,7 @@ class Runner:
                 # --- NEW LOGIC FOR #4745 ---
                 # Even if it's 'explicit', if it's broken, we check the exclude_paths
                 # one last time before reporting a 'load-failure'.
-                abs_path = str(lintable.abspath)
-                if any(
-                    abs_path.startswith(p) or fnmatch(abs_path, p)
-                    for p in self.exclude_paths
-                ):
+                if self._exclude_matcher.match_abspath(str(lintable.abspath)):
                     self.lintables.remove(lintable)
                     continue
                 # --- END NEW LOGIC ---
@@ -290,96 +489,359 @@ class Runner:
                     ),
                 )
 
-        # -- phase 1 : syntax check in parallel --
-        if not self.skip_ansible_syntax_check:
-
-            def worker(lintable: Lintable) -> list[MatchError]:
-                return self._get_ansible_syntax_check_matches(
-                    lintable=lintable,
-                    app=self.app,
+        cache = self._get_result_cache()
+        pipeline: _RulesPipeline | None = None
+        try:
+            # -- phase 1 : syntax check in parallel --
+            if not self.skip_ansible_syntax_check:
+                for lintable in self.lintables:
+                    if (
+                        lintable.kind not in ("playbook", "role", "pattern")
+                        or lintable.stop_processing
+                    ):
+                        continue
+                    files.append(lintable)
+
+                # rules already start on the files that passed their own check
+                pipeline = self._start_rules_pipeline(files, cache)
+                with timings.phase("syntax_check") as phase:
+                    count = len(matches)
+                    for lintable, data in self._run_syntax_checks(files):
+                        matches.extend(data)
+                        if pipeline and not lintable.failed():
+                            pipeline.submit(lintable)
+                    phase.files = len(files)
+                    phase.matches = len(matches) - count
+
+                matches = self._filter_excluded_matches(matches)
+
+            # -- phase 2 ---
+            # do our processing only when ansible syntax check passed in order
+            # to avoid causing runtime exceptions. Our processing is not as
+            # resilient to be able process garbage.
+            with timings.phase("discover_children") as phase:
+                matches.extend(
+                    self._emit_matches([file for file in files if not file.failed()])
+                )
+                phase.files = len(self.lintables)
+            # mark failed failed lintables as stop processing in order to avoid
+            # duplicated errors from further processing of the other rules
+            for match in matches:
+                if match.lintable.failed():
+                    match.lintable.stop_processing = True
+                    for registered in self.registry.find(match.lintable):
+                        registered.stop_processing = True
+            # remove duplicates from files list
+            files = list(dict.fromkeys(files))
+            # sorted in order to get the same sharding across runs
+            lint_files: list[Lintable] = []
+            for file in self._lintables_to_check():
+                _logger.debug(
+                    "Examining %s of type %s",
+                    normpath(file.path),
+                    file.kind,
                 )
+                lint_files.append(file)
+            with timings.phase("run_rules") as phase:
+                rule_matches = self._run_rules(lint_files, cache, pipeline)
+                phase.files = len(lint_files)
+                phase.matches = len(rule_matches)
+            matches.extend(rule_matches)
+        finally:
+            if pipeline:
+                pipeline.close()
 
-            for lintable in self.lintables:
-                if (
-                    lintable.kind not in ("playbook", "role", "pattern")
-                    or lintable.stop_processing
-                ):
+        # update list of checked files
+        self.checked_files.update(self.lintables)
+
+        # remove any matches made inside excluded files
+        matches = self._filter_excluded_matches(matches)
+
+        return sorted(set(matches))
+
+    def _lintables_to_check(self) -> list[Lintable]:
+        """Return the lintables the rules should run on, in a stable order."""
+        return [
+            file
+            for file in sorted(self.lintables, key=lambda x: (x.name, str(x.kind)))
+            if file not in self.checked_files
+            and file.kind
+            and not file.failed()
+            and not file.stop_processing
+        ]
+
+    def _run_syntax_checks(
+        self,
+        files: list[Lintable],
+    ) -> Iterator[tuple[Lintable, list[MatchError]]]:
+        """Run the syntax checks in threads, yielding each result once available."""
+
+        def worker(lintable: Lintable) -> tuple[Lintable, list[MatchError]]:
+            return lintable, self._get_ansible_syntax_check_matches(
+                lintable=lintable,
+                app=self.app,
+            )
+
+        # avoid resource leak warning, https://github.com/python/cpython/issues/90549
+        # pylint: disable=unused-variable
+        with contextlib.suppress(OSError):
+            global_resource = multiprocessing.Semaphore()  # noqa: F841
+
+        # In environments without /dev/shm (e.g., AWS Lambda/CodeBuild),
+        # multiprocessing.pool.ThreadPool fails because it still uses
+        # multiprocessing primitives (locks, queues). Fall back to
+        # concurrent.futures.ThreadPoolExecutor which is a pure threading
+        # implementation that doesn't require shared memory.
+        try:
+            pool = multiprocessing.pool.ThreadPool(processes=threads())
+        except (OSError, FileNotFoundError):
+            _logger.info(
+                "ThreadPool creation failed (likely missing /dev/shm), "
+                "falling back to concurrent.futures.ThreadPoolExecutor"
+            )
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=threads()
+            ) as executor:
+                futures = [executor.submit(worker, file) for file in files]
+                for future in concurrent.futures.as_completed(futures):
+                    yield future.result()
+            return
+        try:
+            yield from pool.imap_unordered(worker, files, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _start_rules_pipeline(
+        self,
+        syntax_check_files: list[Lintable],
+        cache: ResultCache | None,
+    ) -> _RulesPipeline | None:
+        """Start running the rules in forked workers, if there is anything to overlap.
+
+        Files that are not syntax checked are submitted right away, the others
+        when their syntax check passes.
+        """
+        if (
+            self.jobs <= 1
+            or not syntax_check_files
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            return None
+        candidates = [
+            file
+            for file in self._lintables_to_check()
+            if not (cache and cache.contains(file))
+        ]
+        if not candidates:
+            return None
+        try:
+            pipeline = _RulesPipeline(self, candidates, min(self.jobs, len(candidates)))
+        except OSError:
+            return None
+        checked = set(syntax_check_files)
+        for file in candidates:
+            if file not in checked:
+                pipeline.submit(file)
+        return pipeline
+
+    def _run_rules(
+        self,
+        files: list[Lintable],
+        cache: ResultCache | None = None,
+        pipeline: _RulesPipeline | None = None,
+    ) -> list[MatchError]:
+        """Run the rules on given lintables, using worker processes if enabled."""
+        matches: list[MatchError] = []
+        if cache:
+            rules = {rule.id: rule for rule in self.rules.rules}
+            lintables = {(x.name, x.kind): x for x in self.lintables}
+            pending: list[Lintable] = []
+            for file in files:
+                cached = cache.get(file)
+                if cached is None:
+                    pending.append(file)
                     continue
-                files.append(lintable)
-
-            # avoid resource leak warning, https://github.com/python/cpython/issues/90549
-            # pylint: disable=unused-variable
-            with contextlib.suppress(OSError):
-                global_resource = multiprocessing.Semaphore()  # noqa: F841
-
-            # In environments without /dev/shm (e.g., AWS Lambda/CodeBuild),
-            # multiprocessing.pool.ThreadPool fails because it still uses
-            # multiprocessing primitives (locks, queues). Fall back to
-            # concurrent.futures.ThreadPoolExecutor which is a pure threading
-            # implementation that doesn't require shared memory.
+                for lineno, skips in cached.line_skips.items():
+                    file.line_skips[lineno].update(skips)
+                matches.extend(
+                    _load_match(
+                        _MatchRecord(
+                            **entry,
+                            rule_class=None,
+                            transform_meta=None,
+                            task=None,
+                        ),
+                        rules,
+                        lintables,
+                    )
+                    for entry in cached.matches
+                )
+            files = pending
+
+        if pipeline and pipeline.plugin_state != plugin_state():
+            _logger.debug("Plugins changed since the rule workers started")
+            pipeline.close()
+        elif pipeline:
+            # results of the files no longer selected for linting are dropped
+            early = [(file, pipeline.result(file)) for file in files]
+            pipeline.close()
+            files = [file for file, result in early if result is None]
+            matches.extend(
+                self._merge_worker_results(
+                    [(file, result) for file, result in early if result is not None],
+                    cache,
+                ),
+            )
+
+        jobs = min(self.jobs, len(files))
+        # Workers need to inherit the already loaded rules and lintables, which
+        # is only possible when they are forked.
+        if jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
             try:
-                pool = multiprocessing.pool.ThreadPool(processes=threads())
-                return_list = pool.map(worker, files, chunksize=1)
-                pool.close()
-                pool.join()
-            except (OSError, FileNotFoundError):
+                matches.extend(self._run_rules_in_workers(files, jobs, cache))
+                files = []
+            except OSError:
                 _logger.info(
-                    "ThreadPool creation failed (likely missing /dev/shm), "
-                    "falling back to concurrent.futures.ThreadPoolExecutor"
+                    "Process pool creation failed (likely missing /dev/shm), "
+                    "falling back to running rules serially"
                 )
-                with concurrent.futures.ThreadPoolExecutor(
-                    max_workers=threads()
-                ) as executor:
-                    return_list = list(executor.map(worker, files))
-            for data in return_list:
-                matches.extend(data)
-
-            matches = self._filter_excluded_matches(matches)
-
-        # -- phase 2 ---
-        # do our processing only when ansible syntax check passed in order
-        # to avoid causing runtime exceptions. Our processing is not as
-        # resilient to be able process garbage.
-        matches.extend(
-            self._emit_matches([file for file in files if not file.failed()])
-        )
-        # mark failed failed lintables as stop processing in order to avoid
-        # duplicated errors from further processing of the other rules
-        for match in matches:
-            if match.lintable.failed():
-                match.lintable.stop_processing = True
-                # Look into making lintables singletons to avoid having to update them
-                for lintable in self.lintables:
-                    if lintable == match.lintable:
-                        lintable.stop_processing = True
-                        break
-        # remove duplicates from files list
-        files = list(dict.fromkeys(files))
-        for file in self.lintables:
-            if (
-                file in self.checked_files
-                or not file.kind
-                or file.failed()
-                or file.stop_processing
-            ):
-                continue
-            _logger.debug(
-                "Examining %s of type %s",
-                normpath(file.path),
-                file.kind,
-            )
+        for file in files:
+            matches.extend(self._run_rules_on_file(file, cache))
+        if cache:
+            cache.report()
+        return matches
 
-            matches.extend(
-                self.rules.run(file, tags=set(self.tags), skip_list=self.skip_list),
+    def _run_rules_on_file(
+        self,
+        file: Lintable,
+        cache: ResultCache | None,
+    ) -> list[MatchError]:
+        """Run the rules on a lintable, storing the results in the cache."""
+        if cache is None:
+            return self.rules.run(file, tags=set(self.tags), skip_list=self.skip_list)
+        mock_filters = len(default_options.mock_filters)
+        with warnings.catch_warnings(record=True) as captured_warnings:
+            warnings.simplefilter("always")
+            matches = self.rules.run(
+                file, tags=set(self.tags), skip_list=self.skip_list
+            )
+        # reported by run() with the other warnings, instead of emitted again
+        self._rule_warnings.extend(captured_warnings)
+        # results that also produced warnings or side effects are not cached,
+        # as we would not be able to reproduce them
+        if not captured_warnings and len(default_options.mock_filters) == mock_filters:
+            known_rules = {rule.id for rule in self.rules.rules}
+            self._cache_results(
+                cache,
+                file,
+                [_dump_match(match, known_rules, task=False) for match in matches],
             )
+        return matches
+
+    def _get_result_cache(self) -> ResultCache | None:
+        """Return the result cache, unless caching is not possible."""
+        options = self.rules.options
+        # fixing needs the transformation data produced by running the rules
+        if not options.cache_dir or options.write_list:
+            return None
+        return ResultCache(
+            options.cache_dir,
+            result_cache_fingerprint(self.rules, self.tags, self.skip_list),
+            self.rules.app.runtime.config.collections_paths,
+        )
 
-        # update list of checked files
-        self.checked_files.update(self.lintables)
+    @staticmethod
+    def _cache_results(
+        cache: ResultCache,
+        file: Lintable,
+        records: list[_MatchRecord],
+    ) -> None:
+        """Store the results found for a lintable."""
+        if any(
+            record.rule_class is not None or record.transform_meta is not None
+            for record in records
+        ):
+            return
+        cache.put(
+            file,
+            CachedResult(
+                matches=[
+                    {
+                        f.name: getattr(record, f.name)
+                        for f in fields(record)
+                        if f.name not in _UNCACHED_MATCH_FIELDS
+                    }
+                    for record in records
+                ],
+                line_skips={k: sorted(v) for k, v in file.line_skips.items() if v},
+            ),
+        )
 
-        # remove any matches made inside excluded files
-        matches = self._filter_excluded_matches(matches)
+    def _run_rules_in_workers(
+        self,
+        files: list[Lintable],
+        jobs: int,
+        cache: ResultCache | None = None,
+    ) -> list[MatchError]:
+        """Run the rules using a pool of forked processes, one lintable per task."""
+        global _rules_worker_state  # pylint: disable=global-statement
+        _rules_worker_state = (self.rules, files, set(self.tags), self.skip_list)
+        try:
+            with multiprocessing.get_context("fork").Pool(processes=jobs) as pool:
+                results = pool.map(_rules_worker, range(len(files)))
+        finally:
+            _rules_worker_state = None
+        return self._merge_worker_results(list(zip(files, results, strict=True)), cache)
 
-        return sorted(set(matches))
+    def _merge_worker_results(
+        self,
+        results: list[tuple[Lintable, _RulesWorkerResult]],
+        cache: ResultCache | None,
+    ) -> list[MatchError]:
+        """Convert the results of the rule workers back, replaying side effects."""
+        rules = {rule.id: rule for rule in self.rules.rules}
+        lintables = {(x.name, x.kind): x for x in self.lintables}
+        reported_outdated_tags: set[str] = set()
+        profile = rule_profile.active()
+        matches: list[MatchError] = []
+        # results are merged in the same order the files were given
+        for file, result in results:
+            for lineno, skips in result.line_skips.items():
+                file.line_skips[lineno].update(skips)
+            if profile and result.profile:
+                profile.merge(result.profile)
+            matches.extend(
+                _load_match(record, rules, lintables) for record in result.matches
+            )
+            if cache and not result.warnings and not result.mock_filters:
+                self._cache_results(cache, file, result.matches)
+            for mock_filter in result.mock_filters:
+                if mock_filter not in default_options.mock_filters:
+                    default_options.mock_filters.append(mock_filter)
+            for warn in result.warnings:
+                source = warn.source
+                if warn.warn_source:
+                    filename, lineno, tag, message = warn.warn_source
+                    # outdated tags are reported only once per run
+                    if tag == "warning[outdated-tag]":
+                        if warn.message in reported_outdated_tags:
+                            continue
+                        reported_outdated_tags.add(warn.message)
+                    source = WarnSource(
+                        filename=_get_lintable(filename, None, lintables),
+                        lineno=lineno,
+                        tag=tag,
+                        message=message,
+                    )
+                warnings.warn_explicit(
+                    message=warn.message,
+                    category=warn.category,
+                    filename=warn.filename,
+                    lineno=warn.lineno,
+                    source=source,
+                )
+        return matches
 
     # pylint: disable=too-many-locals,too-many-statements
     def _get_ansible_syntax_check_matches(
@@ -447,15 +909,7 @@ class Runner:
             # https://github.com/ansible/ansible-lint/issues/3650
             env["ANSIBLE_INVENTORY_ANY_UNPARSED_IS_FAILED"] = "False"
 
-            run = subprocess.run(  # noqa: S603
-                cmd,
-                stdin=subprocess.PIPE,
-                capture_output=True,
-                shell=False,  # needed when command is a list
-                text=True,
-                check=False,
-                env=env,
-            )
+            run = syntax_check_servers.run(cmd, env=env)
 
         if run.returncode != 0:
             message = None
@@ -491,7 +945,7 @@ class Runner:
                         # avoids creating a new lintable object if the filename
                         # is matching as this might prevent Lintable.failed()
                         # feature from working well.
-                        filename = Lintable(groups["filename"])
+                        filename = self.registry.get(groups["filename"])
                     else:
                         filename = lintable
                     column = int(groups.get("column", 1))
@@ -547,31 +1001,80 @@ class Runner:
         ]
 
     def _emit_matches(self, files: list[Lintable]) -> Generator[MatchError, None, None]:
+        graph = self._get_dependency_graph()
+        # each lintable is visited once, children being queued when discovered
+        queue = deque(self.lintables)
         visited: set[Lintable] = set()
-        while visited != self.lintables:
-            for lintable in self.lintables - visited:
-                visited.add(lintable)
-                if lintable.failed():
-                    continue
-                if not lintable.path.exists():
+        while queue:
+            lintable = queue.popleft()
+            if lintable in visited:
+                continue
+            visited.add(lintable)
+            if lintable.failed():
+                continue
+            if not lintable.path.exists():
+                continue
+            try:
+                children = self.find_children(lintable)
+            except MatchError as exc:
+                if not exc.filename:  # pragma: no branch
+                    exc.filename = str(lintable.path)
+                exc.rule = self.rules["load-failure"]
+                yield exc
+                continue
+            except AttributeError:
+                yield MatchError(
+                    lintable=lintable,
+                    rule=self.rules["load-failure"],
+                )
+                continue
+            if graph is not None and lintable.kind in PARENT_KINDS:
+                graph.record(lintable, children)
+            for child in children:
+                if self.is_excluded(child):
                     continue
+                self.lintables.add(child)
+                files.append(child)
+                if child not in visited:
+                    queue.append(child)
+        if graph is not None:
+            graph.save()
+
+    def _get_dependency_graph(self) -> DependencyGraph | None:
+        """Return the graph of includes and imports kept in the cache directory."""
+        cache_dir = self.rules.options.cache_dir
+        return DependencyGraph.load(cache_dir) if cache_dir else None
+
+    def update_dependency_graph(self, graph: DependencyGraph) -> None:
+        """Record the children of the lintables that are missing from the graph."""
+        queue = deque(sorted(self.lintables, key=lambda x: x.name))
+        visited: set[Lintable] = set()
+        while queue:
+            lintable = queue.popleft()
+            if lintable in visited:
+                continue
+            visited.add(lintable)
+            node = graph.nodes.get(node_key(lintable.abspath))
+            if node is not None:
+                children = [self.registry.get(child) for child in node.children]
+            elif lintable.kind in PARENT_KINDS and not lintable.failed():
                 try:
                     children = self.find_children(lintable)
-                    for child in children:
-                        if self.is_excluded(child):
-                            continue
-                        self.lintables.add(child)
-                        files.append(child)
-                except MatchError as exc:
-                    if not exc.filename:  # pragma: no branch
-                        exc.filename = str(lintable.path)
-                    exc.rule = self.rules["load-failure"]
-                    yield exc
-                except AttributeError:
-                    yield MatchError(
-                        lintable=lintable,
-                        rule=self.rules["load-failure"],
-                    )
+                except (MatchError, AttributeError):
+                    continue
+                graph.record(lintable, children)
+            else:
+                continue
+            queue.extend(child for child in children if not self.is_excluded(child))
+
+    def _register_plugin_dirs(self, basedir: Path) -> str:
+        """Register the plugins found next to a playbook once, returning its path."""
+        path = self._plugin_dirs.get(basedir)
+        if path is None:
+            path = str(basedir.resolve())
+            add_all_plugin_dirs(path)  # type: ignore[no-untyped-call]
+            self._plugin_dirs[basedir] = path
+        return path
 
     def find_children(self, lintable: Lintable) -> list[Lintable]:
         """Traverse children of a single file or folder."""
@@ -580,7 +1083,7 @@ class Runner:
             return []
         playbook_dir = str(lintable.path.parent)
         ansiblelint.utils.set_collections_basedir(lintable.path.parent)
-        add_all_plugin_dirs(playbook_dir or ".")  # type: ignore[no-untyped-call]
+        self._register_plugin_dirs(lintable.path.parent)
         if lintable.kind == "role":
             playbook_ds = AnsibleMapping({"roles": [{"role": str(lintable.path)}]})
         elif lintable.kind == "plugin":
@@ -589,7 +1092,7 @@ class Runner:
             return []
         else:
             try:
-                playbook_ds = ansiblelint.utils.parse_yaml_from_file(str(lintable.path))
+                playbook_ds = lintable.document.decrypted
             except AnsibleError as exc:
                 raise MatchError(
                     lintable=lintable, rule=self.rules["load-failure"]
@@ -635,7 +1138,13 @@ class Runner:
         """Flatten the traversed play tasks."""
         # pylint: disable=unused-argument
         basedir = lintable.path.parent
-        handlers = HandleChildren(self.rules, app=self.app)
+        if self._handlers is None:
+            self._handlers = HandleChildren(
+                self.rules,
+                app=self.app,
+                registry=self.registry,
+            )
+        handlers = self._handlers
 
         delegate_map: dict[
             str,
@@ -658,13 +1167,13 @@ class Runner:
             "ansible.builtin.import_tasks": handlers.include_children,
         }
         (k, v) = item
-        add_all_plugin_dirs(str(basedir.resolve()))  # type: ignore[no-untyped-call]
+        resolved_basedir = self._register_plugin_dirs(basedir)
 
         if k in delegate_map and v:
             v = template(
                 basedir,
                 v,
-                {"playbook_dir": PLAYBOOK_DIR or str(basedir.resolve())},
+                {"playbook_dir": PLAYBOOK_DIR or resolved_basedir},
                 fail_on_undefined=False,
             )
             return delegate_map[k](lintable, k, v, parent_type)
@@ -698,6 +1207,129 @@ class Runner:
         return [examples]
 
 
+def _rules_worker(index: int) -> _RulesWorkerResult:
+    """Run the rules on a lintable inside a worker process."""
+    if _rules_worker_state is None:  # pragma: no cover
+        msg = "Rules worker was not initialized."
+        raise RuntimeError(msg)
+    rules, files, tags, skip_list = _rules_worker_state
+    file = files[index]
+    result = _RulesWorkerResult()
+    known_mock_filters = set(default_options.mock_filters)
+    if rule_profile.active():
+        # the timings inherited from the parent process are not sent back
+        result.profile = rule_profile.enable()
+    with warnings.catch_warnings(record=True) as captured_warnings:
+        warnings.simplefilter("always")
+        matches = rules.run(file, tags=tags, skip_list=skip_list)
+
+    known_rules = {rule.id for rule in rules.rules}
+    result.matches = [_dump_match(match, known_rules) for match in matches]
+    result.line_skips = {k: v for k, v in file.line_skips.items() if v}
+    result.mock_filters = [
+        x for x in default_options.mock_filters if x not in known_mock_filters
+    ]
+    for warn in captured_warnings:
+        record = _WarningRecord(
+            message=str(warn.message),
+            category=warn.category,
+            filename=warn.filename,
+            lineno=warn.lineno,
+        )
+        if isinstance(warn.source, WarnSource):
+            record.warn_source = (
+                warn.source.filename.filename,
+                warn.source.lineno,
+                warn.source.tag,
+                warn.source.message,
+            )
+        elif _is_picklable(warn.source):
+            record.source = warn.source
+        result.warnings.append(record)
+    return result
+
+
+def _is_picklable(obj: Any) -> bool:
+    """Return true if the object can be sent to another process."""
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        return False
+    return True
+
+
+def _dump_match(
+    match: MatchError,
+    known_rules: set[str],
+    *,
+    task: bool = True,
+) -> _MatchRecord:
+    """Convert a match into a picklable record."""
+    return _MatchRecord(
+        rule_id=match.rule.id,
+        rule_class=None if match.rule.id in known_rules else type(match.rule),
+        filename=match.filename,
+        lintable_name=match.lintable.name,
+        lintable_kind=match.lintable.kind,
+        message=match.message,
+        tag=match.tag,
+        lineno=match.lineno,
+        column=match.column,
+        details=match.details,
+        ignored=match.ignored,
+        fixed=match.fixed,
+        transform_meta=match.transform_meta,
+        match_type=match.match_type,
+        yaml_path=match.yaml_path,
+        # the task is only informative, so we drop it when it cannot be sent
+        task=match.task if task and _is_picklable(match.task) else None,
+    )
+
+
+def _get_lintable(
+    name: str,
+    kind: FileType | None,
+    lintables: dict[tuple[str, FileType | None], Lintable],
+) -> Lintable:
+    """Return the known lintable with given name, creating it if needed."""
+    if (name, kind) in lintables:
+        return lintables[name, kind]
+    for (known_name, _), lintable in lintables.items():
+        if known_name == name:
+            return lintable
+    return Lintable(name, kind=kind)
+
+
+def _load_match(
+    record: _MatchRecord,
+    rules: dict[str, BaseRule],
+    lintables: dict[tuple[str, FileType | None], Lintable],
+) -> MatchError:
+    """Recreate a match from the record received from a rules worker."""
+    if record.rule_class is not None:
+        rule = record.rule_class()
+    else:
+        rule = rules[record.rule_id]
+    match = MatchError(
+        message=record.message,
+        lintable=_get_lintable(record.lintable_name, record.lintable_kind, lintables),
+        tag=record.tag,
+        details=record.details,
+        column=record.column,
+        rule=rule,
+        ignored=record.ignored,
+        fixed=record.fixed,
+        transform_meta=record.transform_meta,
+    )
+    # line offset was already applied by the worker
+    match.lineno = record.lineno
+    match.filename = record.filename
+    match.match_type = record.match_type
+    match.yaml_path = record.yaml_path
+    match.task = record.task
+    return match
+
+
 @cache
 def threads() -> int:
     """Determine how many threads to use.
@@ -747,6 +1379,57 @@ def threads() -> int:
     return os_cpu_count
 
 
+def get_changed_lintables(rules: RulesCollection, options: Options) -> list[Lintable]:
+    """Return the lintables changed since the configured git reference.
+
+    The playbooks, tasks files and roles including or importing the changed
+    files, even indirectly, are returned too, so they are linted in context.
+    Given lintables are only used for limiting the search to some folders.
+    """
+    ref = str(options.changed_since)
+    changed = get_changed_files(ref)
+    if changed is None:
+        _logger.error("Unable to find the files changed since '%s' using git.", ref)
+        sys.exit(RC.INVALID_CONFIG)
+    lintables = ansiblelint.utils.get_lintables(opts=options)
+    if not changed:
+        return []
+
+    graph = (
+        DependencyGraph.load(options.cache_dir)
+        if options.cache_dir
+        else DependencyGraph()
+    )
+    Runner(
+        *lintables,
+        rules=rules,
+        exclude_paths=options.exclude_paths,
+        project_dir=options.project_dir,
+        _skip_ansible_syntax_check=True,
+    ).update_dependency_graph(graph)
+    graph.save()
+
+    selected = {node_key(path) for path in changed}
+    selected.update(graph.dependents(*changed))
+    results = []
+    for lintable in lintables:
+        key = node_key(lintable.abspath)
+        prefix = key + os.sep
+        # roles are linted when any of their files is
+        if key in selected or (
+            lintable.kind == "role" and any(x.startswith(prefix) for x in selected)
+        ):
+            results.append(lintable)
+    _logger.info(
+        "Linting %d of %d files, as %d files changed since %s.",
+        len(results),
+        len(lintables),
+        len(changed),
+        ref,
+    )
+    return results
+
+
 def get_matches(rules: RulesCollection, options: Options) -> LintResult:
     """Get matches for given rules and options.
 
@@ -754,7 +1437,15 @@ def get_matches(rules: RulesCollection, options: Options) -> LintResult:
     :param options: Options to use for linting.
     :returns: LintResult containing matches and checked files.
     """
-    lintables = ansiblelint.utils.get_lintables(opts=options, args=options.lintables)
+    with timings.phase("discovery") as phase:
+        if options.changed_since:
+            lintables = get_changed_lintables(rules, options)
+        else:
+            lintables = ansiblelint.utils.get_lintables(
+                opts=options,
+                args=options.lintables,
+            )
+        phase.files = len(lintables)
 
     for rule in rules:
         if "unskippable" in rule.tags:
@@ -773,6 +1464,7 @@ def get_matches(rules: RulesCollection, options: Options) -> LintResult:
         verbosity=options.verbosity,
         checked_files=checked_files,
         project_dir=options.project_dir,
+        jobs=options.jobs or threads(),
         _skip_ansible_syntax_check=options._skip_ansible_syntax_check,  # noqa: SLF001
     )
     matches.extend(runner.run())
@@ -15,6 +15,9 @@ from typing import Any
 from urllib.error import HTTPError
 from urllib.request import Request
 
+from jsonschema import Draft202012Validator
+from jsonschema.protocols import Validator
+
 _logger = logging.getLogger(__package__)
 
 # Maps kinds to JSON schemas
@@ -42,7 +45,18 @@ def get_schema(kind: str) -> Any:
         return json.load(f)
 
 
+class ValidatorCacheDict(defaultdict):  # type: ignore[type-arg]
+    """Caching store of validators compiled from the schemas."""
+
+    def __missing__(self, key: str) -> Validator:
+        """Compile the validator on its first use."""
+        value = Draft202012Validator(_schema_cache[key])
+        self[key] = value
+        return value
+
+
 _schema_cache = SchemaCacheDict()
+_validator_cache = ValidatorCacheDict()
 
 
 def _fetch_and_store_schema(
@@ -69,6 +83,7 @@ def _fetch_and_store_schema(
                 os.fsync(f_out.fileno())
                 if kind in _schema_cache:  # pragma: no cover
                     del _schema_cache[kind]
+                _validator_cache.pop(kind, None)
             return changed
     return 0  # pragma: no cover
 
@@ -131,6 +146,7 @@ def refresh_schemas(min_age_seconds: int = 3600 * 24) -> int:
             f_out.write("\n")  # prettier and editors in general
         # clear schema cache
         get_schema.cache_clear()
+        _validator_cache.clear()
     else:
         store_file.touch()
     return changed
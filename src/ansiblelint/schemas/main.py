@@ -2,17 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from typing import TYPE_CHECKING, Any
 
 import yaml
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
 
-from ansiblelint.loaders import yaml_load_safe
-from ansiblelint.schemas.__main__ import JSON_SCHEMAS, _schema_cache
+from ansiblelint.schemas.__main__ import JSON_SCHEMAS, _schema_cache, _validator_cache
 
 _logger = logging.getLogger(__package__)
 
@@ -80,10 +77,11 @@ def _format_validation_message(
 
 def _validate_json_data(
     json_data: Any,
-    schema: dict[Any, Any],
+    kind: str,
 ) -> str | None:
-    """Validate JSON data against schema, return message or None if valid."""
-    validator = Draft202012Validator(schema)
+    """Validate JSON data against the schema of kind, return message or None if valid."""
+    schema = _schema_cache[kind]
+    validator = _validator_cache[kind]
     try:
         error = next(validator.iter_errors(json_data))
     except StopIteration:
@@ -96,13 +94,13 @@ def _validate_json_data(
 def validate_file_schema(file: Lintable) -> list[str]:
     """Return list of JSON validation errors found."""
     schema: dict[Any, Any] = {}
-    if file.kind not in JSON_SCHEMAS:
-        return [f"Unable to find JSON Schema '{file.kind}' for '{file.path}' file."]
+    kind = file.kind
+    if kind is None or kind not in JSON_SCHEMAS:
+        return [f"Unable to find JSON Schema '{kind}' for '{file.path}' file."]
     try:
-        yaml_data = yaml_load_safe(file.content)
-        json_data = json.loads(json.dumps(yaml_data))
-        schema = _schema_cache[file.kind]
-        message = _validate_json_data(json_data, schema)
+        json_data = file.document.json
+        schema = _schema_cache[kind]
+        message = _validate_json_data(json_data, kind)
         if message is None:
             return []
     except yaml.constructor.ConstructorError as exc:
@@ -27,7 +27,6 @@ import logging
 import re
 import warnings
 from collections.abc import Mapping, MutableMapping, Sequence
-from functools import cache
 from itertools import product
 from typing import TYPE_CHECKING, Any
 
@@ -45,6 +44,7 @@ from ansiblelint.constants import (
     SKIPPED_RULES_KEY,
 )
 from ansiblelint.errors import LintWarning, WarnSource
+from ansiblelint.memory_cache import bounded_cache
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -126,12 +126,19 @@ def append_skipped_rules(  # type: ignore[no-any-unimported]
     return yaml_skip
 
 
-@cache
+def _weigh_yaml_text(file_text: str) -> int:
+    """Estimate the memory used by the round-trip data parsed from the text."""
+    # ruamel keeps comments and positions for each node, which makes its
+    # structures a few tens of times larger than the source text.
+    return 32 * len(file_text)
+
+
+@bounded_cache(share=0.9, weigh=_weigh_yaml_text)
 def load_data(file_text: str) -> Any:
     """Parse ``file_text`` as yaml and return parsed structure.
 
-    This is the main culprit for slow performance, each rule asks for loading yaml again and again
-    ideally the ``maxsize`` on the decorator above MUST be great or equal total number of rules
+    Results are kept in a cache bounded by the memory budget, so documents
+    parsed again with the same content are reused.
     :param file_text: raw text to parse
     :return: Parsed yaml
     """
@@ -151,7 +158,7 @@ def _append_skipped_rules(  # type: ignore[no-any-unimported]
 ) -> AnsibleBaseYAMLObject | None:
     # parse file text using 2nd parser library
     try:
-        ruamel_data = load_data(lintable.content)
+        ruamel_data = lintable.document.comments
     except ScannerError as exc:  # pragma: no cover
         _logger.debug(
             "Ignored loading skipped rules from file %s due to: %s",
@@ -265,7 +272,7 @@ def _continue_skip_next_lines(
 ) -> None:
     """When a line only contains a noqa comment (and possibly indentation), add the skip also to the next non-empty line."""
     # If line starts with _noqa_comment_line_re, add next non-empty line to same lintable.line_skips
-    line_content = lintable.content.splitlines()
+    line_content = lintable.document.lines
     for line_no in list(lintable.line_skips.keys()):
         if _noqa_comment_line_re.fullmatch(line_content[line_no - 1]):
             # Find next non-empty line
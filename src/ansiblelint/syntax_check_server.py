@@ -0,0 +1,235 @@
+"""Long-lived workers used for running ansible-playbook syntax checks.
+
+Starting ``ansible-playbook`` for each checked file means paying the cost of
+starting Python and importing ansible-core every time. Instead, we start server
+processes that import ansible-core only once and that fork a child for each
+syntax check received over a pipe. Each child runs the same code as the
+``ansible-playbook`` command line, so its output and return code are identical
+to those of the command we would have executed otherwise.
+
+The server side should not import anything else from ansiblelint, as it runs
+with the environment prepared for ``ansible-playbook``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_logger = logging.getLogger(__name__)
+
+# Unlike ``python -m``, this avoids having the current directory, which is the
+# project being linted, at the start of sys.path.
+_SERVER_CODE = f"""
+import sys
+sys.path.pop(0)
+from {__name__} import main
+main()
+"""
+
+
+class SyntaxCheckServer:
+    """Client side of a syntax check server process."""
+
+    def __init__(self, env: Mapping[str, str]) -> None:
+        """Start a new server process using the given environment."""
+        read_fd, write_fd = os.pipe()
+        try:
+            # Anything printed by the server itself, like warnings displayed
+            # while importing ansible, is discarded, so responses are sent
+            # over a dedicated pipe.
+            self.process = subprocess.Popen(  # noqa: S603
+                [sys.executable, "-c", _SERVER_CODE, str(write_fd)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=dict(env),
+                pass_fds=(write_fd,),
+                text=True,
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        self.responses: IO[str] = os.fdopen(read_fd, encoding="utf-8")
+
+    def run(self, cmd: list[str]) -> subprocess.CompletedProcess[str]:
+        """Execute the ansible-playbook command line inside the server."""
+        if self.process.stdin is None:  # pragma: no cover
+            msg = "Syntax check server is not running."
+            raise OSError(msg)
+        self.process.stdin.write(json.dumps(cmd) + "\n")
+        self.process.stdin.flush()
+        response = self.responses.readline()
+        if not response:
+            msg = f"Syntax check server exited with {self.process.wait()}."
+            raise OSError(msg)
+        result = json.loads(response)
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=result["returncode"],
+            stdout=result["stdout"],
+            stderr=result["stderr"],
+        )
+
+    def close(self) -> None:
+        """Stop the server process."""
+        with contextlib.suppress(OSError):
+            if self.process.stdin:
+                self.process.stdin.close()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:  # pragma: no cover
+            self.process.kill()
+            self.process.wait()
+        self.responses.close()
+
+
+class SyntaxCheckPool:
+    """Pool of syntax check servers, shared by all runners.
+
+    Servers are started on demand, one for each concurrent syntax check, and
+    they are reused for as long as the current directory and the environment
+    remain the same, as these affect how ansible loads its configuration.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._idle: dict[
+            tuple[str, tuple[tuple[str, str], ...]], list[SyntaxCheckServer]
+        ] = {}
+        self._lock = threading.Lock()
+        # fork is needed for isolating the state of each syntax check
+        self.enabled = hasattr(os, "fork")
+
+    def run(
+        self,
+        cmd: list[str],
+        env: Mapping[str, str],
+    ) -> subprocess.CompletedProcess[str]:
+        """Run the syntax check command, preferably using one of the servers."""
+        if self.enabled:
+            key = (str(Path.cwd()), tuple(sorted(env.items())))
+            server = None
+            try:
+                server = self._acquire(key, env)
+                result = server.run(cmd)
+            except OSError as exc:
+                if server:
+                    server.close()
+                # Running the command directly also reports any problem that
+                # prevents ansible from starting, so we do not retry the servers.
+                _logger.warning(
+                    "Syntax check server failed, falling back to running ansible-playbook: %s",
+                    exc,
+                )
+                self.enabled = False
+            else:
+                with self._lock:
+                    self._idle[key].append(server)
+                return result
+        return subprocess.run(  # noqa: S603
+            cmd,
+            stdin=subprocess.PIPE,
+            capture_output=True,
+            shell=False,  # needed when command is a list
+            text=True,
+            check=False,
+            env=dict(env),
+        )
+
+    def _acquire(
+        self,
+        key: tuple[str, tuple[tuple[str, str], ...]],
+        env: Mapping[str, str],
+    ) -> SyntaxCheckServer:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if idle:
+                return idle.pop()
+        return SyntaxCheckServer(env)
+
+    def close(self) -> None:
+        """Stop all idle servers."""
+        with self._lock:
+            servers = [server for idle in self._idle.values() for server in idle]
+            self._idle.clear()
+        for server in servers:
+            server.close()
+
+
+syntax_check_servers = SyntaxCheckPool()
+atexit.register(syntax_check_servers.close)
+
+
+def _execute(cmd: list[str]) -> dict[str, Any]:
+    """Run the command line inside a forked child and collect its outcome."""
+    with (
+        tempfile.TemporaryFile() as stdout,
+        tempfile.TemporaryFile() as stderr,
+    ):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            _child(cmd, stdout.fileno(), stderr.fileno())
+        _, status = os.waitpid(pid, 0)
+        stdout.seek(0)
+        stderr.seek(0)
+        return {
+            "returncode": os.waitstatus_to_exitcode(status),
+            "stdout": stdout.read().decode("utf-8", errors="replace"),
+            "stderr": stderr.read().decode("utf-8", errors="replace"),
+        }
+
+
+def _child(cmd: list[str], stdout_fd: int, stderr_fd: int) -> None:  # pragma: no cover
+    """Run ansible-playbook inside the forked child, never returning."""
+    returncode = 1
+    try:  # noqa: PLW0717
+        with Path(os.devnull).open(encoding="utf-8") as devnull:
+            os.dup2(devnull.fileno(), 0)
+        os.dup2(stdout_fd, 1)
+        os.dup2(stderr_fd, 2)
+        # pylint: disable=import-outside-toplevel
+        from ansible.cli.playbook import main as ansible_playbook
+
+        sys.argv = [shutil.which(cmd[0]) or cmd[0], *cmd[1:]]
+        ansible_playbook(sys.argv)  # type: ignore[no-untyped-call]
+        returncode = 0
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            returncode = exc.code or 0
+        else:
+            sys.stderr.write(f"{exc.code}\n")
+    except BaseException:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+        traceback.print_exc()
+    finally:
+        with contextlib.suppress(BaseException):
+            sys.stdout.flush()
+            sys.stderr.flush()
+        os._exit(returncode)  # pylint: disable=protected-access
+
+
+def main() -> None:  # pragma: no cover
+    """Serve syntax check requests until the input is closed."""
+    # pylint: disable=import-outside-toplevel,unused-import
+    import ansible.cli.playbook  # noqa: F401
+
+    with os.fdopen(int(sys.argv[1]), "w", encoding="utf-8") as responses:
+        for request in sys.stdin:
+            responses.write(json.dumps(_execute(json.loads(request))) + "\n")
+            responses.flush()
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from functools import cache
+
+from ansiblelint.memory_cache import counted_lru_cache
 
 RE_HAS_JINJA = re.compile(r"{[{%#].*[%#}]}", re.DOTALL)
 RE_HAS_GLOB = re.compile(r"[][*?]")
@@ -11,6 +12,9 @@ RE_IS_FQCN_OR_NAME = re.compile(r"^\w+(\.\w+){2,100}$|^\w+$")
 RE_STRIP_ANSI_ESCAPE = re.compile(r"\x1b[^m]*m")
 RE_TO_IDENTIFIER = re.compile(r"[\s-]+")
 
+# Number of strings remembered by each of the cached string predicates.
+PREDICATE_CACHE_SIZE = 16384
+
 
 def strip_ansi_escape(data: str | bytes) -> str:
     """Remove all ANSI escapes from string or bytes.
@@ -41,25 +45,25 @@ def removeprefix(text: str, prefix: str) -> str:
     return text[:]
 
 
-@cache
+@counted_lru_cache(maxsize=PREDICATE_CACHE_SIZE)
 def has_jinja(value: str) -> bool:
     """Return true if a string seems to contain jinja templating."""
     return bool(isinstance(value, str) and RE_HAS_JINJA.search(value))
 
 
-@cache
+@counted_lru_cache(maxsize=PREDICATE_CACHE_SIZE)
 def has_glob(value: str) -> bool:
     """Return true if a string looks like having a glob pattern."""
     return bool(isinstance(value, str) and RE_HAS_GLOB.search(value))
 
 
-@cache
+@counted_lru_cache(maxsize=PREDICATE_CACHE_SIZE)
 def is_fqcn_or_name(value: str) -> bool:
     """Return true if a string seems to be a module/filter old name or a fully qualified one."""
     return bool(isinstance(value, str) and RE_IS_FQCN_OR_NAME.search(value))
 
 
-@cache
+@counted_lru_cache(maxsize=PREDICATE_CACHE_SIZE)
 def is_fqcn(value: str) -> bool:
     """Return true if a string seems to be a fully qualified collection name."""
     match = RE_IS_FQCN_OR_NAME.search(value)
@@ -0,0 +1,106 @@
+"""Duration of the phases of a run, recorded when ``--timings`` is used.
+
+Each phase records when it started and how long it took, relative to the
+start of the run, the peak resident memory of the process and of its waited
+for children once it ended, and the number of files and matches it handled
+when relevant. Phases can be nested, like the ones of the runner inside the
+discovery of the matches, and are listed in the order they ended.
+"""
+
+from __future__ import annotations
+
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+# Bump when the format of the report changes.
+TIMINGS_FORMAT = 1
+
+
+@dataclass
+class Phase:
+    """A phase of the run."""
+
+    name: str
+    start: float = 0.0  # seconds since the start of the run
+    duration: float = 0.0  # seconds
+    peak_rss: int = 0  # bytes
+    peak_rss_children: int = 0  # bytes, of the largest child process
+    files: int | None = None
+    matches: int | None = None
+
+
+_origin = 0.0
+_phases: list[Phase] | None = None
+
+
+def _peak_rss(who: int) -> int:
+    """Return the peak resident memory, in bytes."""
+    rss = resource.getrusage(who).ru_maxrss
+    # reported in bytes on macOS, in KiB elsewhere
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def enable(origin: float) -> None:
+    """Start recording phases, for a run started at given performance counter."""
+    global _origin, _phases  # pylint: disable=global-statement
+    _origin = origin
+    _phases = []
+
+
+def add(name: str, start: float, **counts: int) -> Phase | None:
+    """Record a phase started at given performance counter and ending now."""
+    if _phases is None:
+        return None
+    end = time.perf_counter()
+    record = Phase(
+        name=name,
+        start=start - _origin,
+        duration=end - start,
+        peak_rss=_peak_rss(resource.RUSAGE_SELF),
+        peak_rss_children=_peak_rss(resource.RUSAGE_CHILDREN),
+        **counts,
+    )
+    _phases.append(record)
+    return record
+
+
+@contextmanager
+def phase(name: str) -> Generator[Phase, None, None]:
+    """Record the code run inside the context as a phase.
+
+    Counts set on the yielded phase are kept in the report.
+    """
+    record = Phase(name=name)
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        added = add(name, start)
+        if added:
+            added.files = record.files
+            added.matches = record.matches
+
+
+def write(path: Path) -> None:
+    """Store the phases recorded so far as JSON."""
+    if _phases is None:
+        return
+    # pylint: disable=import-outside-toplevel
+    from ansiblelint.version import __version__
+
+    data = {
+        "format": TIMINGS_FORMAT,
+        "version": __version__,
+        "duration": time.perf_counter() - _origin,
+        "phases": [asdict(x) for x in _phases],
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
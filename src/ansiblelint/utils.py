@@ -91,9 +91,21 @@ from ansiblelint.constants import (
     FileType,
 )
 from ansiblelint.errors import MatchError
-from ansiblelint.file_utils import Lintable, discover_lintables, find_role_dir
+from ansiblelint.file_utils import (
+    Lintable,
+    LintableRegistry,
+    discover_lintables,
+    find_role_dir,
+    kinds_from_paths,
+)
+from ansiblelint.memory_cache import counted_lru_cache
 from ansiblelint.skip_utils import is_nested_task
-from ansiblelint.text import has_jinja, is_fqcn, removeprefix
+from ansiblelint.text import (
+    PREDICATE_CACHE_SIZE,
+    has_jinja,
+    is_fqcn,
+    removeprefix,
+)
 from ansiblelint.types import (
     AnsibleBaseYAMLObject,  # pyright: ignore[reportAttributeAccessIssue]
     AnsibleConstructor,  # pyright: ignore[reportAttributeAccessIssue]
@@ -148,8 +160,33 @@ def path_dwim(basedir: str, given: str) -> str:
     return str(dataloader.path_dwim(given))
 
 
+@lru_cache(maxsize=256)
+def _basedir_templar(basedir: Path) -> Templar:
+    """Return the templar shared by all templating done inside a directory."""
+    dataloader = DataLoader()  # type: ignore[no-untyped-call,unused-ignore]
+    dataloader.set_basedir(str(basedir))
+    return Templar(dataloader)
+
+
+def _apply_mock_filters(templar: Templar) -> None:
+    """Register the filters mocked so far inside the templar environment."""
+    if not options.mock_filters:
+        return
+    filters = templar.environment.filters
+    if not hasattr(filters, "_delegatee"):  # pragma: no cover
+        return
+    delegatee = filters._delegatee  # noqa: SLF001 # pyright: ignore[reportAttributeAccessIssue]
+    for name in options.mock_filters:
+        if name not in delegatee:
+            delegatee[name] = mock_filter
+
+
 def ansible_templar(basedir: Path, templatevars: Any) -> Templar:
-    """Create an Ansible Templar using templatevars."""
+    """Return an Ansible Templar using templatevars.
+
+    Templars are reused for the same basedir, keeping the filters already
+    mocked inside their environment.
+    """
     # `basedir` is the directory containing the lintable file.
     # Therefore, for tasks in a role, `basedir` has the form
     # `roles/some_role/tasks`. On the other hand, the search path
@@ -158,9 +195,9 @@ def ansible_templar(basedir: Path, templatevars: Any) -> Templar:
     if basedir.name == "tasks":
         basedir = basedir.parent
 
-    dataloader = DataLoader()  # type: ignore[no-untyped-call,unused-ignore]
-    dataloader.set_basedir(str(basedir))
-    templar = Templar(dataloader, variables=templatevars)
+    templar = _basedir_templar(basedir)
+    templar.available_variables = templatevars or {}
+    _apply_mock_filters(templar)
     return templar
 
 
@@ -179,6 +216,12 @@ def mock_filter(left: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ARG001
     return left
 
 
+_LOOKUP_NAMES = frozenset(("lookup", "query", "q"))
+_LOOKUP_PARSE_ENV = Environment(autoescape=True)
+_RE_LOOKUP_CALL = re.compile(r"\(?(lookup|query|q)\)?\s*\(")
+
+
+@counted_lru_cache(maxsize=PREDICATE_CACHE_SIZE)
 def has_lookup_function_calls(varname: str) -> bool:
     """Check if a template string contains lookup, query, or q function calls using AST parsing.
 
@@ -188,23 +231,26 @@ def has_lookup_function_calls(varname: str) -> bool:
     :param varname: The template string to analyze
     :return: True if lookup functions are found, False otherwise
     """
-    lookup_names = {"lookup", "query", "q"}
-
     try:
-        env = Environment(autoescape=True)
-        ast_tree = env.parse(varname)
+        ast_tree = _LOOKUP_PARSE_ENV.parse(varname)
 
         for node in ast_tree.find_all(nodes.Call):
-            if isinstance(node.node, nodes.Name) and node.node.name in lookup_names:
+            if isinstance(node.node, nodes.Name) and node.node.name in _LOOKUP_NAMES:
                 return True
     except (TemplateSyntaxError, TemplateError, AttributeError):
         # Fallback to regex for edge cases where Jinja2 parsing fails
-        fallback_pattern = re.compile(r"\(?(lookup|query|q)\)?\s*\(")
-        return bool(fallback_pattern.search(varname))
+        return bool(_RE_LOOKUP_CALL.search(varname))
     else:
         return False
 
 
+@cache
+def _ansible_core_skips_lookups() -> bool:
+    """Return true if ansible-core does not allow disabling lookups (2.19+)."""
+    core_version = get_deps_versions()["ansible-core"]
+    return bool(core_version and core_version >= Version("2.19"))
+
+
 def ansible_template(
     basedir: Path,
     varname: Any,
@@ -237,12 +283,10 @@ def ansible_template(
     re_filter_in_err = re.compile(r"Could not load \"(\w+)\"")
     re_valid_filter = re.compile(r"^\w+(\.\w+\.\w+)?$")
     templar = ansible_templar(basedir=basedir, templatevars=templatevars)
-    ansible_core_2_19 = Version("2.19")
-    deps = get_deps_versions()
 
     # Skip lookups for ansible-core >= 2.19; use disable_lookups for older versions
     if has_lookup_function_calls(str(varname)):
-        if deps["ansible-core"] and deps["ansible-core"] >= ansible_core_2_19:
+        if _ansible_core_skips_lookups():
             return varname
         kwargs["disable_lookups"] = True
 
@@ -334,17 +378,32 @@ def playbook_items(pb_data: AnsibleJSON) -> ItemsView:  # type: ignore[type-arg]
     return {}.items()
 
 
+_collections_basedir: str | None = None
+
+
 def set_collections_basedir(basedir: Path) -> None:
     """Set the playbook directory as playbook_paths for the collection loader."""
+    global _collections_basedir  # pylint: disable=global-statement
     # Ansible expects only absolute paths inside `playbook_paths` and will
     # produce weird errors if we use a relative one.
+    path = str(basedir.resolve())
+    # reconfiguring the collection loader is costly, so it is skipped when
+    # the directory did not change
+    if path == _collections_basedir:
+        return
+    _collections_basedir = path
     # https://github.com/psf/black/issues/4519
     # fmt: off
     AnsibleCollectionConfig.playbook_paths = (  # pyright: ignore[reportAttributeAccessIssue]
-        str(basedir.resolve()))
+        path)
     # fmt: on
 
 
+def get_collections_basedir() -> str | None:
+    """Return the playbook directory last given to set_collections_basedir."""
+    return _collections_basedir
+
+
 def template(
     basedir: Path,
     value: Any,
@@ -371,12 +430,128 @@ def template(
     return value
 
 
+class RoleIndex:
+    """Index resolving role references to role folders.
+
+    Candidate folders are tried in the same order ansible-lint always used,
+    but each folder containing candidates is listed once and every
+    resolution is remembered, so repeated references are answered from the
+    index.
+    """
+
+    def __init__(
+        self,
+        roles_paths: Sequence[str],
+        collections_paths: Sequence[str],
+    ) -> None:
+        """Create an empty index for the configured roles and collections paths."""
+        self.roles_paths = [os.path.expanduser(loc) for loc in roles_paths]
+        self.collections_paths = [os.path.expanduser(loc) for loc in collections_paths]
+        self._loader = DataLoader()  # type: ignore[no-untyped-call,unused-ignore]
+        self._subdirs: dict[str, frozenset[str]] = {}
+        self._resolved: dict[tuple[str, str], str | None] = {}
+        self._files: dict[str, list[str]] = {}
+        self._roles: set[str] = set()
+
+    def _dwim(self, basedir: str, given: str) -> str:
+        """Return the same path as path_dwim, without creating a data loader."""
+        self._loader.set_basedir(basedir)
+        return str(self._loader.path_dwim(given))
+
+    def _isdir(self, path: str) -> bool:
+        parent, name = os.path.split(path)
+        if not name:
+            return os.path.isdir(path)
+        subdirs = self._subdirs.get(parent)
+        if subdirs is None:
+            try:
+                with os.scandir(parent) as it:
+                    subdirs = frozenset(entry.name for entry in it if entry.is_dir())
+            except OSError:
+                subdirs = frozenset()
+            self._subdirs[parent] = subdirs
+        return name in subdirs
+
+    def _candidates(self, basedir: str, role: str) -> Iterator[str]:
+        """Yield the possible folders of a role, most specific first."""
+        namespace_name, collection_name, *role_name = parse_fqcn(role)
+        name = role_name[-1]
+        # if included from a playbook
+        yield self._dwim(basedir, os.path.join("roles", name))
+        yield self._dwim(basedir, name)
+        # if included from roles/[role]/meta/main.yml
+        yield self._dwim(basedir, os.path.join("..", "..", "..", "roles", name))
+        yield self._dwim(basedir, os.path.join("..", "..", name))
+        # if checking a role in the current directory
+        yield self._dwim(basedir, os.path.join("..", name))
+        if len(role_name) > 1:
+            # This ignores deeper structures than 1 level
+            yield self._dwim(basedir, os.path.join("roles", *role_name))
+            yield self._dwim(basedir, os.path.join(*role_name))
+            yield self._dwim(basedir, os.path.join("..", "..", *role_name))
+        for loc in self.roles_paths:
+            yield self._dwim(loc, name)
+        if namespace_name and collection_name:
+            for loc in self.collections_paths:
+                yield self._dwim(
+                    loc,
+                    os.path.join(
+                        "ansible_collections",
+                        namespace_name,
+                        collection_name,
+                        "roles",
+                        name,
+                    ),
+                )
+        yield self._dwim(basedir, "")
+
+    def resolve(self, basedir: str, role: str) -> str | None:
+        """Return the folder of a role referenced from given folder."""
+        key = (basedir, role)
+        if key in self._resolved:
+            return self._resolved[key]
+        role_path = next(
+            (path for path in self._candidates(basedir, role) if self._isdir(path)),
+            None,
+        )
+        if role_path and role_path not in self._roles:
+            self._roles.add(role_path)
+            add_all_plugin_dirs(role_path)  # type: ignore[no-untyped-call]
+        self._resolved[key] = role_path
+        return role_path
+
+    def files(self, role_path: str) -> list[str]:
+        """Return the YAML files of a role that can be linted."""
+        files = self._files.get(role_path)
+        if files is None:
+            files = []
+            for kind in ["tasks", "meta", "handlers", "vars", "defaults"]:
+                current_path = os.path.join(role_path, kind)
+                for folder, _, names in os.walk(current_path):
+                    files.extend(
+                        os.path.join(folder, name)
+                        for name in names
+                        if name.lower().endswith((".yml", ".yaml"))
+                    )
+            self._files[role_path] = files
+        return files
+
+
 @dataclass
 class HandleChildren:
     """Parse task, roles and children."""
 
     rules: RulesCollection = field(init=True, repr=False)
     app: App
+    registry: LintableRegistry = field(default_factory=LintableRegistry, repr=False)
+    role_index: RoleIndex = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create the role index used during the run."""
+        self.role_index = RoleIndex(
+            self.app.runtime.config.default_roles_path,
+            self.app.runtime.config.collections_paths,
+        )
 
     def include_children(
         self,
@@ -420,7 +595,7 @@ class HandleChildren:
             basedir = new_basedir
             result = path_dwim(basedir, file)
 
-        return [Lintable(result, kind=parent_type)]
+        return [self.registry.get(result, kind=parent_type)]
 
     def taskshandlers_children(
         self,
@@ -449,6 +624,7 @@ class HandleChildren:
                     basedir,
                     k,
                     parent_type,
+                    self.registry,
                 )
                 results.append(children)
                 continue
@@ -595,7 +771,7 @@ class HandleChildren:
                 # don't lint foreign playbook
                 return []
             else:
-                return [Lintable(possible_path, kind=parent_type)]
+                return [self.registry.get(possible_path, kind=parent_type)]
 
         _logger.error(msg)
         return []
@@ -605,71 +781,10 @@ class HandleChildren:
         if not role_path:  # pragma: no branch
             return []
 
-        results = []
-
-        for kind in ["tasks", "meta", "handlers", "vars", "defaults"]:
-            current_path = os.path.join(role_path, kind)
-            for folder, _, files in os.walk(current_path):
-                for file in files:
-                    file_ignorecase = file.lower()
-                    if file_ignorecase.endswith((".yml", ".yaml")):
-                        results.append(Lintable(os.path.join(folder, file)))
-
-        return results
+        return [self.registry.get(file) for file in self.role_index.files(role_path)]
 
     def _rolepath(self, basedir: str, role: str) -> str | None:
-        role_path = None
-        namespace_name, collection_name, *role_name = parse_fqcn(role)
-
-        possible_paths = [
-            # if included from a playbook
-            path_dwim(basedir, os.path.join("roles", role_name[-1])),
-            path_dwim(basedir, role_name[-1]),
-            # if included from roles/[role]/meta/main.yml
-            path_dwim(basedir, os.path.join("..", "..", "..", "roles", role_name[-1])),
-            path_dwim(basedir, os.path.join("..", "..", role_name[-1])),
-            # if checking a role in the current directory
-            path_dwim(basedir, os.path.join("..", role_name[-1])),
-        ]
-        if len(role_name) > 1:
-            # This ignores deeper structures than 1 level
-            possible_paths.append(path_dwim(basedir, os.path.join("roles", *role_name)))
-            possible_paths.append(path_dwim(basedir, os.path.join(*role_name)))
-            possible_paths.append(
-                path_dwim(basedir, os.path.join("..", "..", *role_name))
-            )
-
-        for loc in self.app.runtime.config.default_roles_path:
-            loc = os.path.expanduser(loc)
-            possible_paths.append(path_dwim(loc, role_name[-1]))
-
-        if namespace_name and collection_name:
-            for loc in self.app.runtime.config.collections_paths:
-                loc = os.path.expanduser(loc)
-                possible_paths.append(
-                    path_dwim(
-                        loc,
-                        os.path.join(
-                            "ansible_collections",
-                            namespace_name,
-                            collection_name,
-                            "roles",
-                            role_name[-1],
-                        ),
-                    ),
-                )
-
-        possible_paths.append(path_dwim(basedir, ""))
-
-        for path_option in possible_paths:  # pragma: no branch
-            if os.path.isdir(path_option):
-                role_path = path_option
-                break
-
-        if role_path:  # pragma: no branch
-            add_all_plugin_dirs(role_path)  # type: ignore[no-untyped-call]
-
-        return role_path
+        return self.role_index.resolve(basedir, role)
 
 
 def _get_task_handler_children_for_tasks_or_playbooks(
@@ -677,6 +792,7 @@ def _get_task_handler_children_for_tasks_or_playbooks(
     basedir: str,
     k: Any,
     parent_type: FileType,
+    registry: LintableRegistry | None = None,
 ) -> Lintable:
     """Try to get children of taskhandler for include/import tasks/playbooks."""
     child_type = k if parent_type == "playbook" else parent_type
@@ -719,7 +835,9 @@ def _get_task_handler_children_for_tasks_or_playbooks(
                     break
                 basedir = new_basedir
                 f = path_dwim(basedir, file_name)
-            return Lintable(f, kind=child_type)
+            if registry is None:
+                return Lintable(f, kind=child_type)
+            return registry.get(f, kind=child_type)
     msg = f"The node contains none of: {', '.join(sorted(INCLUSION_ACTION_NAMES))}"
     raise LookupError(msg)
 
@@ -907,6 +1025,9 @@ class Task(Mapping[str, Any]):
     position:
         The position of the task in the data structure using JSONPath like
         notation (no $ prefix).
+    nested_items_cache:
+        Items of the normalized task already walked by ``nested_items_path``,
+        without ignored keys, shared by all the rules looking at the task.
     """
 
     raw_task: MutableMapping[str, Any]
@@ -919,6 +1040,12 @@ class Task(Mapping[str, Any]):
     error: MatchError | None = None
     position: str = ""
     kind: str = "tasks"
+    nested_items_cache: list[tuple[Any, Any, list[str | int]]] | None = field(
+        init=False,
+        repr=False,
+        compare=False,
+        default=None,
+    )
 
     def __post_init__(self) -> None:
         """Ensures that the task is valid."""
@@ -1162,7 +1289,6 @@ def add_action_type(  # type: ignore[no-any-unimported]
     return results
 
 
-@cache
 def parse_yaml_linenumbers(  # type: ignore[no-any-unimported]
     lintable: Lintable,
 ) -> AnsibleBaseYAMLObject | None:
@@ -1326,9 +1452,13 @@ def get_lintables(
             lintable = Lintable(arg)
             lintables.append(lintable)
     else:
-        for filename in discover_lintables(opts):
-            path = Path(filename)
-            lintables.append(Lintable(path))
+        paths = [Path(filename) for filename in discover_lintables(opts)]
+        for path, (kind, base_kind) in zip(
+            paths,
+            kinds_from_paths(paths),
+            strict=True,
+        ):
+            lintables.append(Lintable(path, kind=kind, base_kind=base_kind))
 
         # stage 2: guess roles from current lintables, as there is no unique
         # file that must be present in any kind of role.
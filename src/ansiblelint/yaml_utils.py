@@ -241,6 +241,23 @@ def nested_items_path(
     data: Mapping[Any, Any] | list[Any]
     if isinstance(data_collection, Task):
         data = data_collection.normalized_task
+        # tasks are walked only once for all the rules looking at them, unless
+        # the raw task is temporarily exposed to the current rule
+        if "__raw_task__" not in data:
+            if data_collection.nested_items_cache is None:
+                data_collection.nested_items_cache = list(
+                    _nested_items_path(data_collection=data, parent_path=[]),
+                )
+            items = data_collection.nested_items_cache
+            if not ignored_keys:
+                yield from items
+                return
+            # keys are only ignored at the top level, with the items below them
+            ignored = set(ignored_keys)
+            for key, value, path in items:
+                if (path[0] if path else key) not in ignored:
+                    yield key, value, path
+            return
     else:
         data = data_collection
     yield from _nested_items_path(
@@ -1,5 +1,6 @@
 """Tests for args rule."""
 
+import os
 import sys
 from pathlib import Path
 from types import ModuleType, SimpleNamespace
@@ -7,8 +8,9 @@ from typing import TYPE_CHECKING, Any, cast
 
 import pytest
 
+from ansiblelint.config import options as default_options
 from ansiblelint.file_utils import Lintable
-from ansiblelint.rules import RulesCollection
+from ansiblelint.rules import RulesCollection, args
 from ansiblelint.rules.args import ArgsRule
 from ansiblelint.runner import Runner
 
@@ -106,3 +108,73 @@ def test_args_module_import_restores_existing_module(
 
     assert results == []
     assert sys.modules[module_name] is existing_module
+
+
+def _write_module(path: Path, option: str) -> None:
+    """Write a module requiring a single option."""
+    path.write_text(
+        "from ansible.module_utils.basic import AnsibleModule\n"
+        "def main():\n"
+        f"    module = AnsibleModule(argument_spec={{'{option}': {{'required': True}}}})\n"
+        "    module.exit_json()\n",
+        encoding="utf-8",
+    )
+
+
+def test_args_module_spec_cache_hit(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Ensure argument specs stored in cache_dir are reused by later runs."""
+    module_path = tmp_path / "module_with_spec.py"
+    _write_module(module_path, "name")
+    loaded_module = SimpleNamespace(
+        plugin_resolved_path=str(module_path),
+        plugin_resolved_name="tmp.module_with_spec",
+        resolved_fqcn="tmp.module_with_spec",
+    )
+    monkeypatch.setattr(args, "_module_specs", {})
+    monkeypatch.setattr(default_options, "cache_dir", tmp_path / "cache")
+    rule = ArgsRule()
+
+    # pylint: disable=protected-access
+    module_spec = rule._get_module_spec(loaded_module)  # type: ignore[arg-type] # noqa: SLF001
+    assert module_spec is not None
+    assert module_spec.kwargs is not None
+    assert list(module_spec.kwargs["argument_spec"]) == ["name"]
+
+    # a new run only reads the spec stored by the previous one
+    monkeypatch.setattr(args, "_module_specs", {})
+    monkeypatch.setattr(
+        args, "_extract_module_spec", lambda _: pytest.fail("spec extracted again")
+    )
+    assert rule._get_module_spec(loaded_module) == module_spec  # type: ignore[arg-type] # noqa: SLF001
+
+
+def test_args_module_spec_cache_invalidation(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Ensure argument specs are extracted again once the module changes."""
+    module_path = tmp_path / "module_with_spec.py"
+    _write_module(module_path, "name")
+    loaded_module = SimpleNamespace(
+        plugin_resolved_path=str(module_path),
+        plugin_resolved_name="tmp.module_with_spec",
+        resolved_fqcn="tmp.module_with_spec",
+    )
+    monkeypatch.setattr(args, "_module_specs", {})
+    monkeypatch.setattr(default_options, "cache_dir", tmp_path / "cache")
+    rule = ArgsRule()
+    # pylint: disable=protected-access
+    rule._get_module_spec(loaded_module)  # type: ignore[arg-type] # noqa: SLF001
+
+    _write_module(module_path, "path")
+    stat = module_path.stat()
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    monkeypatch.setattr(args, "_module_specs", {})
+    module_spec = rule._get_module_spec(loaded_module)  # type: ignore[arg-type] # noqa: SLF001
+    assert module_spec is not None
+    assert module_spec.kwargs is not None
+    assert list(module_spec.kwargs["argument_spec"]) == ["path"]
+    assert len(list((tmp_path / "cache" / "args").glob("*.json"))) == 2
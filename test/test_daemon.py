@@ -0,0 +1,139 @@
+"""Tests for the lint daemon."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansiblelint import daemon
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+def test_socket_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that each directory gets its own socket, unless one is forced."""
+    monkeypatch.delenv(daemon.SOCKET_ENV, raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    first = daemon.socket_path(tmp_path / "a")
+    assert first == daemon.socket_path(tmp_path / "a")
+    assert first != daemon.socket_path(tmp_path / "b")
+    assert first.suffix == ".sock"
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+    assert (
+        daemon.socket_path(tmp_path / "a").parent == tmp_path / "run" / "ansible-lint"
+    )
+
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(tmp_path / "lint.sock"))
+    assert daemon.socket_path(tmp_path / "a") == tmp_path / "lint.sock"
+
+
+def test_check_private_dir(tmp_path: Path) -> None:
+    """Check that the socket directory must only be accessible by current user."""
+    tmp_path.chmod(0o700)
+    daemon.check_private_dir(tmp_path)
+
+    tmp_path.chmod(0o755)
+    with pytest.raises(PermissionError):
+        daemon.check_private_dir(tmp_path)
+
+    (tmp_path / "file").touch(mode=0o700)
+    with pytest.raises(PermissionError):
+        daemon.check_private_dir(tmp_path / "file")
+
+
+def test_watched_state(tmp_path: Path) -> None:
+    """Check that changes to watched files are detected."""
+    state = daemon._watched_state(tmp_path, None)  # noqa: SLF001
+    assert daemon._watched_state(tmp_path, None) == state  # noqa: SLF001
+
+    (tmp_path / "requirements.yml").write_text("collections: []\n", encoding="utf-8")
+    assert daemon._watched_state(tmp_path, None) != state  # noqa: SLF001
+
+
+def test_request_without_daemon(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that the client asks for a fallback when no daemon is running."""
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(tmp_path / "missing.sock"))
+    assert daemon.request(["ansible-lint", "--version"]) is None
+
+
+def test_request_unsafe_socket_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that the client does not connect through a shared directory."""
+    tmp_path.chmod(0o777)
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(tmp_path / "lint.sock"))
+    assert daemon.request(["ansible-lint", "--version"]) is None
+
+
+@pytest.fixture(name="daemon_socket")
+def fixture_daemon_socket(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Path]:
+    """Start a daemon serving the current directory and return its socket."""
+    path = tmp_path / "run" / "lint.sock"
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(path))
+    monkeypatch.setenv("NO_COLOR", "1")
+    with subprocess.Popen(
+        [sys.executable, "-m", "ansiblelint", "--offline", "--daemon"],
+        env=os.environ,
+        stderr=subprocess.DEVNULL,
+    ) as proc:
+        try:
+            deadline = time.monotonic() + 120
+            while not path.exists():
+                assert proc.poll() is None, "daemon exited prematurely"
+                assert time.monotonic() < deadline, "daemon did not start"
+                time.sleep(0.2)
+            yield path
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+def test_daemon_serves_request(
+    daemon_socket: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Check that a request is served by a running daemon."""
+    assert (daemon_socket.parent.stat().st_mode & 0o777) == 0o700
+    argv = ["ansible-lint", "--offline", "examples/playbooks/become.yml"]
+    assert daemon.request(argv) == 0
+    argv = ["ansible-lint", "--offline", "examples/playbooks/example.yml"]
+    assert daemon.request(argv) == 2
+    assert "examples/playbooks/example.yml" in capsys.readouterr().out
+
+    monkeypatch.setenv("ANSIBLE_VERBOSITY", "1")
+    assert daemon.request(argv) is None
+
+
+@pytest.mark.parametrize(
+    "payload",
+    (b"not json\n", b"[1]\n", b'{"argv": "ansible-lint"}\n', b""),
+    ids=("json", "list", "argv", "disconnect"),
+)
+def test_daemon_invalid_request(daemon_socket: Path, payload: bytes) -> None:
+    """Check that an invalid request gets a fallback and the daemon survives it."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(daemon_socket))
+        if payload:
+            client.sendall(payload)
+            reply = json.loads(client.makefile("rb").readline())
+            assert reply["fallback"].startswith("invalid request")
+    argv = ["ansible-lint", "--offline", "examples/playbooks/become.yml"]
+    assert daemon.request(argv) == 0
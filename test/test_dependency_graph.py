@@ -0,0 +1,79 @@
+"""Tests for the dependency graph."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from ansiblelint import dependency_graph
+from ansiblelint.dependency_graph import DependencyGraph, node_key
+from ansiblelint.file_utils import Lintable
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_dependency_graph(tmp_path: Path) -> None:
+    """Check that dependents are found, persisted and invalidated."""
+    playbook = tmp_path / "site.yml"
+    tasks = tmp_path / "tasks" / "main.yml"
+    nested = tmp_path / "tasks" / "nested.yml"
+    tasks.parent.mkdir()
+    playbook.write_text("- hosts: all\n", encoding="utf-8")
+    tasks.write_text("- import_tasks: nested.yml\n", encoding="utf-8")
+    nested.write_text("- debug:\n", encoding="utf-8")
+
+    graph = DependencyGraph(tmp_path / "cache" / "dependencies.json")
+    graph.record(Lintable(playbook, kind="playbook"), [Lintable(tasks, kind="tasks")])
+    graph.record(Lintable(tasks, kind="tasks"), [Lintable(nested, kind="tasks")])
+    assert graph.dependencies(playbook) == [node_key(tasks)]
+    assert graph.dependents(nested) == sorted([node_key(playbook), node_key(tasks)])
+    assert graph.dependents(tasks.parent) == [node_key(playbook)]
+    assert graph.dependents(playbook) == []
+    graph.save()
+
+    # touching a file keeps its dependencies
+    stat = tasks.stat()
+    os.utime(tasks, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    graph = DependencyGraph.load(tmp_path / "cache")
+    assert graph.dependents(nested) == sorted([node_key(playbook), node_key(tasks)])
+
+    # modifying it drops them until it is recorded again
+    tasks.write_text("- debug:\n", encoding="utf-8")
+    graph = DependencyGraph.load(tmp_path / "cache")
+    assert graph.dependents(nested) == []
+    assert graph.dependents(tasks) == [node_key(playbook)]
+
+
+def test_dependency_graph_record_unchanged(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that recording an unchanged file again does not hash it."""
+    playbook = tmp_path / "site.yml"
+    tasks = tmp_path / "tasks.yml"
+    playbook.write_text("- import_playbook: tasks.yml\n", encoding="utf-8")
+    tasks.write_text("- hosts: all\n", encoding="utf-8")
+    hashed: list[str] = []
+    sha256 = dependency_graph._sha256  # noqa: SLF001
+
+    def counting_sha256(path: str) -> str:
+        hashed.append(path)
+        return sha256(path)
+
+    monkeypatch.setattr(dependency_graph, "_sha256", counting_sha256)
+    graph = DependencyGraph()
+    children = [Lintable(tasks, kind="playbook")]
+    graph.record(Lintable(playbook, kind="playbook"), children)
+    graph.record(Lintable(playbook, kind="playbook"), children)
+    assert len(hashed) == 1
+
+    # different children or a modified file are hashed again
+    graph.record(Lintable(playbook, kind="playbook"), [])
+    assert len(hashed) == 2
+    playbook.write_text("- hosts: localhost\n", encoding="utf-8")
+    graph.record(Lintable(playbook, kind="playbook"), [])
+    assert len(hashed) == 3
+    assert graph.dependencies(playbook) == []
@@ -5,6 +5,7 @@ from __future__ import annotations
 import copy
 import logging
 import os
+import subprocess
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -15,6 +16,7 @@ from ansiblelint import cli, file_utils
 from ansiblelint.config import options
 from ansiblelint.file_utils import (
     Lintable,
+    LintableRegistry,
     cwd,
     expand_dirs_in_lintables,
     expand_path_vars,
@@ -113,6 +115,103 @@ def test_discover_lintables_silent(
     )
 
 
+@pytest.mark.parametrize("use_git", (False, True), ids=("walk", "git"))
+def test_get_all_files_gitignore(tmp_path: Path, *, use_git: bool) -> None:
+    """Verify that nested .gitignore files are honoured cumulatively."""
+    if use_git:
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text("*.log\n/top.yml\n", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / ".gitignore").write_text("b.yml\n", encoding="utf-8")
+    for name in ("top.yml", "sub/a.log", "sub/b.yml", "sub/c.yml", "sub/top.yml"):
+        (tmp_path / name).write_text("---\n", encoding="utf-8")
+    (tmp_path / "excluded").mkdir()
+    (tmp_path / "excluded" / "d.yml").write_text("---\n", encoding="utf-8")
+
+    files = file_utils.get_all_files(
+        tmp_path,
+        exclude_paths=["excluded"],
+        use_git=use_git,
+    )
+    assert [file.relative_to(tmp_path).as_posix() for file in files] == [
+        ".gitignore",
+        "sub/.gitignore",
+        "sub/c.yml",
+        "sub/top.yml",
+    ]
+
+
+def test_get_all_files_git_matches_walk(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Verify that listing files with git does not change the result."""
+
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=a", "-c", "user.email=a@b", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    (tmp_path / ".gitignore").write_text("build/\n*.tmp\n", encoding="utf-8")
+    (tmp_path / ".git" / "info" / "exclude").write_text(
+        "secret.yml\n", encoding="utf-8"
+    )
+    for name in ("a.yml", "secret.yml", "forced.tmp", "build/b.yml", "new/c.yml"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text("---\n", encoding="utf-8")
+    (tmp_path / "new" / ".gitignore").write_text("d.yml\n", encoding="utf-8")
+    (tmp_path / "new" / "d.yml").write_text("---\n", encoding="utf-8")
+    git("add", "a.yml", ".gitignore")
+    git("add", "-f", "forced.tmp")
+    git("commit", "-q", "-m", "base")
+    monkeypatch.chdir(tmp_path)
+
+    for path in (Path(), Path("build"), Path("new"), tmp_path):
+        expected = file_utils.get_all_files(path, use_git=False)
+        assert expected
+        assert file_utils.get_all_files(path, use_git=True) == expected
+    assert [str(x) for x in file_utils.get_all_files(Path())] == [
+        ".gitignore",
+        "a.yml",
+        "new/.gitignore",
+        "new/c.yml",
+        "secret.yml",
+    ]
+
+
+def test_get_changed_files(tmp_path: Path) -> None:
+    """Verify that committed, uncommitted and untracked changes are reported."""
+
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=a", "-c", "user.email=a@b", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    for name in ("a.yml", "b.yml", "c.yml"):
+        (tmp_path / name).write_text("---\n", encoding="utf-8")
+    git("add", ".")
+    git("commit", "-q", "-m", "base")
+    git("branch", "base")
+    (tmp_path / "a.yml").write_text("--- {}\n", encoding="utf-8")
+    git("commit", "-q", "-am", "change")
+    (tmp_path / "b.yml").unlink()
+    (tmp_path / "d.yml").write_text("---\n", encoding="utf-8")
+
+    changed = file_utils.get_changed_files("base", tmp_path)
+    assert changed is not None
+    assert sorted(changed) == ["a.yml", "b.yml", "d.yml"]
+    assert file_utils.get_changed_files("missing-ref", tmp_path) is None
+    assert file_utils.get_changed_files("--output=x", tmp_path) is None
+
+
 def test_discover_lintables_umlaut(monkeypatch: MonkeyPatch) -> None:
     """Verify that filenames containing German umlauts are not garbled by the discover_lintables."""
     options = cli.get_config([])
@@ -602,6 +701,93 @@ def test_kind_from_path_outside_project_root(tmp_path: Path) -> None:
     assert kind == "yaml"
 
 
+def test_lintable_lazy_attributes(monkeypatch: MonkeyPatch) -> None:
+    """Verify that attributes derived from the path are computed on first use."""
+    calls: list[Path] = []
+
+    def fake_kind_from_path(path: Path, *, base: bool = False) -> str:
+        calls.append(path)
+        return "text/yaml" if base else "tasks"
+
+    monkeypatch.setattr(file_utils, "kind_from_path", fake_kind_from_path)
+    lintable = Lintable("examples/roles/test-role/tasks/main.yml")
+    assert not calls
+    assert not lintable.__dict__
+
+    assert lintable.kind == "tasks"
+    assert lintable.kind == "tasks"
+    assert len(calls) == 1
+    assert lintable.role == "test-role"
+    assert lintable.parent is not None
+    assert lintable.parent.kind == "role"
+
+    # attributes derived from the original path survive a path change
+    abspath = lintable.abspath
+    lintable.path = Path("/tmp/main.yml")
+    assert lintable.abspath == abspath
+    assert lintable.role == "test-role"
+
+
+def test_lintable_registry() -> None:
+    """Verify that the registry returns a single instance per path and kind."""
+    registry = LintableRegistry()
+    lintable = registry.get("examples/playbooks/become.yml")
+    assert lintable.kind == "playbook"
+    assert registry.get("examples/playbooks/become.yml") is lintable
+    assert registry.get(lintable.abspath) is lintable
+    assert registry.get("examples/playbooks/../playbooks/become.yml") is lintable
+
+    # the kind requested is the key, not the one guessed
+    explicit = registry.get("examples/playbooks/become.yml", kind="playbook")
+    assert explicit is not lintable
+    assert registry.get(lintable.abspath, kind="playbook") is explicit
+    as_yaml = registry.get("examples/playbooks/become.yml", kind="yaml")
+    assert as_yaml is not lintable
+    assert as_yaml is not explicit
+    assert registry.find(as_yaml) == [lintable, explicit, as_yaml]
+
+    duplicate = Lintable("examples/playbooks/become.yml")
+    assert duplicate is not lintable
+    assert registry.find(duplicate)[0] is lintable
+    assert registry.add(duplicate) is lintable
+
+    tasks = Lintable("examples/playbooks/tasks/x.yml", kind="tasks")
+    assert registry.add(tasks) is tasks
+    assert registry.get("examples/playbooks/tasks/x.yml") is tasks
+    assert registry.get("examples/playbooks/tasks/x.yml", kind="tasks") is not tasks
+    assert registry.add(tasks, kind="tasks") is not tasks
+
+
+def test_kinds_from_paths() -> None:
+    """Verify that classifying paths at once matches classifying each of them."""
+    paths = [
+        *file_utils.get_all_files(Path("examples/roles"), use_git=False),
+        Path("examples/playbooks/become.yml"),
+        Path("examples/roles/test-role"),
+        Path("missing.yml"),
+    ]
+    assert file_utils.kinds_from_paths(paths) == [
+        (file_utils.kind_from_path(path), file_utils.kind_from_path(path, base=True))
+        for path in paths
+    ]
+
+
+def test_kind_matcher_priority() -> None:
+    """Verify that the compiled kind matcher keeps the order of the globs."""
+    matcher = file_utils.KindMatcher(
+        [
+            ("tasks", "**/tasks/**/*.{yaml,yml}"),
+            ("playbook", "**/*playbook*.{yml,yaml}"),
+            ("yaml", "**/*.{yaml,yml}"),
+        ],
+    )
+    assert matcher.first("roles/foo/tasks/playbook.yml") == 0
+    assert matcher.first("site-playbook.yaml") == 1
+    assert matcher.first("site-playbook.yaml", 2) == 2
+    assert matcher.first("foo.yml") == 2
+    assert matcher.first("foo.txt") is None
+
+
 def test_find_role_dir_namespace_subdir(tmp_path: Path) -> None:
     """Roles nested under a namespace directory resolve to the role root."""
     role_dir = tmp_path / "roles" / "my_namespace" / "myBadRoleName"
@@ -649,3 +835,17 @@ def test_expand_dirs_in_lintables_relative_paths(tmp_path: Path) -> None:
         )
     finally:
         os.chdir(original_cwd)
+
+
+def test_lintable_document() -> None:
+    """Ensure parsed views are shared until the content changes."""
+    lintable = Lintable("foo.yml", content="---\n- hosts: all  # noqa: name\n")
+    document = lintable.document
+    assert lintable.document is document
+    assert document.json == [{"hosts": "all"}]
+    assert document.json is document.json
+    assert document.lines == ["---", "- hosts: all  # noqa: name"]
+
+    lintable.content = "---\n- hosts: localhost\n"
+    assert lintable.document is not document
+    assert lintable.document.json == [{"hosts": "localhost"}]
@@ -1,5 +1,7 @@
 """Tests for loaders submodule."""
 
+import datetime as dt
+import json
 import os
 import tempfile
 import uuid
@@ -12,6 +14,7 @@ from ansiblelint.loaders import (
     IGNORE_FILE,
     IgnoreRule,
     IgnoreRuleQualifier,
+    json_compatible,
     load_ignore_txt,
 )
 
@@ -156,3 +159,22 @@ def test_load_ignore_txt_invalid_tags(monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.chdir(temporary_directory)
         with pytest.raises(RuntimeError, match="Unable to parse line"):
             load_ignore_txt()
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        pytest.param({"a": [1, 2.5, None, True]}, id="nested"),
+        pytest.param({1: "int", None: "none", False: "bool", 1.5: "float"}, id="keys"),
+        pytest.param(("a", ("b",)), id="tuples"),
+    ),
+)
+def test_json_compatible(data: object) -> None:
+    """Test that json_compatible gives the same result as a JSON round trip."""
+    assert json_compatible(data) == json.loads(json.dumps(data))
+
+
+def test_json_compatible_unsupported_type() -> None:
+    """Test that json_compatible rejects types that JSON cannot represent."""
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        json_compatible({"date": dt.date(2024, 1, 1)})
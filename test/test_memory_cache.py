@@ -0,0 +1,90 @@
+"""Tests for memory_cache module."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ansiblelint.memory_cache import (
+    BoundedCache,
+    counted_lru_cache,
+    log_stats,
+    set_memory_budget,
+)
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def _upper(value: str) -> str:
+    return value.upper()
+
+
+def _length(value: list[int]) -> int:
+    return len(value)
+
+
+def test_bounded_cache_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure least recently used entries are evicted once over budget."""
+    calls: list[str] = []
+
+    def upper(value: str) -> str:
+        calls.append(value)
+        return value.upper()
+
+    monkeypatch.setattr("ansiblelint.memory_cache._memory_budget", 20)
+    cache = BoundedCache(upper, share=0.5, weigh=len)
+
+    assert cache("abcd") == "ABCD"
+    assert cache("efgh") == "EFGH"
+    assert cache("abcd") == "ABCD"
+    assert calls == ["abcd", "efgh"]
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 2, 0)
+
+    # "efgh" is the least recently used entry
+    assert cache("ijkl") == "IJKL"
+    assert cache.evictions == 1
+    assert cache.size == 8
+    assert cache("efgh") == "EFGH"
+    assert calls == ["abcd", "efgh", "ijkl", "efgh"]
+
+    # entries larger than the cache are not stored
+    assert cache("a" * 11) == "A" * 11
+    assert len(cache) == 2
+
+
+def test_bounded_cache_unhashable() -> None:
+    """Ensure unhashable arguments bypass the cache."""
+    cache = BoundedCache(_length, share=1)
+    assert cache([1, 2]) == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_set_memory_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure lowering the budget evicts entries from registered caches."""
+    monkeypatch.setattr("ansiblelint.memory_cache._memory_budget", 100)
+    cache = BoundedCache(_upper, share=1, weigh=len)
+    monkeypatch.setattr("ansiblelint.memory_cache._caches", [cache])
+    cache("abcd")
+    cache("efgh")
+    set_memory_budget(4)
+    assert len(cache) == 1
+    assert cache.evictions == 1
+
+
+def test_counted_lru_cache_stats(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ensure the statistics of lru caches are logged with the bounded ones."""
+    monkeypatch.setattr("ansiblelint.memory_cache._caches", [])
+    monkeypatch.setattr("ansiblelint.memory_cache._lru_caches", [])
+    upper = counted_lru_cache(maxsize=2)(_upper)
+    for value in ("a", "b", "a", "c"):
+        upper(value)
+
+    with caplog.at_level(logging.DEBUG, logger="ansiblelint.memory_cache"):
+        log_stats()
+    assert caplog.messages == [
+        "Cache test.test_memory_cache._upper: 1 hits, 3 misses, 1 evictions, 2 of 2 entries",
+    ]
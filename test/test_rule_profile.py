@@ -0,0 +1,43 @@
+"""Tests for the profiling of rules."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from ansiblelint import rule_profile
+from ansiblelint.file_utils import Lintable
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_rule_profile(tmp_path: Path) -> None:
+    """Check that timings are aggregated and reported."""
+    playbook = Lintable("examples/playbooks/become.yml", kind="playbook")
+    tasks = Lintable("examples/playbooks/tasks/x.yml", kind="tasks")
+    profile = rule_profile.RuleProfile()
+    for _ in range(2):
+        with profile.measure("name", "matchtasks", playbook):
+            pass
+    with profile.measure("name", "matchtasks", tasks):
+        pass
+
+    other = rule_profile.RuleProfile()
+    with other.measure("name", "matchtasks", playbook):
+        pass
+    profile.merge(other)
+
+    assert profile.timings["name", "matchtasks", "playbook"].calls == 3
+    assert profile.timings["name", "matchtasks", "tasks"].calls == 1
+    assert {name for name, _ in profile.slowest_files()} == {
+        playbook.name,
+        tasks.name,
+    }
+    assert "name matchtasks playbook" in profile.render()
+
+    report = tmp_path / "results.profile.json"
+    profile.write(report)
+    data = json.loads(report.read_text(encoding="utf-8"))
+    assert len(data["rules"]) == 2
+    assert len(data["slowest_files"]) == 2
@@ -29,12 +29,13 @@ from typing import TYPE_CHECKING
 import pytest
 
 from ansiblelint.file_utils import Lintable
-from ansiblelint.rules import RulesCollection
+from ansiblelint.rules import AnsibleLintRule, RulesCollection
 from ansiblelint.testing import run_ansible_lint
 
 if TYPE_CHECKING:
     from ansiblelint.app import App
     from ansiblelint.config import Options
+    from ansiblelint.utils import Task
 
 
 @pytest.fixture(name="test_rules_collection")
@@ -134,6 +135,39 @@ def test_skip_non_existent_id(
     assert len(matches) == 4
 
 
+def test_rules_plan(test_rules_collection: RulesCollection) -> None:
+    """Check that rules plans are compiled once and follow rule changes."""
+    plan = test_rules_collection.plan({"test1"}, ["raw-task"])
+    assert plan is test_rules_collection.plan({"test1"}, ["raw-task"])
+    assert [rule.id for rule in plan.rules] == ["TEST0001"]
+
+    rule = test_rules_collection["TEST0001"]
+    test_rules_collection.rules.remove(rule)
+    assert test_rules_collection.plan({"test1"}, ["raw-task"]).rules == []
+    with pytest.raises(ValueError, match="not present"):
+        test_rules_collection["TEST0001"]  # pylint: disable=pointless-statement
+
+
+def test_task_modules() -> None:
+    """Check that rules declaring their modules only see the tasks using them."""
+    seen: list[str] = []
+
+    class ShellRule(AnsibleLintRule):
+        """Record the tasks seen."""
+
+        id = "test-shell"
+        version_changed = "1.0.0"
+        task_modules = frozenset(["shell"])
+
+        def matchtask(self, task: Task, file: Lintable | None = None) -> bool:
+            seen.append(task["action"]["__ansible_module__"])
+            return False
+
+    lintable = Lintable("examples/playbooks/command-check-success.yml")
+    assert ShellRule().matchtasks(lintable) == []
+    assert seen == ["shell"] * 6
+
+
 def test_no_duplicate_rule_ids(app: App) -> None:
     """Check that rules of the collection don't have duplicate IDs."""
     real_rules = RulesCollection(
@@ -21,16 +21,21 @@
 # THE SOFTWARE.
 from __future__ import annotations
 
-from pathlib import Path
+import warnings
+from fnmatch import fnmatch
+from pathlib import Path, PurePath
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from ansiblelint import formatters
+from ansiblelint.errors import LintWarning, WarnSource
 from ansiblelint.file_utils import Lintable
-from ansiblelint.runner import Runner
+from ansiblelint.result_cache import ResultCache
+from ansiblelint.runner import Runner, _ExcludeMatcher, get_changed_lintables
 
 if TYPE_CHECKING:
+    from ansiblelint.errors import MatchError
     from ansiblelint.rules import RulesCollection
 
 LOTS_OF_WARNINGS_PLAYBOOK = Path("examples/playbooks/lots_of_warnings.yml").resolve()
@@ -87,6 +92,59 @@ def test_runner_exclude_paths(default_rules_collection: RulesCollection) -> None
     assert len(matches) == 0
 
 
+def test_runner_registers_plugin_dirs_once(
+    default_rules_collection: RulesCollection,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that child discovery registers each plugin folder only once."""
+    calls: list[str] = []
+    monkeypatch.setattr("ansiblelint.runner.add_all_plugin_dirs", calls.append)
+    runner = Runner(
+        "examples/playbooks/include-import-tasks-in-role.yml",
+        rules=default_rules_collection,
+    )
+    result = runner.run()
+    assert not [match for match in result if match.tag.startswith("syntax-check")]
+    assert len(calls) > 1
+    assert len(calls) == len(set(calls))
+    assert len(runner.lintables) > 1
+
+
+@pytest.mark.parametrize(
+    "path",
+    (
+        "examples/playbooks/deep/empty.yml",
+        "examples/roles/test-role/tasks/main.yml",
+        "/etc/ansible/roles/foo/tasks/main.yml",
+        "tasks/main.yml",
+        "molecule/default/converge.yml",
+    ),
+)
+def test_exclude_matcher(path: str) -> None:
+    """Check that compiled exclusions decide like the patterns tried one by one."""
+    patterns = [
+        "examples/playbooks/deep",
+        "tasks/*.yml",
+        "/etc/ansible/*/foo/tasks/*",
+        "molecule/*",
+        "*.json",
+    ]
+    patterns += [str(Path(pattern).absolute()) for pattern in patterns]
+    matcher = _ExcludeMatcher(patterns)
+    abs_path = str(Path(path).absolute())
+    name = f"{path} (tasks)"
+    expected = any(
+        abs_path.startswith(pattern)
+        or PurePath(path).match(pattern)
+        or fnmatch(abs_path, pattern)
+        or fnmatch(name, pattern)
+        for pattern in patterns
+    )
+    assert matcher.match(abs_path, PurePath(path), name) is expected
+    # the decision is memoized
+    assert matcher.match(abs_path, PurePath(path), name) is expected
+
+
 def test_exclude_paths_ignores_broken_yaml(
     default_rules_collection: RulesCollection,
     tmp_path: Path,
@@ -308,3 +366,154 @@ def test_with_full_path(default_rules_collection: RulesCollection) -> None:
     result = runner.run()
     assert len(result) == 1
     assert result[0].tag == "name[casing]"
+
+
+def test_runner_jobs(default_rules_collection: RulesCollection) -> None:
+    """Ensure that running rules in worker processes gives the same results."""
+    filenames = [
+        "examples/playbooks/common-include-1.yml",
+        "examples/playbooks/become.yml",
+        "examples/playbooks/rule-name-casing.yml",
+        "examples/roles/loop_var_prefix",
+    ]
+    serial = Runner(*filenames, rules=default_rules_collection, jobs=1).run()
+    parallel = Runner(*filenames, rules=default_rules_collection, jobs=2).run()
+
+    assert len(parallel) > 1
+    assert [(x.filename, x.lineno, x.tag, x.message) for x in parallel] == [
+        (x.filename, x.lineno, x.tag, x.message) for x in serial
+    ]
+    assert all(x.lintable.path.exists() for x in parallel)
+
+
+def test_runner_pipeline(default_rules_collection: RulesCollection) -> None:
+    """Ensure that rules started during the syntax checks give the same results."""
+    filenames = [
+        "examples/playbooks/become.yml",
+        "examples/playbooks/syntax-error.yml",
+        "examples/playbooks/rule-name-casing.yml",
+        "examples/roles/loop_var_prefix",
+    ]
+    serial = Runner(*filenames, rules=default_rules_collection, jobs=1).run()
+    pipelined = Runner(*filenames, rules=default_rules_collection, jobs=4).run()
+
+    assert any(x.tag.startswith("syntax-check") for x in pipelined)
+    assert [(x.filename, x.lineno, x.tag, x.message) for x in pipelined] == [
+        (x.filename, x.lineno, x.tag, x.message) for x in serial
+    ]
+
+
+def test_runner_result_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    default_rules_collection: RulesCollection,
+) -> None:
+    """Ensure that results loaded from the cache match the ones of a full run."""
+    filenames = [
+        "examples/playbooks/example.yml",
+        "examples/playbooks/command-check-failure.yml",
+    ]
+    expected = Runner(*filenames, rules=default_rules_collection, jobs=1).run()
+
+    monkeypatch.setattr(default_rules_collection.options, "cache_dir", tmp_path)
+    first = Runner(*filenames, rules=default_rules_collection, jobs=1).run()
+    assert list((tmp_path / "results").glob("*/*.json"))
+    cached = Runner(*filenames, rules=default_rules_collection, jobs=1).run()
+
+    assert len(expected) > 1
+    for result in (first, cached):
+        assert [(x.filename, x.lineno, x.tag, x.message) for x in result] == [
+            (x.filename, x.lineno, x.tag, x.message) for x in expected
+        ]
+
+
+def test_result_cache_plugins(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure that changes to collections or plugin dirs miss the cache."""
+    plugins = tmp_path / "library"
+    plugins.mkdir()
+    collection = tmp_path / "collections" / "ansible_collections" / "ns" / "col"
+    collection.mkdir(parents=True)
+    monkeypatch.setattr(
+        "ansiblelint.result_cache.plugin_state",
+        lambda: (None, ((str(plugins),),)),
+    )
+    lintable = Lintable(tmp_path / "site.yml", content="---\n", kind="playbook")
+
+    def key() -> str | None:
+        # a new cache is used by each run
+        cache = ResultCache(tmp_path / "cache", "x", [str(tmp_path / "collections")])
+        return cache.key(lintable)
+
+    keys = {key(), key()}
+    (plugins / "foo.py").write_text("", encoding="utf-8")
+    keys.add(key())
+    (collection / "MANIFEST.json").write_text("{}", encoding="utf-8")
+    keys.add(key())
+    assert len(keys) == 3
+
+
+def test_runner_result_cache_warnings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    default_rules_collection: RulesCollection,
+) -> None:
+    """Ensure that warnings of rules are reported once when caching results."""
+    run = default_rules_collection.run
+
+    def run_with_warning(file: Lintable, **kwargs: Any) -> list[MatchError]:
+        warnings.warn(
+            "foo",
+            LintWarning,
+            source=WarnSource(file, 1, "warning[foo]", "foo"),
+            stacklevel=1,
+        )
+        return run(file, **kwargs)
+
+    monkeypatch.setattr(default_rules_collection.options, "cache_dir", tmp_path)
+    monkeypatch.setattr(default_rules_collection, "run", run_with_warning)
+    result = Runner(
+        "examples/playbooks/become.yml",
+        rules=default_rules_collection,
+        jobs=1,
+    ).run()
+    assert [x.tag for x in result if x.tag == "warning[foo]"] == ["warning[foo]"]
+    assert not list((tmp_path / "results").glob("*/*.json"))
+
+
+def test_get_changed_lintables(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    default_rules_collection: RulesCollection,
+) -> None:
+    """Ensure that files including changed ones are linted with them."""
+    (tmp_path / "tasks").mkdir()
+    (tmp_path / "site.yml").write_text(
+        "- hosts: all\n  tasks:\n    - ansible.builtin.import_tasks: tasks/a.yml\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "other.yml").write_text(
+        "- hosts: all\n  tasks: []\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "tasks" / "a.yml").write_text(
+        "- ansible.builtin.debug:\n    msg: a\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    options = default_rules_collection.options
+    monkeypatch.setattr(options, "changed_since", "HEAD")
+    monkeypatch.setattr(options, "cache_dir", tmp_path / ".cache")
+    monkeypatch.setattr(options, "project_dir", str(tmp_path))
+    monkeypatch.setattr(options, "lintables", [])
+    monkeypatch.setattr(options, "exclude_paths", [".cache"])
+    monkeypatch.setattr(
+        "ansiblelint.runner.get_changed_files",
+        lambda _ref: ["tasks/a.yml"],
+    )
+
+    for _ in range(2):  # the second time, the graph is loaded from the cache
+        lintables = get_changed_lintables(default_rules_collection, options)
+        assert sorted(str(x.path) for x in lintables) == ["site.yml", "tasks/a.yml"]
@@ -16,7 +16,7 @@ import pytest
 
 from ansiblelint.file_utils import Lintable
 from ansiblelint.schemas import __file__ as schema_module
-from ansiblelint.schemas.__main__ import refresh_schemas
+from ansiblelint.schemas.__main__ import _validator_cache, refresh_schemas
 from ansiblelint.schemas.main import validate_file_schema
 
 schema_path = Path(schema_module).parent
@@ -77,6 +77,15 @@ def test_validate_file_schema() -> None:
     assert "Unable to find JSON Schema" in result[0]
 
 
+def test_validator_cache() -> None:
+    """Test that validators are compiled once per kind."""
+    lintable = Lintable("examples/playbooks/become.yml", kind="playbook")
+    first = validate_file_schema(lintable)
+    validator = _validator_cache["playbook"]
+    assert validate_file_schema(lintable) == first
+    assert _validator_cache["playbook"] is validator
+
+
 @pytest.mark.skipif(
     not RE_SPDX_SAFE_TOX_ENV_NAME.match(os.environ.get("TOX_ENV_NAME", "")),
     reason="Skipping SPDX license test due to constraints not being used by current job.",
@@ -0,0 +1,58 @@
+"""Tests for syntax check servers."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+
+import pytest
+
+from ansiblelint.syntax_check_server import SyntaxCheckPool, SyntaxCheckServer
+
+
+@pytest.mark.parametrize(
+    "playbook",
+    (
+        pytest.param("examples/playbooks/become.yml", id="pass"),
+        pytest.param("examples/playbooks/syntax-error.yml", id="fail"),
+        pytest.param("examples/playbooks/empty_playbook.yml", id="empty"),
+    ),
+)
+def test_syntax_check_server(playbook: str) -> None:
+    """Check that the server reports the same outcome as ansible-playbook."""
+    env = {**os.environ, "PYTHONWARNINGS": "ignore"}
+    cmd = ["ansible-playbook", "--syntax-check", "-vv", playbook]
+    expected = subprocess.run(
+        cmd,
+        stdin=subprocess.PIPE,
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+    pool = SyntaxCheckPool()
+    try:
+        for _ in range(2):
+            result = pool.run(cmd, env=env)
+            assert pool.enabled
+            assert result.returncode == expected.returncode
+            assert result.stderr == expected.stderr
+    finally:
+        pool.close()
+
+
+def test_syntax_check_server_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that a failing server is replaced by running ansible-playbook."""
+
+    def run(*_args: object) -> None:
+        msg = "Syntax check server exited with 1."
+        raise OSError(msg)
+
+    monkeypatch.setattr(SyntaxCheckServer, "run", run)
+    pool = SyntaxCheckPool()
+    result = pool.run(
+        ["ansible-playbook", "--syntax-check", "examples/playbooks/become.yml"],
+        env=os.environ,
+    )
+    assert not pool.enabled
+    assert result.returncode == 0
@@ -0,0 +1,39 @@
+"""Tests for the timing of the phases of a run."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING
+
+from ansiblelint import timings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_timings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that phases are recorded only once enabled, then written."""
+    monkeypatch.setattr(timings, "_phases", None)
+    with timings.phase("ignored"):
+        pass
+
+    timings.enable(time.perf_counter())
+    with timings.phase("outer"):
+        with timings.phase("inner") as phase:
+            phase.files = 2
+        timings.add("added", time.perf_counter(), matches=3)
+
+    report = tmp_path / "timings.json"
+    timings.write(report)
+    data = json.loads(report.read_text(encoding="utf-8"))
+    assert data["format"] == timings.TIMINGS_FORMAT
+    assert [x["name"] for x in data["phases"]] == ["inner", "added", "outer"]
+    inner, added, outer = data["phases"]
+    assert inner["files"] == 2
+    assert inner["matches"] is None
+    assert added["matches"] == 3
+    assert outer["duration"] >= inner["duration"]
+    assert outer["peak_rss"] > 0
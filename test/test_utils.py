@@ -281,6 +281,21 @@ def test_template(template: str, output: str) -> None:
     assert result == output
 
 
+def test_ansible_templar_reused() -> None:
+    """Verify that templars are shared per basedir but not their variables."""
+    templar = utils.ansible_templar(Path("/base/dir/tasks"), {"foo": "bar"})
+    assert utils.ansible_templar(Path("/base/dir"), {"foo": "baz"}) is templar
+    assert utils.ansible_templar(Path("/base/other"), {}) is not templar
+    assert (
+        utils.template(
+            basedir=Path("/base/dir"),
+            value="{{ foo }}",
+            variables={"foo": "qux"},
+        )
+        == "qux"
+    )
+
+
 @pytest.mark.parametrize(
     ("template", "has_lookup"),
     (
@@ -567,6 +582,18 @@ def test_task_in_list(file: str, names: list[str], positions: list[str]) -> None
         assert task.position == positions[index]
 
 
+def test_lintable_tasks_are_shared(default_rules_collection: RulesCollection) -> None:
+    """Check that tasks are normalized once per file and released after run."""
+    lintable = Lintable("examples/playbooks/task_in_list-0.yml")
+    tasks = lintable.tasks
+    assert [task.name for task in tasks] == ["A", "B", "C", "D", "E", "F", "G"]
+    assert lintable.tasks is tasks
+
+    default_rules_collection.run(lintable)
+    assert all("__raw_task__" not in task.normalized_task for task in tasks)
+    assert lintable.tasks is not tasks
+
+
 def test_find_children_in_module(default_rules_collection: RulesCollection) -> None:
     """Verify correct function of find_children() in tasks."""
     lintable = Lintable("plugins/modules/fake_module.py")
@@ -701,3 +728,41 @@ def test_get_task_handler_children_climbing(tmp_path: Path) -> None:
         )
 
         assert child.path.resolve() == imported_task.resolve()
+
+
+def test_role_index(tmp_path: Path) -> None:
+    """Verify that the role index keeps the resolution order of role lookups."""
+    project = tmp_path / "project"
+    roles_path = tmp_path / "roles_path"
+    collection_role = (
+        tmp_path
+        / "collections"
+        / "ansible_collections"
+        / "ns"
+        / "col"
+        / "roles"
+        / "qux"
+    )
+    for path in (
+        project / "roles" / "foo" / "tasks",
+        project / "roles" / "bar" / "meta",
+        roles_path / "foo",
+        roles_path / "baz",
+        collection_role,
+    ):
+        path.mkdir(parents=True)
+    tasks_file = project / "roles" / "foo" / "tasks" / "main.yml"
+    tasks_file.write_text("---\n", encoding="utf-8")
+
+    index = utils.RoleIndex([str(roles_path)], [str(tmp_path / "collections")])
+    for _ in range(2):
+        assert index.resolve(str(project), "foo") == str(project / "roles" / "foo")
+        assert index.resolve(str(project), "baz") == str(roles_path / "baz")
+        assert index.resolve(str(project), "ns.col.qux") == str(collection_role)
+        # from roles/bar/meta/main.yml
+        assert index.resolve(str(project / "roles" / "bar" / "meta"), "foo") == str(
+            project / "roles" / "foo",
+        )
+        # unknown roles resolve to the folder referencing them
+        assert index.resolve(str(project), "missing") == str(project)
+    assert index.files(str(project / "roles" / "foo")) == [str(tasks_file)]
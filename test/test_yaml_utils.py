@@ -13,7 +13,7 @@ from yamllint.linter import run as run_yamllint
 
 import ansiblelint.yaml_utils
 from ansiblelint.file_utils import Lintable, cwd
-from ansiblelint.utils import task_in_list
+from ansiblelint.utils import Task, task_in_list
 
 if TYPE_CHECKING:
     from ruamel.yaml.comments import CommentedMap, CommentedSeq
@@ -89,6 +89,49 @@ def test_nested_items_path_raises_typeerror(invalid_data_input: Any) -> None:
         list(ansiblelint.yaml_utils.nested_items_path(invalid_data_input))
 
 
+def test_nested_items_path_task() -> None:
+    """Verify that tasks are walked only once, unless the raw task is exposed."""
+    task = Task({"name": "Some task", "debug": {"msg": "foo"}})
+    items = list(ansiblelint.yaml_utils.nested_items_path(task))
+    assert ("msg", "foo", ["action"]) in items
+    assert task.nested_items_cache == items
+    assert list(ansiblelint.yaml_utils.nested_items_path(task)) == items
+
+    task.normalized_task["__raw_task__"] = task.raw_task
+    raw_items = list(ansiblelint.yaml_utils.nested_items_path(task))
+    assert any(key == "__raw_task__" for key, _, _ in raw_items)
+    assert task.nested_items_cache == items
+
+
+def test_nested_items_path_task_ignored_keys() -> None:
+    """Verify that ignored keys are filtered from the single walk of a task."""
+    task = Task(
+        {
+            "name": "Some block",
+            "block": [{"debug": {"msg": "foo"}}],
+            "when": [{"block": "bar"}],
+        },
+    )
+    ignored_keys = ("block",)
+    expected = list(
+        ansiblelint.yaml_utils.nested_items_path(
+            task.normalized_task,
+            ignored_keys=ignored_keys,
+        ),
+    )
+    assert list(ansiblelint.yaml_utils.nested_items_path(task)) == list(
+        ansiblelint.yaml_utils.nested_items_path(task.normalized_task),
+    )
+    cache = task.nested_items_cache
+    items = list(
+        ansiblelint.yaml_utils.nested_items_path(task, ignored_keys=ignored_keys),
+    )
+    assert items == expected
+    assert ("block", "bar", ["when", 0]) in items
+    assert not any(path and path[0] == "block" for _, _, path in items)
+    assert task.nested_items_cache is cache
+
+
 _input_playbook = [
     {
         "name": "It's a playbook",  # unambiguous; no quotes needed